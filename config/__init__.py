@@ -11,9 +11,15 @@ from .constants import (
     OUTPUT_BASE_DIR,
     MANUAL_HANDLE_DIR,
     SESSION_FILE,
+    CACHE_DIR,
+    PROFILE_DIR,
     CSV_FIELDNAMES,
     DELAY,
     DEFAULT_FILTERS,
+    AREA_NAMES,
+    SEARCH_URL,
+    AREA_CODES,
+    SEARCH_PARAM_CODES,
 )
 
 # 執行設定
@@ -26,6 +32,10 @@ from .settings import (
 from .browser import (
     USER_AGENTS,
     STEALTH_SCRIPT,
+    TRACKER_DOMAINS,
+    CHALLENGE_DOMAINS,
+    BLOCK_PRESETS,
+    BLOCKED_SIZE_ESTIMATE,
 )
 
 __all__ = [
@@ -34,13 +44,23 @@ __all__ = [
     'OUTPUT_BASE_DIR',
     'MANUAL_HANDLE_DIR',
     'SESSION_FILE',
+    'CACHE_DIR',
+    'PROFILE_DIR',
     'CSV_FIELDNAMES',
     'DELAY',
     'DEFAULT_FILTERS',
+    'AREA_NAMES',
+    'SEARCH_URL',
+    'AREA_CODES',
+    'SEARCH_PARAM_CODES',
     # settings
     'LOG_LEVEL',
     'RUN_CONFIG',
     # browser
     'USER_AGENTS',
     'STEALTH_SCRIPT',
+    'TRACKER_DOMAINS',
+    'CHALLENGE_DOMAINS',
+    'BLOCK_PRESETS',
+    'BLOCKED_SIZE_ESTIMATE',
 ]
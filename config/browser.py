@@ -62,3 +62,70 @@ STEALTH_SCRIPT: str = """
         return originalToDataURL.apply(this, arguments);
     };
 """
+
+# ==================================================
+# 資源攔截 (StealthBrowser 的 context.route 規則)
+# ==================================================
+# 廣告 / 追蹤 / 分析服務 (網域後綴比對)
+TRACKER_DOMAINS: list[str] = [
+    'googletagmanager.com',
+    'google-analytics.com',
+    'googleadservices.com',
+    'googlesyndication.com',
+    'doubleclick.net',
+    'adservice.google.com',
+    'connect.facebook.net',
+    'facebook.com',
+    'clarity.ms',
+    'hotjar.com',
+    'criteo.com',
+    'criteo.net',
+    'scorecardresearch.com',
+    'bat.bing.com',
+    'analytics.tiktok.com',
+    'px.ads.linkedin.com',
+]
+
+# 驗證 / 反爬蟲檢查需要的服務 (永遠放行)
+CHALLENGE_DOMAINS: list[str] = [
+    'recaptcha.net',
+    'gstatic.com',
+    'www.google.com',
+    'hcaptcha.com',
+    'challenges.cloudflare.com',
+]
+
+# 攔截預設組合
+#   block_types: 攔截的 resource type (Playwright request.resource_type)
+#   deny_domains / allow_domains: 網域後綴，allow 優先
+BLOCK_PRESETS: dict[str, dict[str, list[str]]] = {
+    # 不攔截
+    "off": {
+        "block_types": [],
+        "deny_domains": [],
+        "allow_domains": [],
+    },
+    # 只留文字 (HTML / script / XHR)，最省頻寬；CSS 也攔截，元素可見性判斷可能與正常頁面不同
+    "text-only": {
+        "block_types": ["image", "media", "font", "stylesheet", "texttrack", "eventsource", "manifest"],
+        "deny_domains": TRACKER_DOMAINS,
+        "allow_domains": [],
+    },
+    # 保留 CSS 與驗證服務需要的資源 (反爬蟲檢查會看版面與 challenge script)
+    "stealth-safe": {
+        "block_types": ["image", "media", "font"],
+        "deny_domains": TRACKER_DOMAINS,
+        "allow_domains": CHALLENGE_DOMAINS,
+    },
+}
+
+# 被攔截資源的估計大小 (bytes，未下載無法得知實際大小，用於估算節省流量)
+BLOCKED_SIZE_ESTIMATE: dict[str, int] = {
+    'image': 30_000,
+    'media': 500_000,
+    'font': 40_000,
+    'stylesheet': 20_000,
+    'script': 60_000,
+    'xhr': 5_000,
+    'fetch': 5_000,
+}
@@ -20,6 +20,8 @@ def _get_app_dir() -> str:
 OUTPUT_BASE_DIR: str = os.path.join(_get_app_dir(), "output")
 MANUAL_HANDLE_DIR: str = os.path.join(OUTPUT_BASE_DIR, "manual_handle")
 SESSION_FILE: str = os.path.join(OUTPUT_BASE_DIR, "session.json")
+CACHE_DIR: str = os.path.join(OUTPUT_BASE_DIR, "cache")
+PROFILE_DIR: str = os.path.join(_get_app_dir(), "profile")  # 持久化瀏覽器 profile
 
 # CSV 欄位順序
 CSV_FIELDNAMES: list[str] = [
@@ -36,8 +38,35 @@ DELAY: dict[str, tuple[float, float]] = {
     "page_load": (2, 3)
 }
 
+# 地區名稱對照表 (area value -> 城市名)
+AREA_NAMES: dict[int, str] = {
+    1: "台北市", 2: "新北市", 3: "宜蘭縣", 4: "基隆市", 5: "桃園市",
+    6: "新竹縣市", 7: "苗栗縣", 8: "台中市", 9: "彰化縣", 10: "南投縣",
+    11: "雲林縣", 12: "嘉義縣市", 13: "台南市", 14: "高雄市", 15: "屏東縣",
+    16: "台東縣", 17: "花蓮縣", 18: "澎湖縣", 19: "金門縣", 20: "連江縣",
+}
+
+# 104 搜尋 URL 參數代碼 (篩選條件 → query string)
+SEARCH_URL: str = f"{BASE_URL}jobs/search/"
+AREA_CODES: dict[int, str] = {
+    1: "6001001000", 2: "6001002000", 3: "6001003000", 4: "6001004000", 5: "6001005000",
+    6: "6001006000", 7: "6001007000", 8: "6001008000", 9: "6001010000", 10: "6001011000",
+    11: "6001012000", 12: "6001013000", 13: "6001014000", 14: "6001016000", 15: "6001018000",
+    16: "6001019000", 17: "6001020000", 18: "6001021000", 19: "6001022000", 20: "6001023000",
+}
+SEARCH_PARAM_CODES: dict[str, dict[str, str]] = {
+    # 經歷 -> jobexp
+    "experience": {"1年以下": "1", "1-3年": "3", "3-5年": "5", "5-10年": "10", "10年以上": "99"},
+    # 工作性質 -> ro
+    "job_type": {"全職": "1", "兼職": "2", "高階": "3", "派遣": "4"},
+    # 更新時間 -> isnew
+    "update_time": {"本日最新": "0", "三日內": "3", "一週內": "7", "兩週內": "14", "一個月內": "30"},
+    # 地點距離 -> remoteWork
+    "remote_work": {"完全遠端": "1", "部分遠端": "2"},
+}
+
 # 搜尋篩選條件
-DEFAULT_FILTERS: dict[str, str | list[str] | list[int]] = {
+DEFAULT_FILTERS: dict[str, str | int | list[str] | list[int]] = {
     # 地區 (area value: 1=台北市, 2=新北市, ...)
     "area_indices": [1, 2],
 
@@ -50,6 +79,9 @@ DEFAULT_FILTERS: dict[str, str | list[str] | list[int]] = {
     # 福利制度
     "benefits": [],
 
+    # 薪資下限 (月薪, 0 = 不篩選)
+    "salary_min": 40000,
+
     # 工作要求
     "experience": ["1年以下", "1-3年"],
     "job_type": "全職",
@@ -19,5 +19,33 @@ RUN_CONFIG: dict[str, int | bool | str | float] = {
     "headless": False,       # True=隱藏瀏覽器, False=顯示
     "human_like": "full",     # "minimal"=最少, "normal"=普通, "full"=完整
     "delay_multiplier": 2.0,  # 延遲倍率 (1.0=正常, 2.0=兩倍慢)
+    "pacing": "fixed",        # 請求節奏: "fixed"=依 human_like 延遲表 / "adaptive"=依驗證、載入時間、錯誤率自動調整速率
+    "rate_min": 6,            # adaptive 的速率下限 (次/分)
+    "rate_max": 30,           # adaptive 的速率上限 (次/分)
+    "host_rate": 0,           # 同一主機的請求上限 (次/分，所有 tab 與分片 process 合計, 0=不限；例如 30)
+    "host_burst": 5,          # 同一主機可連續發出的請求數 (之後依 host_rate 補充)
+    "detail_cache_ttl": 24,   # 詳細頁快取時間 (小時, 0=不快取，每次都重抓)
+    "export_formats": [],     # 儲存時另外匯出的格式 ("json" / "csv" / "parquet"，parquet 需要 pyarrow)；空 = 只寫資料庫，需要時在介面按「匯出」
+    "stream_output": True,    # 每處理完一個職缺就寫入 output/stream/ (中斷也不會遺失)，結束時整理成 jobs_N
+    "stream_fsync_every": 20,  # 串流輸出每幾筆 fsync 一次
+    "detail_fetch": "browser",  # 詳細資料: "browser"=開詳細頁 / "http"=直接打內容 API (共用 session，失敗時改開詳細頁)
+    "detail_concurrency": 1,  # 詳細頁同時抓取數 (1=逐一抓取, >1=開 N 個 worker 並行)
+    "apply_concurrency": 2,   # async engine 同時投遞的職缺數 (點擊應徵開 popup 仍依序進行)
+    "detail_tab_reuse": 50,   # 詳細頁 tab 重複使用次數，用滿後換新 tab (0=每個職缺開新 tab)
+    "detail_tab_max_heap_mb": 200,  # 詳細頁 tab 的 JS heap 超過此值就換新 (MB, 0=不檢查)
+    "listing_mode": "dom",    # "dom"=讀列表頁卡片, "network"=攔截搜尋 API JSON
+    "filter_mode": "url",     # "url"=直接組搜尋網址, "ui"=逐一點選篩選按鈕 (url 無法表達時自動改用 ui)
+    "search_url_cache_ttl": 24,  # UI 點選後的搜尋網址快取時間 (小時, 0=不快取)
+    "prefetch_next_page": False,  # 處理本頁時用第二個 tab 預先載入下一頁
+    "captcha_watcher": True,  # 用頁面事件偵測驗證 (False=每次都在頁面內檢查一次)
+    "checkpoint": True,       # 記錄爬取進度 (中斷後可從同一頁、同一個職缺繼續)
+    "checkpoint_every": 5,    # 每處理幾個職缺寫一次檢查點 (每頁開始時也會寫)
+    "incremental": False,     # 增量爬取: 只處理新的或內容變動的職缺
+    "incremental_stop_pages": 2,  # 增量爬取時連續 K 頁都是已看過的職缺就停止翻頁
+    "shard_mode": "off",      # 多行程分片: "off" / "keyword"=每個關鍵字 / "area"=每個地區 / "pages"=切分頁數
+    "shard_workers": 0,       # 分片同時執行的 process 數 (0=依 CPU 核心數)
+    "browser_profile": False,  # True=使用持久化 profile (保留 HTTP cache / service worker / cookie)
+    "profile_max_mb": 500,    # profile 大小上限 (MB，超過時啟動前清除快取，0=不限)
+    "block_resources": "off",  # 資源攔截: "off" / "text-only"=只留文字 / "stealth-safe"=保留驗證需要的資源
 }
 
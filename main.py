@@ -4,6 +4,7 @@ JobSniper — 104 人力銀行自動化工具
 
 import sys
 import os
+import multiprocessing
 
 # 確保 src/ 在 import path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
@@ -32,7 +33,9 @@ def main() -> None:
         min_size=(600, 400),
     )
     webview.start()
+    api.shutdown()
 
 
 if __name__ == '__main__':
+    multiprocessing.freeze_support()  # 分片爬取的 worker process (打包成 exe 時需要)
     main()
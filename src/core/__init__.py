@@ -5,18 +5,40 @@
 from .auth_manager import AuthManager, auth_manager
 from .stealth_browser import StealthBrowser, stealth_browser
 from .job_searcher import JobSearcher, job_searcher
+from .async_job_searcher import AsyncJobSearcher, async_job_searcher
 from .detail_scraper import DetailScraper, detail_scraper
+from .detail_fetcher import DetailFetcher, detail_fetcher
 from .job_parser import JobParser, job_parser
+from .detail_pool import DetailWorkerPool
+from .tab_pool import DetailTabPool, AsyncDetailTabPool
+from .search_capture import SearchCapture
+from .search_url import SearchUrlBuilder, search_url_builder
+from .shard_runner import ShardRunner, SHARD_MODES
+from .resource_blocker import ResourceBlocker
+from .browser_service import BrowserService
 
 __all__ = [
     # auth
     'AuthManager', 'auth_manager',
     # browser
     'StealthBrowser', 'stealth_browser',
+    'ResourceBlocker',
+    'BrowserService',
     # search
     'JobSearcher', 'job_searcher',
+    'AsyncJobSearcher', 'async_job_searcher',
     # detail
     'DetailScraper', 'detail_scraper',
+    'DetailFetcher', 'detail_fetcher',
     # parser
     'JobParser', 'job_parser',
+    # detail pool
+    'DetailWorkerPool',
+    'DetailTabPool', 'AsyncDetailTabPool',
+    # network capture
+    'SearchCapture',
+    # search url
+    'SearchUrlBuilder', 'search_url_builder',
+    # multi-process shards
+    'ShardRunner', 'SHARD_MODES',
 ]
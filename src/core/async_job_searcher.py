@@ -0,0 +1,301 @@
+"""
+104 搜尋列表頁面邏輯 (async engine)
+
+與 JobSearcher 流程相同，但使用 playwright.async_api：
+同一頁的職缺交給策略的 process_job_async 同時處理，
+延遲與各 tab 的 DOM 讀取會在同一個 event loop 上重疊。
+"""
+
+import asyncio
+from playwright.async_api import async_playwright, Page, Locator
+from .stealth_browser import stealth_browser
+from .resource_blocker import ResourceBlocker
+from .job_parser import JobParser, job_parser
+from .job_searcher import JobSearcher
+from .page_script import run_script_async
+from config import BASE_URL
+from utils import (
+    async_random_delay, async_smart_delay, async_human_like_scroll,
+    async_human_like_mouse_move, async_human_like_pause, async_handle_captcha_if_detected,
+    search_cache_key, get_cached_search_url, save_search_url, invalidate_search_url,
+    rate_governor, host_limiter,
+)
+
+
+class AsyncJobSearcher:
+    """104 職缺搜尋與處理 (async)"""
+
+    def __init__(self) -> None:
+        self.parser: JobParser = job_parser
+
+    async def search(self, keyword: str, pages: int = 1, headless: bool = False, config: dict | None = None, strategy: object | None = None) -> list[dict]:
+        """
+        爬取 104 職缺列表 (async 版 JobSearcher.search)
+
+        Phase 1: 抓取列表頁基本資料
+        Phase 2: 同一頁的職缺用 Strategy 的 async hooks 並行處理
+        """
+        if config is None:
+            from config import RUN_CONFIG
+            config = RUN_CONFIG
+
+        if strategy is None:
+            from strategy import SaveStrategy
+            strategy = SaveStrategy()
+        if not getattr(strategy, 'supports_async', False):
+            raise ValueError(f"{strategy.name} 不支援 async engine")
+
+        print(f"\n使用策略: {strategy.name} (async engine)")
+        print(f"說明: {strategy.description}")
+        rate_governor.configure(config)
+        host_limiter.configure(config)
+
+        async with async_playwright() as p:
+            blocker = ResourceBlocker.from_config(config)
+            browser, browser_ctx = await stealth_browser.setup_async(p, headless=headless, blocker=blocker)
+            page = await browser_ctx.new_page()
+
+            from strategy import StrategyContext
+            ctx = StrategyContext(strategy, config, browser_context=browser_ctx, page=page)
+
+            if not await self._open_search(page, keyword, config):
+                await browser.close()
+                return []
+
+            print(f"\n{'='*60}")
+            print(f"開始: {strategy.name}")
+            print(f"{'='*60}")
+
+            jobs = []
+            page_num = 1
+
+            await ctx.before_process_async(jobs)
+            max_pages = pages if pages > 0 else 999
+
+            while page_num <= max_pages:
+                print(f"\n[Page {page_num}] 正在抓取列表...")
+
+                if hasattr(ctx.strategy, 'set_page'):
+                    ctx.strategy.set_page(page_num)
+
+                if not await async_handle_captcha_if_detected(page, f"第 {page_num} 頁"):
+                    break
+
+                await async_human_like_scroll(page)
+                if ctx.human_like in ['normal', 'full']:
+                    await async_human_like_mouse_move(page)
+                    await async_smart_delay(ctx.human_like, ctx.delay_multiplier, 'normal')
+
+                cards_locator = page.locator(JobSearcher.CARD_SELECTOR)
+                job_cards = await cards_locator.all()
+                print(f"[Page {page_num}] 找到 {len(job_cards)} 個職缺卡片")
+                parsed_jobs = await self._extract_cards(cards_locator, job_cards)
+
+                tasks = []
+                for i, card in enumerate(job_cards):
+                    job = parsed_jobs[i]
+                    if not job:
+                        continue
+
+                    print(f"  [Page {page_num}][{i+1}] {job.get('title', '')[:30]}  |  {job.get('company', '')}")
+
+                    job_index = len(jobs)
+                    jobs.append(job)
+                    tasks.append(self._process_job(ctx, job, {**job, 'job_index': job_index, 'card': card}))
+
+                await asyncio.gather(*tasks)
+
+                print(f"[Page {page_num}] 處理完成: {len(job_cards)} 個職缺")
+
+                if hasattr(ctx.strategy, 'export_page_manual_jobs'):
+                    ctx.strategy.export_page_manual_jobs(page_num)
+
+                if len(job_cards) == 0:
+                    print(f"\n[Page {page_num}] 沒有找到任何職缺卡片，結束搜尋")
+                    break
+
+                if not await async_handle_captcha_if_detected(page, f"第 {page_num} 頁處理後"):
+                    break
+
+                if page_num < max_pages:
+                    if ctx.human_like == 'full':
+                        await async_human_like_pause(page)
+
+                    has_next = await self._goto_next_page(page, page_num + 1)
+                    if not has_next:
+                        print(f"\n[Page {page_num}] 已到達最後一頁，結束搜尋")
+                        break
+
+                    page_num += 1
+                else:
+                    print(f"\n[Page {page_num}] 已達到設定頁數上限，結束搜尋")
+                    break
+
+            print(f"\n{'='*60}")
+            print(f"完成! 共處理 {len(jobs)} 個職缺")
+            if rate_governor.enabled:
+                print(f"速率: {rate_governor.summary()}")
+            if host_limiter.enabled:
+                print(f"主機限流: {host_limiter.summary()}")
+            print(f"{'='*60}")
+
+            await ctx.after_process_async(jobs)
+            if blocker is not None:
+                blocker.print_summary()
+            await browser.close()
+
+        return jobs
+
+    # ── Private ──
+
+    async def _extract_cards(self, cards_locator: Locator, job_cards: list[Locator]) -> list[dict | None]:
+        """一次取出整頁卡片資料；數量對不上時退回逐張讀取"""
+        try:
+            parsed_jobs = await self.parser.extract_all_async(cards_locator)
+            if len(parsed_jobs) == len(job_cards):
+                return parsed_jobs
+            print(f"  ⚠ 卡片數量變動 ({len(job_cards)} → {len(parsed_jobs)})，改為逐張讀取")
+        except Exception as e:
+            print(f"  ⚠ 批次讀取卡片失敗，改為逐張讀取: {e}")
+
+        parsed_jobs = []
+        for i, card in enumerate(job_cards):
+            try:
+                parsed_jobs.append(await self.parser.extract_from_card_async(card))
+            except Exception as e:
+                print(f"  [{i+1}] 錯誤: {e}")
+                parsed_jobs.append(None)
+        return parsed_jobs
+
+    async def _process_job(self, ctx, job: dict, job_info: dict) -> None:
+        """交給策略處理，並把策略寫入的欄位同步回 jobs 中的原始 dict"""
+        try:
+            await ctx.process_job_async(job_info)
+            job.update({k: v for k, v in job_info.items() if k not in ('card', 'job_index')})
+        except Exception as e:
+            print(f"  [{job.get('title', '')[:30]}] 錯誤: {e}")
+
+    async def _open_search(self, page: Page, keyword: str, config: dict) -> bool:
+        """
+        開啟搜尋結果頁：能編譯成 URL 就直接前往，否則走首頁 + UI 點選篩選
+
+        Returns:
+            False = 遇到驗證且等待逾時
+        """
+        search_url = JobSearcher.compile_search_url(keyword, config)
+        if search_url:
+            print(f"\n直接前往搜尋結果: {search_url}")
+            await host_limiter.async_acquire(search_url)
+            with rate_governor.track():
+                await page.goto(search_url, wait_until='domcontentloaded')
+            await async_random_delay(2, 3)
+
+            if not await async_handle_captcha_if_detected(page, "前往搜尋結果"):
+                return False
+
+            await self._close_popups(page)
+            return True
+
+        # UI 點選的結果也是固定的搜尋 URL，先查快取
+        ttl = float(config.get('search_url_cache_ttl', 24) or 0)
+        cache_key = search_cache_key(keyword, JobSearcher.resolve_filters(config))
+        cached_url = get_cached_search_url(cache_key, ttl) if ttl > 0 else None
+        if cached_url:
+            print(f"\n使用快取的搜尋網址: {cached_url}")
+            await host_limiter.async_acquire(cached_url)
+            with rate_governor.track():
+                await page.goto(cached_url, wait_until='domcontentloaded')
+            await async_random_delay(2, 3)
+
+            if not await async_handle_captcha_if_detected(page, "前往搜尋結果"):
+                return False
+
+            await self._close_popups(page)
+            if await self._has_results(page):
+                return True
+
+            print("快取的搜尋網址沒有職缺，清除快取並重新套用篩選")
+            invalidate_search_url(cache_key)
+
+        print("\n正在前往 104 首頁...")
+        await host_limiter.async_acquire(BASE_URL)
+        with rate_governor.track():
+            await page.goto(BASE_URL, wait_until='domcontentloaded')
+        await async_random_delay(2, 3)
+
+        if not await async_handle_captcha_if_detected(page, "進入首頁"):
+            return False
+
+        await self._close_popups(page)
+        await self._search_keyword(page, keyword)
+        await self._apply_filters(page, config)
+
+        if not await async_handle_captcha_if_detected(page, "套用篩選"):
+            return False
+
+        if ttl > 0 and await self._has_results(page):
+            save_search_url(cache_key, page.url, keyword)
+        return True
+
+    async def _has_results(self, page: Page) -> bool:
+        """搜尋結果頁是否有職缺卡片 (等待列表渲染)"""
+        try:
+            await page.locator(JobSearcher.CARD_SELECTOR).first.wait_for(timeout=10000)
+            return True
+        except Exception:
+            return False
+
+    async def _close_popups(self, page: Page) -> None:
+        """關閉各種彈窗"""
+        for name, label in (("Cancel", "Cancel"), ("下次再說", "'下次再說'")):
+            try:
+                btn = page.get_by_role("button", name=name)
+                if await btn.is_visible(timeout=2000):
+                    await btn.click()
+                    print(f"已關閉 {label} 彈窗")
+                    await async_random_delay(0.5, 1)
+            except:
+                pass
+
+    async def _search_keyword(self, page: Page, keyword: str) -> None:
+        """輸入搜尋關鍵字 (只輸入，不點搜尋)"""
+        print(f"輸入關鍵字: {keyword}")
+        search_box = page.get_by_role("textbox", name="關鍵字(例：工作職稱、公司名、技能專長...)")
+        await search_box.click()
+        await async_random_delay(0.3, 0.5)
+        await search_box.fill(keyword)
+        await async_random_delay(0.5, 1)
+
+        await self._close_popups(page)
+
+    async def _apply_filters(self, page: Page, config: dict | None = None) -> None:
+        """套用篩選條件 (與 JobSearcher 共用同一份流程)"""
+        await run_script_async(JobSearcher.filter_script(page, JobSearcher.resolve_filters(config)))
+
+    async def _goto_next_page(self, page: Page, next_page_num: int) -> bool:
+        """前往下一頁，回傳是否成功"""
+        try:
+            page_btn = page.get_by_role("link", name=str(next_page_num), exact=True).first
+            if await page_btn.is_visible():
+                await page_btn.scroll_into_view_if_needed()
+                await async_random_delay(0.5, 1)
+                await host_limiter.async_acquire(page.url)
+                with rate_governor.track():
+                    await page_btn.click()
+                    await page.wait_for_load_state('domcontentloaded')
+                await async_random_delay(2, 3)
+
+                if not await async_handle_captcha_if_detected(page, f"翻到第 {next_page_num} 頁"):
+                    return False
+
+                print(f"[Page {next_page_num}] 成功前往第 {next_page_num} 頁")
+                return True
+            else:
+                return False
+        except Exception as e:
+            print(f"翻頁失敗: {e}")
+            return False
+
+
+# 全域實例
+async_job_searcher = AsyncJobSearcher()
@@ -3,7 +3,7 @@
 """
 
 import os
-from playwright.sync_api import sync_playwright
+from playwright.sync_api import sync_playwright, Browser
 from config import BASE_URL, SESSION_FILE
 
 
@@ -21,12 +21,13 @@ class AuthManager:
         """取得 session 檔案路徑 (如果檔案存在)"""
         return self.session_file if self.has_session_file() else None
 
-    def is_logged_in(self, verbose: bool = False) -> bool:
+    def is_logged_in(self, verbose: bool = False, browser: Browser | None = None) -> bool:
         """
         真正檢查 session 是否有效 (會開瀏覽器驗證)
 
         Args:
             verbose: 是否顯示檢查過程
+            browser: 已啟動的瀏覽器 (只開一個暫時的 context)；None = 自行啟動隱藏瀏覽器
         """
         if not self.has_session_file():
             return False
@@ -35,30 +36,38 @@ class AuthManager:
             print("正在驗證登入狀態...")
 
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                context = browser.new_context(storage_state=self.session_file)
-                page = context.new_page()
+            if browser is not None:
+                is_valid = self._check_session(browser)
+            else:
+                with sync_playwright() as p:
+                    own_browser = p.chromium.launch(headless=True)
+                    try:
+                        is_valid = self._check_session(own_browser)
+                    finally:
+                        own_browser.close()
 
-                page.goto("https://pda.104.com.tw/member", wait_until='domcontentloaded', timeout=10000)
-
-                current_url = page.url
-                is_valid = "login" not in current_url.lower()
-
-                browser.close()
-
-                if verbose:
-                    if is_valid:
-                        print("Session 有效")
-                    else:
-                        print("Session 已過期")
+            if verbose:
+                if is_valid:
+                    print("Session 有效")
+                else:
+                    print("Session 已過期")
 
-                return is_valid
+            return is_valid
         except Exception as e:
             if verbose:
                 print(f"驗證失敗: {e}")
             return False
 
+    def _check_session(self, browser: Browser) -> bool:
+        """用 session 開會員頁，沒有被導回登入頁就是有效"""
+        context = browser.new_context(storage_state=self.session_file)
+        try:
+            page = context.new_page()
+            page.goto("https://pda.104.com.tw/member", wait_until='domcontentloaded', timeout=10000)
+            return "login" not in page.url.lower()
+        finally:
+            context.close()
+
     def login_and_save(self) -> bool:
         """開啟瀏覽器讓使用者手動登入，登入後儲存 session"""
         print("\n=== 登入模式 ===")
@@ -0,0 +1,170 @@
+"""
+常駐瀏覽器 — GUI 多次執行之間保持一個已啟動的 Chromium
+"""
+
+import os
+import time
+import logging
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from playwright.sync_api import sync_playwright, Playwright, Browser, BrowserContext
+from .auth_manager import AuthManager, auth_manager
+from .stealth_browser import StealthBrowser, stealth_browser
+from .resource_blocker import ResourceBlocker
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserService:
+    """
+    常駐的 Playwright + Chromium，並預先建立一個載入 session 的 context
+
+    Playwright sync API 綁定建立它的 thread，所以所有瀏覽器操作都透過 call()
+    排到 service 專屬的單一 thread 執行。瀏覽器只在 crash (is_connected() 為 False)
+    或啟動參數 (headless) 改變時重開；session 檔案更新時丟掉預建的 context。
+    """
+
+    def __init__(self, stealth: StealthBrowser = stealth_browser, auth: AuthManager = auth_manager) -> None:
+        self.stealth: StealthBrowser = stealth
+        self.auth: AuthManager = auth
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='browser-service')
+        self._playwright: Playwright | None = None
+        self._browser: Browser | None = None
+        self._headless: bool | None = None
+        self._spare: BrowserContext | None = None
+        self._spare_session: tuple[bool, float] | None = None  # 建立 spare 時的 session 狀態
+
+    def call(self, fn: Callable, *args, **kwargs):
+        """在 service thread 執行 fn 並等待結果 (例外會原樣拋出)"""
+        return self._executor.submit(fn, *args, **kwargs).result()
+
+    def warm_up(self, headless: bool) -> Future:
+        """背景啟動瀏覽器並預建 context (不等待)"""
+        return self._executor.submit(self._warm_up, headless)
+
+    def browser(self, headless: bool | None = None) -> Browser:
+        """
+        取得常駐瀏覽器 (service thread 內呼叫)
+
+        Args:
+            headless: 需要的模式；與目前不同時重開。None = 沿用目前的 (沒有時用 headless)
+        """
+        if headless is None:
+            headless = True if self._headless is None else self._headless
+
+        if self._browser is not None and self._headless != headless:
+            print(f"[BrowserService] 瀏覽器模式改變，重新啟動")
+            self._close_browser()
+        elif self._browser is not None and not self._browser.is_connected():
+            print(f"[BrowserService] 瀏覽器已中斷，重新啟動")
+            self._close_browser()
+
+        if self._browser is None:
+            started = time.time()
+            try:
+                if self._playwright is None:
+                    self._playwright = sync_playwright().start()
+                self._browser = self.stealth.launch(self._playwright, headless)
+            except Exception:
+                # driver 本身異常時連同 Playwright 一起重開
+                self._stop_playwright()
+                self._playwright = sync_playwright().start()
+                self._browser = self.stealth.launch(self._playwright, headless)
+            self._headless = headless
+            print(f"[BrowserService] 瀏覽器已啟動 ({time.time() - started:.1f}s)")
+
+        return self._browser
+
+    def acquire(self, headless: bool, blocker: ResourceBlocker | None = None) -> BrowserContext:
+        """
+        借用一個 stealth context (service thread 內呼叫，用完交給 release)
+
+        有預建且 session 未變的 context 就直接用，否則現場建立。
+        """
+        browser = self.browser(headless)
+
+        context = self._spare
+        self._spare = None
+        if context is not None and self._spare_session != self._session_state():
+            self._close_context(context)
+            context = None
+
+        if context is None:
+            context = self.stealth.new_context(browser)
+        else:
+            print(f"[BrowserService] 使用預熱的瀏覽器")
+
+        if blocker is not None:
+            blocker.attach(context)
+        return context
+
+    def release(self, context: BrowserContext) -> None:
+        """歸還 context：關閉並預建下一次要用的"""
+        self._close_context(context)
+        try:
+            self._prepare_spare()
+        except Exception as e:
+            logger.debug(f"預建 context 失敗: {e}")
+
+    def check_login(self) -> bool:
+        """用常駐瀏覽器驗證 session (service thread 內呼叫)"""
+        return self.auth.is_logged_in(verbose=True, browser=self.browser())
+
+    def shutdown(self) -> None:
+        """關閉瀏覽器與 service thread"""
+        try:
+            self._executor.submit(self._shutdown).result(timeout=10)
+        except Exception as e:
+            logger.debug(f"關閉常駐瀏覽器失敗: {e}")
+        self._executor.shutdown(wait=False)
+
+    # ── Private ──
+
+    def _warm_up(self, headless: bool) -> None:
+        try:
+            self.browser(headless)
+            self._prepare_spare()
+        except Exception as e:
+            print(f"[BrowserService] 預熱失敗: {e}")
+
+    def _prepare_spare(self) -> None:
+        """預建一個載入 session 的 context"""
+        if self._spare is not None or self._browser is None or not self._browser.is_connected():
+            return
+        self._spare_session = self._session_state()
+        self._spare = self.stealth.new_context(self._browser)
+
+    def _session_state(self) -> tuple[bool, float]:
+        """session 檔案是否存在 + 修改時間 (登入 / 登出後會改變)"""
+        path = self.auth.session_file
+        return (os.path.exists(path), os.path.getmtime(path) if os.path.exists(path) else 0.0)
+
+    def _close_context(self, context: BrowserContext) -> None:
+        try:
+            context.close()
+        except Exception as e:
+            logger.debug(f"關閉 context 失敗: {e}")
+
+    def _close_browser(self) -> None:
+        if self._spare is not None:
+            self._close_context(self._spare)
+            self._spare = None
+        if self._browser is not None:
+            try:
+                self._browser.close()
+            except Exception as e:
+                logger.debug(f"關閉瀏覽器失敗: {e}")
+            self._browser = None
+            self._headless = None
+
+    def _stop_playwright(self) -> None:
+        if self._playwright is not None:
+            try:
+                self._playwright.stop()
+            except Exception as e:
+                logger.debug(f"關閉 Playwright 失敗: {e}")
+            self._playwright = None
+
+    def _shutdown(self) -> None:
+        self._close_browser()
+        self._stop_playwright()
@@ -0,0 +1,179 @@
+"""
+詳細頁 HTTP 抓取 — 用 context 的 APIRequestContext (共用 session cookie) 直接取職缺內容，不渲染頁面
+"""
+
+import re
+import json
+import html
+import logging
+from playwright.sync_api import BrowserContext
+from playwright.async_api import BrowserContext as AsyncBrowserContext
+from config import BASE_URL
+from utils import job_id_from_url, host_limiter
+
+logger = logging.getLogger(__name__)
+
+
+class DetailFetcher:
+    """
+    詳細資料的輕量抓取
+
+    先打職缺內容 API (/job/ajax/content/{id}，需要 Referer)，失敗時抓職缺頁 HTML
+    解析 JSON-LD (JobPosting)。兩者都失敗回傳 None，由呼叫端改用瀏覽器開詳細頁。
+    回傳欄位與 DetailScraper.scrape 相同。
+    """
+
+    CONTENT_PATH: str = "job/ajax/content/{job_id}"
+    JOB_PATH: str = "job/{job_id}"
+    TIMEOUT_MS: int = 15000
+
+    _RE_JSON_LD: re.Pattern[str] = re.compile(r'<script[^>]+type="application/ld\+json"[^>]*>(.*?)</script>', re.S | re.I)
+    _RE_BREAK: re.Pattern[str] = re.compile(r'<br\s*/?>|</p>|</li>', re.I)
+    _RE_TAG: re.Pattern[str] = re.compile(r'<[^>]+>')
+
+    def __init__(self, base_url: str = BASE_URL) -> None:
+        """
+        Args:
+            base_url: 104 網址 (可指向本機的替身 server 離線測試)
+        """
+        self.base_url: str = base_url.rstrip('/') + '/'
+
+    def fetch(self, browser_context: BrowserContext, url: str) -> dict[str, str] | None:
+        """抓取單一職缺的詳細資料，失敗回傳 None"""
+        job_id = job_id_from_url(url or '')
+        if not job_id:
+            return None
+        request = browser_context.request
+
+        try:
+            request_url = self._content_url(job_id)
+            host_limiter.acquire(request_url)
+            response = request.get(request_url, headers=self._headers(job_id), timeout=self.TIMEOUT_MS)
+            if response.ok:
+                detail = self.parse_content(response.json())
+                if detail:
+                    return detail
+            logger.debug(f"內容 API 失敗 ({job_id}): HTTP {response.status}")
+        except Exception as e:
+            logger.debug(f"內容 API 失敗 ({job_id}): {e}")
+
+        try:
+            request_url = self._job_url(job_id)
+            host_limiter.acquire(request_url)
+            response = request.get(request_url, timeout=self.TIMEOUT_MS)
+            if response.ok:
+                return self.parse_html(response.text())
+            logger.debug(f"職缺頁 HTML 失敗 ({job_id}): HTTP {response.status}")
+        except Exception as e:
+            logger.debug(f"職缺頁 HTML 失敗 ({job_id}): {e}")
+        return None
+
+    async def fetch_async(self, browser_context: AsyncBrowserContext, url: str) -> dict[str, str] | None:
+        """fetch 的 async 版本"""
+        job_id = job_id_from_url(url or '')
+        if not job_id:
+            return None
+        request = browser_context.request
+
+        try:
+            request_url = self._content_url(job_id)
+            await host_limiter.async_acquire(request_url)
+            response = await request.get(request_url, headers=self._headers(job_id), timeout=self.TIMEOUT_MS)
+            if response.ok:
+                detail = self.parse_content(await response.json())
+                if detail:
+                    return detail
+            logger.debug(f"內容 API 失敗 ({job_id}): HTTP {response.status}")
+        except Exception as e:
+            logger.debug(f"內容 API 失敗 ({job_id}): {e}")
+
+        try:
+            request_url = self._job_url(job_id)
+            await host_limiter.async_acquire(request_url)
+            response = await request.get(request_url, timeout=self.TIMEOUT_MS)
+            if response.ok:
+                return self.parse_html(await response.text())
+            logger.debug(f"職缺頁 HTML 失敗 ({job_id}): HTTP {response.status}")
+        except Exception as e:
+            logger.debug(f"職缺頁 HTML 失敗 ({job_id}): {e}")
+        return None
+
+    def parse_content(self, payload: dict) -> dict[str, str] | None:
+        """
+        解析內容 API 的 JSON
+
+        Returns:
+            detail dict；沒有工作內容 (格式不符) 時回傳 None
+        """
+        data = (payload or {}).get('data') or {}
+        job_detail = data.get('jobDetail') or {}
+        description = self._clean(job_detail.get('jobDescription'))
+        if not description:
+            return None
+
+        welfare = data.get('welfare') or {}
+        photos = (data.get('environmentPic') or {}).get('environmentPic') or []
+        address = ''.join(self._clean(job_detail.get(k)) for k in ('addressRegion', 'addressDetail'))
+
+        return {
+            'detailed_job_description': description,
+            'detailed_address': address,
+            'detailed_work_hours': self._clean(job_detail.get('workPeriod')),
+            'detailed_company_benefits': self._clean(welfare.get('welfare')),
+            'detailed_company_photos': f"公司環境照片({len(photos)})" if photos else '',
+        }
+
+    def parse_html(self, page_html: str) -> dict[str, str] | None:
+        """
+        從職缺頁 HTML 的 JSON-LD (JobPosting) 取出資料 (只有工作內容與地址)
+
+        Returns:
+            detail dict；找不到 JobPosting 時回傳 None
+        """
+        for block in self._RE_JSON_LD.findall(page_html or ''):
+            try:
+                data = json.loads(block)
+            except ValueError:
+                continue
+            for item in data if isinstance(data, list) else [data]:
+                if not isinstance(item, dict) or item.get('@type') != 'JobPosting':
+                    continue
+                description = self._clean(item.get('description'))
+                if not description:
+                    continue
+                location = item.get('jobLocation') or {}
+                if isinstance(location, list):
+                    location = location[0] if location else {}
+                address = location.get('address') or {}
+                return {
+                    'detailed_job_description': description,
+                    'detailed_address': ''.join(self._clean(address.get(k)) for k in ('addressRegion', 'addressLocality', 'streetAddress')),
+                    'detailed_work_hours': '',
+                    'detailed_company_benefits': '',
+                    'detailed_company_photos': '',
+                }
+        return None
+
+    # ── Private ──
+
+    def _content_url(self, job_id: str) -> str:
+        return self.base_url + self.CONTENT_PATH.format(job_id=job_id)
+
+    def _job_url(self, job_id: str) -> str:
+        return self.base_url + self.JOB_PATH.format(job_id=job_id)
+
+    def _headers(self, job_id: str) -> dict[str, str]:
+        # 內容 API 沒有 Referer 會回 403
+        return {'Referer': self._job_url(job_id), 'Accept': 'application/json, text/plain, */*'}
+
+    def _clean(self, value: object) -> str:
+        """API / JSON-LD 的文字：去掉 HTML 標籤與多餘空白"""
+        if not value:
+            return ''
+        text = html.unescape(self._RE_TAG.sub('', self._RE_BREAK.sub('\n', str(value))))
+        lines = [line.strip() for line in text.replace('\r', '').split('\n')]
+        return '\n'.join(line for line in lines if line).strip()
+
+
+# 全域實例
+detail_fetcher = DetailFetcher()
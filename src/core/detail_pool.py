@@ -0,0 +1,178 @@
+"""
+詳細頁面並行抓取 (worker pool)
+"""
+
+import queue
+import logging
+import threading
+from collections.abc import Callable
+from playwright.sync_api import sync_playwright
+from utils import smart_delay, handle_captcha_if_detected, rate_governor, host_limiter
+from .stealth_browser import stealth_browser
+from .detail_scraper import detail_scraper
+from .resource_blocker import ResourceBlocker
+from .tab_pool import DetailTabPool
+
+logger = logging.getLogger(__name__)
+
+
+class DetailWorkerPool:
+    """
+    固定數量的詳細頁 worker，與列表頁迴圈同時執行
+
+    Playwright sync API 不能跨 thread 共用，所以每個 worker thread
+    各自開一個 sync_playwright + stealth 瀏覽器，從 queue 取 (job_index, url) 處理。
+    結果以 job_index 為 key 收集，最後由呼叫端合併回 jobs。
+    """
+
+    def __init__(self, concurrency: int, headless: bool = True, human_like: str = 'normal', delay_multiplier: float = 1.0, block_resources: str = 'off', on_result: Callable[[int, dict[str, str] | None], None] | None = None, tab_reuse: int = 0, tab_max_heap_mb: float = 0) -> None:
+        """
+        Args:
+            tab_reuse: 每個 worker 的詳細頁 tab 重複使用次數 (0 = 每個職缺開新 tab)
+            tab_max_heap_mb: tab 的 JS heap 超過此值時換新 (0 = 不檢查)
+        """
+        self.concurrency: int = max(1, concurrency)
+        self.tab_reuse: int = tab_reuse
+        self.tab_max_heap_mb: float = tab_max_heap_mb
+        self.on_result: Callable[[int, dict[str, str] | None], None] | None = on_result  # 每完成一筆就呼叫 (worker thread)
+        self.block_resources: str = block_resources
+        self.headless: bool = headless
+        self.human_like: str = human_like
+        self.delay_multiplier: float = delay_multiplier
+        self._queue: queue.Queue[tuple[int, str] | None] = queue.Queue()
+        self._results: dict[int, dict[str, str] | None] = {}
+        self._submitted: set[int] = set()
+        self._alive: int = 0
+        self._lock: threading.Lock = threading.Lock()
+        self._threads: list[threading.Thread] = []
+
+    def start(self) -> None:
+        """啟動所有 worker"""
+        self._alive = self.concurrency
+        for worker_id in range(1, self.concurrency + 1):
+            thread = threading.Thread(
+                target=self._worker,
+                args=(worker_id,),
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+        print(f"[DetailPool] 已啟動 {self.concurrency} 個詳細頁 worker")
+
+    def submit(self, job_index: int, url: str) -> None:
+        """排入一個待抓取的職缺 (worker 都已異常結束時直接記為失敗)"""
+        with self._lock:
+            self._submitted.add(job_index)
+            alive = self._alive
+        if alive == 0:
+            self._store(job_index, None)
+            return
+        self._queue.put((job_index, url))
+
+    def pending(self) -> int:
+        """尚未處理的數量"""
+        return self._queue.qsize()
+
+    def join(self) -> dict[int, dict[str, str] | None]:
+        """
+        等待所有 worker 完成並關閉
+
+        Returns:
+            {job_index: detail}，抓取失敗的為 None
+        """
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads.clear()
+
+        # worker 全部異常結束後才排入的職缺沒有人處理，補上失敗結果
+        with self._lock:
+            missing = sorted(self._submitted - self._results.keys())
+        for job_index in missing:
+            self._store(job_index, None)
+
+        with self._lock:
+            return dict(self._results)
+
+    # ── Private ──
+
+    def _worker(self, worker_id: int) -> None:
+        """單一 worker：自己的瀏覽器，逐一處理 queue 中的職缺"""
+        try:
+            with sync_playwright() as p:
+                blocker = ResourceBlocker(self.block_resources) if self.block_resources != 'off' else None
+                browser, browser_ctx = stealth_browser.setup(p, headless=self.headless, blocker=blocker)
+                tabs = DetailTabPool(browser_ctx, self.tab_reuse, self.tab_max_heap_mb) if self.tab_reuse > 0 else None
+                try:
+                    while True:
+                        item = self._queue.get()
+                        if item is None:
+                            break
+                        job_index, url = item
+                        self._store(job_index, self._scrape(browser_ctx, worker_id, job_index, url, tabs))
+                finally:
+                    if tabs is not None:
+                        tabs.close()
+                        logger.debug(f"[DetailPool][W{worker_id}] {tabs.summary()}")
+                    if blocker is not None:
+                        print(f"[DetailPool][W{worker_id}] 攔截統計")
+                        blocker.print_summary()
+                    browser.close()
+        except Exception as e:
+            print(f"[DetailPool][W{worker_id}] worker 異常結束: {e}")
+            with self._lock:
+                self._alive -= 1
+                alive = self._alive
+            if alive > 0:
+                # 其他 worker 還在，剩下的工作交給它們
+                return
+            # 最後一個 worker 也結束了：把剩下的工作標記為失敗，避免 join() 之後遺漏
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    break
+                self._store(item[0], None)
+
+    def _scrape(self, browser_ctx, worker_id: int, job_index: int, url: str, tabs: DetailTabPool | None = None) -> dict[str, str] | None:
+        """抓取單一詳細頁 (有 tabs 時借用長駐的 tab)"""
+        try:
+            if tabs is not None:
+                with tabs.tab() as detail_page:
+                    detail = self._scrape_page(detail_page, url)
+            else:
+                detail_page = browser_ctx.new_page()
+                try:
+                    detail = self._scrape_page(detail_page, url)
+                finally:
+                    detail_page.close()
+            if detail is None:
+                print(f"  [DetailPool][W{worker_id}] ✗ 職缺 #{job_index + 1}: 驗證逾時")
+                return None
+            print(f"  [DetailPool][W{worker_id}] ✓ 職缺 #{job_index + 1}")
+            return detail
+        except Exception as e:
+            print(f"  [DetailPool][W{worker_id}] ✗ 職缺 #{job_index + 1}: {e}")
+            return None
+
+    def _scrape_page(self, detail_page, url: str) -> dict[str, str] | None:
+        """導向詳細頁並抓取，遇到驗證且等待逾時回傳 None"""
+        host_limiter.acquire(url)
+        with rate_governor.track():
+            detail_page.goto(url, wait_until='domcontentloaded')
+        if not handle_captcha_if_detected(detail_page, "詳細頁 worker"):
+            return None
+        smart_delay(self.human_like, self.delay_multiplier, 'normal')
+        return detail_scraper.scrape(detail_page)
+
+    def _store(self, job_index: int, detail: dict[str, str] | None) -> None:
+        with self._lock:
+            self._results[job_index] = detail
+        if self.on_result is not None:
+            try:
+                self.on_result(job_index, detail)
+            except Exception as e:
+                logger.debug(f"on_result 失敗 (#{job_index}): {e}")
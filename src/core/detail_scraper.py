@@ -2,10 +2,10 @@
 詳細頁面抓取
 """
 
-import re
 import logging
 from playwright.sync_api import Page
-from utils import human_like_scroll, random_delay
+from playwright.async_api import Page as AsyncPage
+from utils import human_like_scroll, random_delay, async_human_like_scroll, async_random_delay
 from .job_parser import job_parser
 
 logger = logging.getLogger(__name__)
@@ -20,6 +20,7 @@ class DetailScraper:
         ('detailed_work_hours', '上班時段'),
         ('detailed_company_benefits', '福利制度'),
     ]
+    PHOTOS_HEADING: str = '公司環境照片'  # 結構不同，取 heading 本身的文字
 
     def scrape(self, detail_page: Page) -> dict[str, str]:
         """從詳細頁面抓取資訊"""
@@ -33,22 +34,9 @@ class DetailScraper:
             random_delay(1, 2)
             logger.debug("scroll 完成")
 
-            for key, heading in self.FIELDS:
-                logger.debug(f"抓取{heading}")
-                detail[key] = job_parser.get_section_content(detail_page, heading)
-                logger.debug(f"{heading}: {detail[key][:50] if detail[key] else '(空)'}")
-
-            # 公司環境照片（結構不同，單獨處理）
-            logger.debug("抓取公司環境照片")
-            try:
-                photos = detail_page.get_by_role("heading", name=re.compile(r"公司環境照片")).first
-                if photos.count() > 0:
-                    detail['detailed_company_photos'] = photos.inner_text().strip()
-                    logger.debug(f"公司環境照片: {detail['detailed_company_photos']}")
-                else:
-                    logger.debug("公司環境照片: (找不到)")
-            except Exception as e:
-                logger.debug(f"公司環境照片抓取失敗: {e}")
+            # 所有區塊 + 公司環境照片一次 evaluate 取出
+            sections, photos = job_parser.extract_sections(detail_page, [heading for _, heading in self.FIELDS], self.PHOTOS_HEADING)
+            self._fill(detail, sections, photos)
 
         except Exception as e:
             logger.error(f"抓取詳細資訊時發生錯誤: {e}")
@@ -56,6 +44,33 @@ class DetailScraper:
         logger.debug("詳細頁面抓取完成")
         return detail
 
+    async def scrape_async(self, detail_page: AsyncPage) -> dict[str, str]:
+        """scrape() 的 async 版本"""
+        detail = {key: '' for key, _ in self.FIELDS}
+        detail['detailed_company_photos'] = ''
+
+        try:
+            await async_human_like_scroll(detail_page)
+            await async_random_delay(1, 2)
+
+            sections, photos = await job_parser.extract_sections_async(detail_page, [heading for _, heading in self.FIELDS], self.PHOTOS_HEADING)
+            self._fill(detail, sections, photos)
+
+        except Exception as e:
+            logger.error(f"抓取詳細資訊時發生錯誤: {e}")
+
+        return detail
+
+    # ── Private ──
+
+    def _fill(self, detail: dict[str, str], sections: dict[str, str], photos: str) -> None:
+        """把 extract_sections 的結果填入 detail"""
+        for key, heading in self.FIELDS:
+            detail[key] = sections.get(heading, '')
+            logger.debug(f"{heading}: {detail[key][:50] if detail[key] else '(空)'}")
+        detail['detailed_company_photos'] = photos
+        logger.debug(f"公司環境照片: {photos or '(找不到)'}")
+
 
 # 全域實例
 detail_scraper = DetailScraper()
@@ -5,6 +5,7 @@
 import re
 import logging
 from playwright.sync_api import Page, Locator
+from playwright.async_api import Page as AsyncPage, Locator as AsyncLocator
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +20,57 @@ class JobParser:
     _RE_SALARY: re.Pattern[str] = re.compile(r'(待遇面議|月薪[\d,~]+元[以上]*|年薪[\d,~]+[萬元]+[以上]*|時薪[\d,~]+元[以上]*)')
     _INFO_KEYWORDS: tuple[str, ...] = ('年以上', '經歷不拘', '待遇面議', '月薪', '年薪')
 
+    # 一次 evaluate_all 取出整頁卡片的原始資料 (對應 extract_from_card 的 IPC 呼叫)
+    # 只取可見的 link，與 get_by_role("link") 預設排除隱藏元素的行為一致
+    _CARDS_JS: str = """
+        (cards) => cards.map((card) => {
+            const links = Array.from(card.querySelectorAll('a[href], [role="link"]'))
+                .filter((el) => el.getClientRects().length > 0);
+            const first = links[0];
+            return {
+                title: first ? first.innerText : '',
+                href: first ? first.getAttribute('href') : '',
+                company: links.length > 1 ? links[1].innerText : '',
+                text: card.innerText || '',
+            };
+        })
+    """
+
+    # 一次 evaluate 取出詳細頁所有區塊 (對應 get_section_content 的三種方法，每個 heading 只找一次)
+    # heading 比對同 get_by_role("heading", name=...)：可見的 h1-h6 / role=heading，名稱包含即可 (不分大小寫)
+    _SECTIONS_JS: str = """
+        ({ names, photos }) => {
+            const headings = Array.from(document.querySelectorAll('h1, h2, h3, h4, h5, h6, [role="heading"]'))
+                .filter((el) => el.getClientRects().length > 0)
+                .map((el) => ({ el, name: (el.getAttribute('aria-label') || el.textContent || '').replace(/\\s+/g, ' ').trim() }));
+            const find = (name) => headings.find((h) => h.name.toLowerCase().includes(name.toLowerCase()));
+            const text = (el) => (el ? (el.innerText || '') : '').trim();
+
+            const sections = {};
+            for (const name of names) {
+                const heading = find(name);
+                let content = '';
+                if (heading) {
+                    const parent = heading.el.parentElement;
+                    const grandparent = parent ? parent.parentElement : null;
+                    content = text(parent).replace(name, '').trim();
+                    if (!content) content = text(grandparent).replace(name, '').trim();
+                    if (!content) {
+                        const next = document.evaluate(
+                            'following::div[1] | following::p[1]', heading.el, null,
+                            XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null,
+                        ).snapshotItem(0);
+                        content = text(next);
+                    }
+                }
+                sections[name] = content;
+            }
+
+            const photosHeading = photos ? headings.find((h) => h.name.includes(photos)) : null;
+            return { sections, photos: photosHeading ? text(photosHeading.el) : '' };
+        }
+    """
+
     def parse_info(self, text: str) -> dict[str, str]:
         """
         解析混合的職缺資訊字串
@@ -91,17 +143,28 @@ class JobParser:
             logger.debug(f"get_section_content 錯誤: {e}")
         return ''
 
+    def extract_sections(self, page: Page, headings: list[str], photos_heading: str = '') -> tuple[dict[str, str], str]:
+        """
+        一次取出多個區塊的內容 (單次 evaluate，結果同逐一呼叫 get_section_content)
+
+        Args:
+            headings: 區塊標題 (如 '工作內容')
+            photos_heading: 另外取出標題本身文字的 heading (如 '公司環境照片')
+
+        Returns:
+            ({heading: 內容}, photos_heading 的文字)
+        """
+        raw = page.evaluate(self._SECTIONS_JS, {'names': headings, 'photos': photos_heading})
+        return raw['sections'], raw['photos']
+
+    async def extract_sections_async(self, page: AsyncPage, headings: list[str], photos_heading: str = '') -> tuple[dict[str, str], str]:
+        """extract_sections 的 async 版本"""
+        raw = await page.evaluate(self._SECTIONS_JS, {'names': headings, 'photos': photos_heading})
+        return raw['sections'], raw['photos']
+
     def extract_from_card(self, card: Locator) -> dict[str, str] | None:
         """從職缺卡片提取基本資訊"""
-        job = {
-            'title': '',
-            'url': '',
-            'company': '',
-            'location': '',
-            'experience': '',
-            'education': '',
-            'salary': ''
-        }
+        job = self._empty_job()
 
         title_link = card.get_by_role("link").first
         if title_link.count() > 0:
@@ -113,7 +176,71 @@ class JobParser:
         if len(company_links) > 1:
             job['company'] = company_links[1].inner_text().strip()
 
-        card_text = card.inner_text()
+        self._apply_card_text(job, card.inner_text())
+
+        return job if job.get('title') else None
+
+    async def extract_from_card_async(self, card: AsyncLocator) -> dict[str, str] | None:
+        """extract_from_card 的 async 版本"""
+        job = self._empty_job()
+
+        title_link = card.get_by_role("link").first
+        if await title_link.count() > 0:
+            job['title'] = (await title_link.inner_text()).strip()
+            href = await title_link.get_attribute('href')
+            job['url'] = f"https:{href}" if href and not href.startswith('http') else href
+
+        company_links = await card.get_by_role("link").all()
+        if len(company_links) > 1:
+            job['company'] = (await company_links[1].inner_text()).strip()
+
+        self._apply_card_text(job, await card.inner_text())
+
+        return job if job.get('title') else None
+
+    def extract_all(self, cards: Locator) -> list[dict[str, str] | None]:
+        """
+        一次取出所有卡片的基本資訊 (單次 evaluate_all)
+
+        Args:
+            cards: 所有職缺卡片的 locator (不要先 .all())
+
+        Returns:
+            與卡片順序對應的 list，結構同 extract_from_card (無標題為 None)
+        """
+        return [self._job_from_raw(raw) for raw in cards.evaluate_all(self._CARDS_JS)]
+
+    async def extract_all_async(self, cards: AsyncLocator) -> list[dict[str, str] | None]:
+        """extract_all 的 async 版本"""
+        return [self._job_from_raw(raw) for raw in await cards.evaluate_all(self._CARDS_JS)]
+
+    # ── Private ──
+
+    def _job_from_raw(self, raw: dict[str, str | None]) -> dict[str, str] | None:
+        """把 _CARDS_JS 回傳的原始資料轉成 job dict"""
+        job = self._empty_job()
+        job['title'] = (raw.get('title') or '').strip()
+        href = raw.get('href')
+        job['url'] = f"https:{href}" if href and not href.startswith('http') else href
+        job['company'] = (raw.get('company') or '').strip()
+        self._apply_card_text(job, raw.get('text') or '')
+
+        return job if job.get('title') else None
+
+    def _empty_job(self) -> dict[str, str]:
+        """列表頁職缺的空白欄位"""
+        return {
+            'title': '',
+            'url': '',
+            'company': '',
+            'location': '',
+            'experience': '',
+            'education': '',
+            'salary': ''
+        }
+
+    def _apply_card_text(self, job: dict[str, str], card_text: str) -> None:
+        """從卡片文字中找出資訊行，解析後更新 job"""
         lines = [line.strip() for line in card_text.split('\n') if line.strip()]
 
         for line in lines:
@@ -122,8 +249,6 @@ class JobParser:
                 job.update(parsed)
                 break
 
-        return job if job.get('title') else None
-
 
 # 全域實例
 job_parser = JobParser()
@@ -3,29 +3,61 @@
 """
 
 import re
-from playwright.sync_api import sync_playwright, Page
+from contextlib import contextmanager
+from collections.abc import Iterator
+from playwright.sync_api import sync_playwright, Page, Locator, BrowserContext
 from .stealth_browser import stealth_browser
+from .resource_blocker import ResourceBlocker
 from .job_parser import JobParser, job_parser
-from config import BASE_URL, DEFAULT_FILTERS
+from .search_capture import SearchCapture
+from .search_url import search_url_builder
+from .page_script import PageScript, call, delay, run_script
+from config import BASE_URL, DEFAULT_FILTERS, AREA_NAMES
 from utils import (
     random_delay, smart_delay, human_like_scroll, human_like_mouse_move,
-    human_like_pause, handle_captcha_if_detected
+    human_like_pause, handle_captcha_if_detected, install_captcha_watcher,
+    search_cache_key, get_cached_search_url, save_search_url, invalidate_search_url,
+    job_id_from_url, get_profile_dir, enforce_profile_limit,
+    job_content_hash, load_seen_index, seen_status, mark_seen, save_seen_index,
+    start_checkpoint, save_checkpoint, clear_checkpoint, rate_governor, host_limiter,
 )
 
 
 class JobSearcher:
     """104 職缺搜尋與處理"""
 
+    CARD_SELECTOR: str = '.vue-recycle-scroller__item-view .job-summary'
+
     def __init__(self) -> None:
         self.parser: JobParser = job_parser
+        # config['record_seen'] = False 時，處理成功的職缺 {job_id: 內容 hash} 留給呼叫端記錄 (分片 coordinator)
+        self.seen_entries: dict[str, str] = {}
 
-    def search(self, keyword: str, pages: int = 1, headless: bool = False, config: dict | None = None, strategy: object | None = None) -> list[dict]:
+    def search(self, keyword: str, pages: int = 1, headless: bool = False, config: dict | None = None, strategy: object | None = None, browser_service: object | None = None) -> list[dict]:
         """
         爬取 104 職缺列表 (兩階段流程)
 
         Phase 1: 抓取列表頁基本資料
         Phase 2: 用 Strategy 處理每個職缺
         """
+        return self.search_batch([keyword], pages=pages, headless=headless, config=config, strategy=strategy, browser_service=browser_service)
+
+    def search_batch(self, queries: list[str | dict], pages: int = 1, headless: bool = False, config: dict | None = None, strategy: object | None = None, browser_service: object | None = None, resume: dict | None = None) -> list[dict]:
+        """
+        在同一個瀏覽器 session 依序搜尋多組條件，結果合併並去除重複職缺
+
+        Args:
+            queries: 關鍵字，或 {'keyword': ..., 其他 config 覆寫 (如 'area_indices')}
+            pages: 每組搜尋要爬幾頁 (0 = 全部)
+            headless: 是否隱藏瀏覽器
+            config: 執行設定
+            strategy: 處理策略 (整批共用一個，before/after_process 只執行一次)
+            browser_service: 常駐瀏覽器 (BrowserService，須在其 thread 內呼叫)；None = 自行啟動瀏覽器
+            resume: 上次中斷時的檢查點 (load_checkpoint)，從該位置繼續
+
+        Returns:
+            去重後的職缺列表
+        """
         if config is None:
             from config import RUN_CONFIG
             config = RUN_CONFIG
@@ -34,122 +66,621 @@ class JobSearcher:
             from strategy import SaveStrategy
             strategy = SaveStrategy()
 
+        self.seen_entries = {}
         print(f"\n使用策略: {strategy.name}")
         print(f"說明: {strategy.description}")
+        if len(queries) > 1:
+            print(f"批次搜尋: {len(queries)} 組條件")
+        rate_governor.configure(config)
+        host_limiter.configure(config)
+
+        # 檢查點：執行條件寫一次，目前的搜尋位置每頁開始與每 checkpoint_every 個職缺寫入一次
+        progress = None
+        if config.get('checkpoint', True):
+            start_checkpoint({
+                'queries': queries,
+                'pages': pages,
+                'headless': headless,
+                'strategy': type(strategy).__name__,
+                'config': config,
+            })
+            progress = {
+                'query_index': 0,
+                'search_url': None,
+                'page_num': 1,
+                'page_budget': pages,
+                'card_index': -1,
+            }
 
-        with sync_playwright() as p:
-            browser, browser_ctx = stealth_browser.setup(p, headless=headless)
+        jobs = []
+        seen_ids: set[str] = set()
+        seen_counts = {'new': 0, 'changed': 0, 'known': 0}
+        processed: set[int] = set()  # 處理成功的 job_index (結束時寫入已看過索引)
+        first_query = 0
+        if resume is not None:
+            jobs = strategy.restore_checkpoint(resume.get('strategy_state', {}), int(resume.get('job_count', 0)))
+            seen_ids = set(resume.get('seen_ids', []))
+            # 最後一次寫入檢查點之後才處理的職缺不必重新處理
+            seen_ids.update(job_id for job in jobs if (job_id := job_id_from_url(str(job.get('url') or ''))))
+            seen_counts.update(resume.get('seen_counts', {}))
+            first_query = int(resume.get('query_index', 0))
+            print(f"從檢查點繼續: 已處理 {sum(1 for job in jobs if job)} 個職缺，第 {first_query + 1}/{len(queries)} 組搜尋第 {resume.get('page_num', 1)} 頁")
+
+        blocker = ResourceBlocker.from_config(config)
+        with self._open_browser(headless, blocker, browser_service, config) as browser_ctx:
+            if config.get('captcha_watcher', True):
+                # 驗證出現 / 消失由頁面事件通知，各處的 handle_captcha_if_detected 只讀旗標
+                install_captcha_watcher(browser_ctx)
             page = browser_ctx.new_page()
 
             from strategy import StrategyContext
             ctx = StrategyContext(strategy, config, browser_context=browser_ctx, page=page)
 
-            # 前往首頁
-            print("\n正在前往 104 首頁...")
-            page.goto(BASE_URL, wait_until='domcontentloaded')
-            random_delay(2, 3)
+            capture = self._setup_capture(page, config, strategy)
 
-            if not handle_captcha_if_detected(page, "進入首頁"):
-                browser.close()
-                return []
+            # 已看過的職缺索引 (incremental 時略過沒變動的職缺；處理成功的職缺在結束時記錄)
+            seen_index = load_seen_index()
+            if config.get('incremental'):
+                print(f"增量爬取: 已記錄 {len(seen_index)} 個職缺，連續 {config.get('incremental_stop_pages', 2)} 頁無新職缺即停止")
+            ui_templates: dict[str, str] = {}  # UI 點選出的搜尋 URL，換關鍵字重複使用
+            started = False
+            interrupted = False
 
-            self._close_popups(page)
-            self._search_keyword(page, keyword)
-            self._apply_filters(page, config)
+            for n, query in enumerate(queries, 1):
+                if n - 1 < first_query:
+                    continue
+                keyword, query_config = self._query_config(query, config)
+                if len(queries) > 1:
+                    print(f"\n{'#'*60}")
+                    print(f"[Batch {n}/{len(queries)}] {keyword} {self._query_label(query)}")
+                    print(f"{'#'*60}")
+
+                if capture is not None:
+                    capture.clear()  # 上一組搜尋留下的 response
+                resuming = resume is not None and n - 1 == first_query and bool(resume.get('search_url'))
+                if resuming:
+                    # 直接回到中斷時的列表頁 (篩選條件已在網址中)
+                    print(f"\n回到中斷的列表頁: {resume['search_url']}")
+                    opened = self._goto_search_url(ctx.page, resume['search_url'], warm=started)
+                    start_page = int(resume.get('page_num', 1))
+                    query_pages = int(resume.get('page_budget', pages))
+                    skip_cards = int(resume.get('card_index', -1))
+                else:
+                    opened = self._open_search(ctx.page, keyword, query_config, warm=started, ui_templates=ui_templates)
+                    start_page = int(query_config.get('start_page', 1) or 1)
+                    query_pages = pages
+                    skip_cards = -1
+                if not opened:
+                    print(f"[Batch {n}/{len(queries)}] 驗證逾時，停止批次")
+                    interrupted = True
+                    break
 
-            if not handle_captcha_if_detected(page, "套用篩選"):
-                browser.close()
-                return []
+                # 分片爬取時可從指定頁碼開始 (UI / 快取路徑落在第 1 頁，再跳頁)
+                if start_page > 1 and search_url_builder.page_of(ctx.page.url) != start_page:
+                    print(f"\n跳到第 {start_page} 頁")
+                    if not self._goto_search_url(ctx.page, search_url_builder.with_page(ctx.page.url, start_page), warm=True):
+                        print(f"[Batch {n}/{len(queries)}] 驗證逾時，停止批次")
+                        interrupted = True
+                        break
+
+                if not started:
+                    # ========== 開始處理 ==========
+                    print(f"\n{'='*60}")
+                    print(f"開始: {strategy.name}")
+                    print(f"{'='*60}")
+                    ctx.before_process(jobs)
+                    started = True
+                    if resume is not None:
+                        self._process_pending(ctx, jobs, resume.get('pending', []), processed)
+
+                if progress is not None:
+                    progress.update(query_index=n - 1, search_url=None, page_num=start_page, page_budget=query_pages, card_index=-1)
+
+                if not self._crawl_pages(ctx, capture, query_pages, jobs, seen_ids, start_page=start_page, seen_index=seen_index, seen_counts=seen_counts, processed=processed, skip_cards=skip_cards, progress=progress):
+                    print(f"[Batch {n}/{len(queries)}] 驗證逾時或翻頁失敗，停止批次")
+                    interrupted = True
+                    break
 
-            # ========== 開始處理 ==========
             print(f"\n{'='*60}")
-            print(f"開始: {strategy.name}")
+            print(f"完成! 共處理 {len(jobs)} 個職缺")
+            if rate_governor.enabled:
+                print(f"速率: {rate_governor.summary()}")
+            if host_limiter.enabled:
+                print(f"主機限流: {host_limiter.summary()}")
             print(f"{'='*60}")
 
-            jobs = []
-            page_num = 1
+            if started and interrupted and progress is not None:
+                ctx.suspend(jobs)
+            elif started:
+                ctx.after_process(jobs)
+            print(f"職缺索引: 新 {seen_counts['new']} / 變動 {seen_counts['changed']} / 已看過 {seen_counts['known']}")
+            if strategy.records_seen:
+                self.seen_entries = self._seen_entries(jobs, processed - set(strategy.failed_job_indices()))
+                if config.get('record_seen', True):
+                    self._record_seen(seen_index, self.seen_entries)
+            if blocker is not None:
+                blocker.print_summary()
+
+        if progress is not None:
+            if interrupted:
+                # 收尾之後再寫一次：worker pool 的結果已寫入串流，不必重抓
+                self._save_checkpoint(progress, strategy, jobs, seen_ids, seen_counts)
+                print("已保留檢查點，可用「繼續上次執行」從中斷處繼續")
+            else:
+                clear_checkpoint()
 
-            ctx.before_process(jobs)
-            max_pages = pages if pages > 0 else 999
+        return [job for job in jobs if job]
 
-            while page_num <= max_pages:
-                print(f"\n[Page {page_num}] 正在抓取列表...")
+    @staticmethod
+    def resolve_filters(config: dict | None = None) -> dict:
+        """合併篩選條件（config 覆蓋 DEFAULT_FILTERS）"""
+        filters = {**DEFAULT_FILTERS}
+        if config:
+            if 'area_indices' in config:
+                filters['area_indices'] = config['area_indices']
+            if 'job_type' in config:
+                filters['job_type'] = config['job_type']
+            if 'experience' in config:
+                filters['experience'] = config['experience']
+            if 'remote_work' in config:
+                filters['remote_work'] = config['remote_work']
+            if 'benefits' in config:
+                filters['benefits'] = config['benefits']
+            if 'salary_min' in config:
+                filters['salary_min'] = config['salary_min']
+            if 'job_categories' in config:
+                filters['job_categories'] = config['job_categories']
+            # 向下相容：舊的單組格式自動轉換
+            elif 'job_cat_main' in config:
+                filters['job_categories'] = [{
+                    'main': config['job_cat_main'],
+                    'sub': config.get('job_cat_sub', ''),
+                    'titles': config.get('job_cat_titles', []),
+                }]
 
-                if hasattr(ctx.strategy, 'set_page'):
-                    ctx.strategy.set_page(page_num)
+        return filters
 
-                if not handle_captcha_if_detected(page, f"第 {page_num} 頁"):
-                    break
+    @classmethod
+    def compile_search_url(cls, keyword: str, config: dict | None = None, page: int = 1) -> str | None:
+        """
+        把關鍵字 + 篩選條件編譯成搜尋 URL
 
-                human_like_scroll(page)
-                if ctx.human_like in ['normal', 'full']:
-                    human_like_mouse_move(page)
-                    smart_delay(ctx.human_like, ctx.delay_multiplier, 'normal')
+        Returns:
+            URL；filter_mode 不是 'url' 或條件無法用 URL 表達時回傳 None
+        """
+        if (config or {}).get('filter_mode', 'url') != 'url':
+            return None
 
-                job_cards = page.locator('.vue-recycle-scroller__item-view .job-summary').all()
-                print(f"[Page {page_num}] 找到 {len(job_cards)} 個職缺卡片")
+        filters = cls.resolve_filters(config)
+        problems = search_url_builder.unsupported(filters)
+        if problems:
+            print(f"篩選條件無法轉成 URL ({', '.join(problems)})，改用 UI 點選")
+            return None
 
-                for i, card in enumerate(job_cards):
-                    try:
-                        job = self.parser.extract_from_card(card)
-                        if not job:
-                            continue
+        return search_url_builder.build(keyword, filters, page=page)
 
-                        company = job.get('company', '')
-                        print(f"  [Page {page_num}][{i+1}] {job.get('title', '')[:30]}  |  {company}")
+    # ── Private ──
 
-                        job_index = len(jobs)
-                        jobs.append(job)
+    @contextmanager
+    def _open_browser(self, headless: bool, blocker: ResourceBlocker | None, browser_service: object | None, config: dict) -> Iterator[BrowserContext]:
+        """取得 browser context：持久化 profile / 借用常駐瀏覽器 / 自己啟動 (離開時關閉)"""
+        if config.get('browser_profile'):
+            if browser_service is not None:
+                print("持久化 profile 模式不使用常駐瀏覽器")
+            profile_dir = get_profile_dir(str(config.get('profile_name', 'default')))
+            max_mb = float(config.get('profile_max_mb', 0) or 0)
+            enforce_profile_limit(profile_dir, max_mb)
+            print(f"使用瀏覽器 profile: {profile_dir}")
+
+            with sync_playwright() as p:
+                # 磁碟快取上限取 profile 上限的一半，其餘留給 service worker / cookie
+                browser_ctx = stealth_browser.setup_persistent(p, profile_dir, headless=headless, blocker=blocker, max_cache_mb=max_mb / 2)
+                try:
+                    yield browser_ctx
+                finally:
+                    browser_ctx.close()
+            return
+
+        if browser_service is not None:
+            browser_ctx = browser_service.acquire(headless, blocker=blocker)
+            try:
+                yield browser_ctx
+            finally:
+                browser_service.release(browser_ctx)
+            return
 
-                        job_info = {
-                            **job,
-                            'job_index': job_index,
-                            'card': card,
-                        }
-                        ctx.process_job(job_info)
+        with sync_playwright() as p:
+            browser, browser_ctx = stealth_browser.setup(p, headless=headless, blocker=blocker)
+            try:
+                yield browser_ctx
+            finally:
+                browser.close()
 
-                        if not handle_captcha_if_detected(page, f"處理職缺 {i+1}"):
-                            break
+    def _query_config(self, query: str | dict, config: dict) -> tuple[str, dict]:
+        """批次中的單組搜尋 → (關鍵字, 合併後的 config)"""
+        if isinstance(query, str):
+            return query, config
+        overrides = {k: v for k, v in query.items() if k != 'keyword'}
+        return query['keyword'], {**config, **overrides}
 
-                        smart_delay(ctx.human_like, ctx.delay_multiplier, 'normal')
+    def _query_label(self, query: str | dict) -> str:
+        """批次 log 用的條件說明"""
+        if isinstance(query, dict) and query.get('area_indices'):
+            return f"({', '.join(AREA_NAMES.get(a, str(a)) for a in query['area_indices'])})"
+        return ''
 
-                    except Exception as e:
-                        print(f"  [Page {page_num}][{i+1}] 錯誤: {e}")
+    def _crawl_pages(self, ctx, capture: SearchCapture | None, pages: int, jobs: list[dict], seen_ids: set[str], start_page: int = 1, seen_index: dict[str, dict] | None = None, seen_counts: dict[str, int] | None = None, processed: set[int] | None = None, skip_cards: int = -1, progress: dict | None = None) -> bool:
+        """
+        從目前的搜尋結果頁開始逐頁處理
+
+        Args:
+            ctx: StrategyContext (ctx.page 為目前列表頁，預載切換 tab 時會更新)
+            capture: network 列表模式的 XHR 監聽
+            pages: 最多幾頁 (0 = 全部)
+            jobs: 累積的職缺 (跨批次共用)
+            seen_ids: 已處理過的職缺 ID (批次內去重)
+            start_page: 目前列表頁的頁碼
+            seen_index: 跨執行的已看過職缺索引 (load_seen_index)
+            seen_counts: 新 / 變動 / 已看過 的累計數
+            processed: 處理成功的 job_index (由此寫入)
+            skip_cards: 從檢查點繼續時，第一頁已處理到第幾張卡片 (-1 = 從頭)
+            progress: 檢查點的搜尋位置 (None = 不寫檢查點)
+
+        Returns:
+            False = 驗證逾時或無法翻到下一頁 (未完成)，應停止後續搜尋
+        """
+        page = ctx.page
+        config = ctx.config
+        page_num = start_page
+        max_pages = start_page + pages - 1 if pages > 0 else 999
+
+        # 預先載入下一頁 (第二個 tab)
+        prefetch = bool(config.get('prefetch_next_page', False))
+        search_url = page.url
+        prefetch_tab = None
+        prefetched = False
+        completed = True
+
+        # 增量爬取：結果依更新時間排序，連續 K 頁都沒有新職缺就不必再往後翻
+        incremental = bool(config.get('incremental')) and seen_index is not None
+        stop_pages = max(1, int(config.get('incremental_stop_pages', 2) or 1))
+        known_streak = 0
+
+        checkpoint_every = max(1, int(config.get('checkpoint_every', 5) or 1))
+        since_checkpoint = 0
+
+        while page_num <= max_pages:
+            print(f"\n[Page {page_num}] 正在抓取列表...")
+
+            if progress is not None:
+                progress.update(
+                    search_url=page.url,
+                    page_num=page_num,
+                    page_budget=max_pages - page_num + 1 if pages > 0 else 0,
+                    card_index=skip_cards if page_num == start_page else -1,
+                )
+                self._save_checkpoint(progress, ctx.strategy, jobs, seen_ids, seen_counts)
+
+            if hasattr(ctx.strategy, 'set_page'):
+                ctx.strategy.set_page(page_num)
+
+            if not handle_captcha_if_detected(page, f"第 {page_num} 頁"):
+                completed = False
+                break
+
+            human_like_scroll(page)
+            if ctx.human_like in ['normal', 'full']:
+                human_like_mouse_move(page)
+                smart_delay(ctx.human_like, ctx.delay_multiplier, 'normal')
+
+            listing = self._collect_listing(page, page_num, capture)
+
+            # 列表資料已取出，處理本頁職缺的同時在背景 tab 載入下一頁
+            prefetched = False
+            if prefetch and listing and page_num < max_pages:
+                prefetch_tab = self._prefetch_page(ctx.browser_context, prefetch_tab, search_url, page_num + 1, capture)
+                prefetched = prefetch_tab is not None
+
+            fresh = 0
+            for i, (job, card) in enumerate(listing):
+                try:
+                    if not job:
                         continue
 
-                print(f"[Page {page_num}] 處理完成: {len(job_cards)} 個職缺")
+                    company = job.get('company', '')
+                    job_id = job_id_from_url(job.get('url') or '')
+                    if page_num == start_page and i <= skip_cards and (not job_id or job_id in seen_ids):
+                        continue  # 檢查點之前已處理
+                    if job_id and job_id in seen_ids:
+                        print(f"  [Page {page_num}][{i+1}] 重複職缺，略過: {job.get('title', '')[:30]}")
+                        continue
+                    if job_id:
+                        seen_ids.add(job_id)
+
+                    status = seen_status(seen_index, job_id, job_content_hash(job)) if (job_id and seen_index is not None) else 'new'
+                    if seen_counts is not None:
+                        seen_counts[status] += 1
+                    if status != 'known':
+                        fresh += 1
+                    elif incremental:
+                        print(f"  [Page {page_num}][{i+1}] 已看過，略過: {job.get('title', '')[:30]}")
+                        continue
 
-                if hasattr(ctx.strategy, 'export_page_manual_jobs'):
-                    ctx.strategy.export_page_manual_jobs(page_num)
+                    print(f"  [Page {page_num}][{i+1}] {job.get('title', '')[:30]}  |  {company}")
+
+                    job_index = len(jobs)
+                    jobs.append(job)
+
+                    job_info = {
+                        **job,
+                        'job_index': job_index,
+                        'card': card,
+                    }
+                    if ctx.process_job(job_info) and processed is not None:
+                        processed.add(job_index)
+                    # 策略寫入 job_info 的欄位 (如詳細資料) 同步回 jobs
+                    job.update({k: v for k, v in job_info.items() if k not in ('card', 'job_index')})
+
+                    if progress is not None:
+                        progress['card_index'] = i
+                        since_checkpoint += 1
+                        if since_checkpoint >= checkpoint_every:
+                            self._save_checkpoint(progress, ctx.strategy, jobs, seen_ids, seen_counts)
+                            since_checkpoint = 0
+
+                    if not handle_captcha_if_detected(page, f"處理職缺 {i+1}"):
+                        break
 
-                if len(job_cards) == 0:
-                    print(f"\n[Page {page_num}] 沒有找到任何職缺卡片，結束搜尋")
-                    break
+                    # 詳細頁交給 worker pool 時，列表頁不需逐筆等待
+                    if not getattr(ctx.strategy, 'concurrent', False):
+                        smart_delay(ctx.human_like, ctx.delay_multiplier, 'normal')
+
+                except Exception as e:
+                    print(f"  [Page {page_num}][{i+1}] 錯誤: {e}")
+                    continue
 
-                if page_num < max_pages:
-                    if ctx.human_like == 'full':
-                        human_like_pause(page)
+            print(f"[Page {page_num}] 處理完成: {len(listing)} 個職缺")
 
-                    has_next = self._goto_next_page(page, page_num + 1)
-                    if not has_next:
-                        print(f"\n[Page {page_num}] 已到達最後一頁，結束搜尋")
-                        break
+            if hasattr(ctx.strategy, 'export_page_manual_jobs'):
+                ctx.strategy.export_page_manual_jobs(page_num)
 
-                    page_num += 1
-                else:
-                    print(f"\n[Page {page_num}] 已達到設定頁數上限，結束搜尋")
+            if len(listing) == 0:
+                print(f"\n[Page {page_num}] 沒有找到任何職缺卡片，結束搜尋")
+                break
+
+            if incremental:
+                known_streak = known_streak + 1 if fresh == 0 else 0
+                if known_streak >= stop_pages:
+                    print(f"\n[Page {page_num}] 連續 {known_streak} 頁都是已看過的職缺，結束搜尋")
                     break
 
-            print(f"\n{'='*60}")
-            print(f"完成! 共處理 {len(jobs)} 個職缺")
-            print(f"{'='*60}")
+            if capture is not None and capture.is_last_page():
+                print(f"\n[Page {page_num}] 搜尋 API 顯示已是最後一頁 ({capture.page_info[1]} 頁)，結束搜尋")
+                break
+
+            if page_num < max_pages:
+                if ctx.human_like == 'full':
+                    human_like_pause(page)
+
+                turned = None
+                if prefetched:
+                    if self._switch_to_prefetched(prefetch_tab, page_num + 1):
+                        # 切換 tab：舊的列表頁留著當下一次預載用
+                        page, prefetch_tab = prefetch_tab, page
+                        ctx.page = page
+                        turned = 'ok'
+                    else:
+                        print(f"[Page {page_num + 1}] 預載頁無法使用，改用點擊翻頁")
+                if turned is None:
+                    if capture is not None:
+                        capture.clear()
+                    turned = self._goto_next_page(page, page_num + 1)
+                if turned == 'end':
+                    print(f"\n[Page {page_num}] 已到達最後一頁，結束搜尋")
+                    break
+                if turned != 'ok':
+                    # 驗證逾時或翻頁錯誤：不是最後一頁，保留檢查點供繼續執行
+                    print(f"\n[Page {page_num}] 無法前往第 {page_num + 1} 頁，停止搜尋")
+                    completed = False
+                    break
 
-            ctx.after_process(jobs)
-            browser.close()
+                page_num += 1
+            else:
+                print(f"\n[Page {page_num}] 已達到設定頁數上限，結束搜尋")
+                break
 
-        return jobs
+        if prefetch_tab is not None:
+            try:
+                prefetch_tab.close()
+            except Exception:
+                pass
 
-    # ── Private ──
+        return completed
+
+    def _save_checkpoint(self, progress: dict, strategy: object, jobs: list[dict], seen_ids: set[str], seen_counts: dict[str, int] | None) -> None:
+        """寫入檢查點游標 (搜尋位置 + 職缺數 + 已處理的 ID + 策略狀態；職缺資料由策略的串流檔還原)"""
+        try:
+            save_checkpoint({
+                **progress,
+                'job_count': len(jobs),
+                'seen_ids': sorted(seen_ids),
+                'seen_counts': seen_counts or {},
+                'strategy_state': strategy.checkpoint_state(),
+                'pending': strategy.pending_job_indices(),
+            })
+        except Exception as e:
+            print(f"  ⚠ 寫入檢查點失敗: {e}")
+
+    def _seen_entries(self, jobs: list[dict], done: set[int]) -> dict[str, str]:
+        """處理成功的職缺 → {job_id: 內容 hash} (失敗或未處理的下次仍視為新職缺)"""
+        entries = {}
+        for job_index in sorted(done):
+            if not 0 <= job_index < len(jobs):
+                continue
+            job_id = job_id_from_url(jobs[job_index].get('url') or '')
+            if job_id:
+                entries[job_id] = job_content_hash(jobs[job_index])
+        return entries
+
+    def _record_seen(self, seen_index: dict[str, dict], entries: dict[str, str]) -> None:
+        """處理成功的職缺寫入已看過索引"""
+        for job_id, content_hash in entries.items():
+            mark_seen(seen_index, job_id, content_hash)
+        if entries:
+            save_seen_index(seen_index)
+        print(f"職缺索引: 記錄 {len(entries)} 個處理成功的職缺")
+
+    def _process_pending(self, ctx, jobs: list[dict], pending: list[int], processed: set[int]) -> None:
+        """從檢查點繼續時，補處理上次已列出但還沒處理完的職缺 (如 worker pool 中的詳細頁)"""
+        # 串流檔中沒有的職缺 (如沒有開啟串流輸出) 無法補處理
+        pending = [i for i in pending if 0 <= i < len(jobs) and jobs[i].get('url')]
+        if not pending:
+            return
+        print(f"\n補處理上次未完成的 {len(pending)} 個職缺")
+        for job_index in pending:
+            job = jobs[job_index]
+            job_info = {**job, 'job_index': job_index, 'card': None}
+            try:
+                if ctx.process_job(job_info):
+                    processed.add(job_index)
+                job.update({k: v for k, v in job_info.items() if k not in ('card', 'job_index')})
+            except Exception as e:
+                print(f"  [補處理 {job_index + 1}] 錯誤: {e}")
+
+    def _setup_capture(self, page: Page, config: dict, strategy: object) -> SearchCapture | None:
+        """listing_mode='network' 時在搜尋前掛上 XHR 監聽"""
+        if config.get('listing_mode', 'dom') != 'network':
+            return None
+        if getattr(strategy, 'requires_card', False):
+            print(f"列表模式: {strategy.name} 需要操作卡片，改用 DOM 模式")
+            return None
+
+        print("列表模式: network (攔截搜尋 API)")
+        capture = SearchCapture()
+        capture.attach(page)
+        return capture
+
+    def _collect_listing(self, page: Page, page_num: int, capture: SearchCapture | None) -> list[tuple[dict | None, Locator | None]]:
+        """
+        取得目前列表頁的職缺
+
+        Returns:
+            [(job, card)]，network 模式下 card 為 None
+        """
+        if capture is not None:
+            records = capture.take(page)
+            if records is not None:
+                print(f"[Page {page_num}] 從搜尋 API 取得 {len(records)} 個職缺")
+                return [(record, None) for record in records]
+            print(f"[Page {page_num}] ⚠ 沒有攔截到搜尋 API，改讀 DOM")
+
+        cards_locator = page.locator(self.CARD_SELECTOR)
+        job_cards = cards_locator.all()
+        print(f"[Page {page_num}] 找到 {len(job_cards)} 個職缺卡片")
+        return list(zip(self._extract_cards(cards_locator, job_cards), job_cards))
+
+    def _extract_cards(self, cards_locator: Locator, job_cards: list[Locator]) -> list[dict | None]:
+        """
+        一次取出整頁卡片資料；卡片數量對不上 (列表在途中重繪) 時退回逐張讀取
+        """
+        try:
+            parsed_jobs = self.parser.extract_all(cards_locator)
+            if len(parsed_jobs) == len(job_cards):
+                return parsed_jobs
+            print(f"  ⚠ 卡片數量變動 ({len(job_cards)} → {len(parsed_jobs)})，改為逐張讀取")
+        except Exception as e:
+            print(f"  ⚠ 批次讀取卡片失敗，改為逐張讀取: {e}")
+
+        parsed_jobs = []
+        for i, card in enumerate(job_cards):
+            try:
+                parsed_jobs.append(self.parser.extract_from_card(card))
+            except Exception as e:
+                print(f"  [{i+1}] 錯誤: {e}")
+                parsed_jobs.append(None)
+        return parsed_jobs
+
+    def _open_search(self, page: Page, keyword: str, config: dict, warm: bool = False, ui_templates: dict[str, str] | None = None) -> bool:
+        """
+        開啟搜尋結果頁：能編譯成 URL 就直接前往，否則走首頁 + UI 點選篩選
+
+        Args:
+            warm: 同一 session 已開過 104 (彈窗已關閉，不再檢查)
+            ui_templates: 批次搜尋時，同篩選條件 UI 點選出的 URL (換關鍵字直接用)
+
+        Returns:
+            False = 遇到驗證且等待逾時
+        """
+        search_url = self.compile_search_url(keyword, config, page=int(config.get('start_page', 1) or 1))
+        if search_url:
+            print(f"\n直接前往搜尋結果: {search_url}")
+            return self._goto_search_url(page, search_url, warm)
+
+        filters = self.resolve_filters(config)
+        template_key = search_cache_key('', filters)
+        if ui_templates and template_key in ui_templates:
+            search_url = search_url_builder.with_keyword(ui_templates[template_key], keyword)
+            print(f"\n沿用已套用的篩選條件: {search_url}")
+            return self._goto_search_url(page, search_url, warm)
+
+        # UI 點選的結果也是固定的搜尋 URL，先查快取
+        ttl = float(config.get('search_url_cache_ttl', 24) or 0)
+        cache_key = search_cache_key(keyword, filters)
+        cached_url = get_cached_search_url(cache_key, ttl) if ttl > 0 else None
+        if cached_url:
+            print(f"\n使用快取的搜尋網址: {cached_url}")
+            if not self._goto_search_url(page, cached_url, warm):
+                return False
+
+            if self._has_results(page):
+                return True
+
+            print("快取的搜尋網址沒有職缺，清除快取並重新套用篩選")
+            invalidate_search_url(cache_key)
+
+        print("\n正在前往 104 首頁...")
+        host_limiter.acquire(BASE_URL)
+        with rate_governor.track():
+            page.goto(BASE_URL, wait_until='domcontentloaded')
+        random_delay(2, 3)
+
+        if not handle_captcha_if_detected(page, "進入首頁"):
+            return False
+
+        self._close_popups(page)
+        self._search_keyword(page, keyword)
+        self._apply_filters(page, config)
+
+        if not handle_captcha_if_detected(page, "套用篩選"):
+            return False
+
+        if ui_templates is not None:
+            ui_templates[template_key] = page.url
+        if ttl > 0 and self._has_results(page):
+            save_search_url(cache_key, page.url, keyword)
+        return True
+
+    def _goto_search_url(self, page: Page, search_url: str, warm: bool = False) -> bool:
+        """直接前往搜尋結果 URL"""
+        host_limiter.acquire(search_url)
+        with rate_governor.track():
+            page.goto(search_url, wait_until='domcontentloaded')
+        random_delay(2, 3)
+
+        if not handle_captcha_if_detected(page, "前往搜尋結果"):
+            return False
+
+        if not warm:
+            self._close_popups(page)
+        return True
+
+    def _has_results(self, page: Page) -> bool:
+        """搜尋結果頁是否有職缺卡片 (等待列表渲染)"""
+        try:
+            page.locator(self.CARD_SELECTOR).first.wait_for(timeout=10000)
+            return True
+        except Exception:
+            return False
 
     def _close_popups(self, page: Page) -> None:
         """關閉各種彈窗"""
@@ -184,44 +715,25 @@ class JobSearcher:
 
     def _apply_filters(self, page: Page, config: dict | None = None) -> None:
         """套用篩選條件（從 config 覆蓋 DEFAULT_FILTERS）"""
-        filters = {**DEFAULT_FILTERS}
-        if config:
-            if 'area_indices' in config:
-                filters['area_indices'] = config['area_indices']
-            if 'job_type' in config:
-                filters['job_type'] = config['job_type']
-            if 'experience' in config:
-                filters['experience'] = config['experience']
-            if 'remote_work' in config:
-                filters['remote_work'] = config['remote_work']
-            if 'benefits' in config:
-                filters['benefits'] = config['benefits']
-            if 'job_categories' in config:
-                filters['job_categories'] = config['job_categories']
-            # 向下相容：舊的單組格式自動轉換
-            elif 'job_cat_main' in config:
-                filters['job_categories'] = [{
-                    'main': config['job_cat_main'],
-                    'sub': config.get('job_cat_sub', ''),
-                    'titles': config.get('job_cat_titles', []),
-                }]
+        run_script(self.filter_script(page, self.resolve_filters(config)))
 
+    @staticmethod
+    def filter_script(page: Page, filters: dict) -> PageScript:
+        """
+        UI 點選篩選條件的流程 (sync / async engine 共用，見 core.page_script)
+
+        Args:
+            page: 首頁 (已輸入關鍵字)，sync 或 async 的 Page 皆可
+            filters: resolve_filters 的結果
+        """
         try:
             # ========== 地區 ==========
-            # 地區名稱對照表 (area_value -> 城市名)
-            AREA_NAMES = {
-                1: "台北市", 2: "新北市", 3: "宜蘭縣", 4: "基隆市", 5: "桃園市",
-                6: "新竹縣市", 7: "苗栗縣", 8: "台中市", 9: "彰化縣", 10: "南投縣",
-                11: "雲林縣", 12: "嘉義縣市", 13: "台南市", 14: "高雄市", 15: "屏東縣",
-                16: "台東縣", 17: "花蓮縣", 18: "澎湖縣", 19: "金門縣", 20: "連江縣",
-            }
-
             area_indices = filters.get("area_indices", [])
             if area_indices:
                 area_names_str = ", ".join(AREA_NAMES.get(v, str(v)) for v in area_indices)
                 print(f"設定地區: [{area_names_str}]")
-                page.get_by_role("button", name="地區 ").click()
-                random_delay(0.5, 1)
+                yield call(page.get_by_role("button", name="地區 "), 'click')
+                yield delay(0.5, 1)
 
                 # 104 的地區選單 DOM 結構：
                 # - 台北市 (area=1): 用 .category-item--level-two 的 first checkbox
@@ -242,17 +754,17 @@ class JobSearcher:
                             locator = page.locator(sub_selector_tpl.format(nth=nth))
                             print(f"  [{i+1}/{len(area_indices)}] 勾選 {city} (nth-child={nth})")
 
-                        locator.scroll_into_view_if_needed(timeout=3000)
-                        locator.check(timeout=5000)
+                        yield call(locator, 'scroll_into_view_if_needed', timeout=3000)
+                        yield call(locator, 'check', timeout=5000)
                         print(f"  ✓ {city}")
                     except Exception as e:
                         print(f"  ✗ {city} 失敗: {e}")
-                    random_delay(0.3, 0.5)
+                    yield delay(0.3, 0.5)
 
-                random_delay(1, 1.5)
+                yield delay(1, 1.5)
 
-                page.locator("button.category-picker-btn-primary").click()
-                random_delay(1.5, 2.5)
+                yield call(page.locator("button.category-picker-btn-primary"), 'click')
+                yield delay(1.5, 2.5)
                 print("  ✓ 地區選擇完成")
 
             # ========== 職務類別 (多組) ==========
@@ -267,17 +779,17 @@ class JobSearcher:
                     continue
 
                 print(f"設定職務類別: {job_cat_main} > {job_cat_sub}")
-                page.get_by_role("button", name="職務類別 ").click()
-                random_delay(0.5, 1)
+                yield call(page.get_by_role("button", name="職務類別 "), 'click')
+                yield delay(0.5, 1)
 
                 # 1. 點擊大類 (文字匹配)
-                page.locator("a").filter(has_text=job_cat_main).click()
-                random_delay(0.3, 0.5)
+                yield call(page.locator("a").filter(has_text=job_cat_main), 'click')
+                yield delay(0.3, 0.5)
                 print(f"  ✓ 大類: {job_cat_main}")
 
                 # 2. 點擊中類 (文字匹配)
-                page.locator("a").filter(has_text=job_cat_sub).click()
-                random_delay(0.3, 0.5)
+                yield call(page.locator("a").filter(has_text=job_cat_sub), 'click')
+                yield delay(0.3, 0.5)
                 print(f"  ✓ 中類: {job_cat_sub}")
 
                 # 3. 勾選個別職務
@@ -288,122 +800,157 @@ class JobSearcher:
                         if i == 0:
                             locator = page.locator("a").filter(has_text=re.compile(f"^{re.escape(title)}$"))
                             print(f"  [{i+1}/{len(job_cat_titles)}] 勾選 {title} (精確匹配)")
-                            locator.click()
+                            yield call(locator, 'click')
                         else:
                             locator = page.locator("a").filter(has_text=title)
-                            count = locator.count()
+                            count = yield call(locator, 'count')
                             print(f"  [{i+1}/{len(job_cat_titles)}] 勾選 {title} (匹配 {count} 個)")
                             if count > 1:
-                                locator.nth(3).click()
+                                yield call(locator.nth(3), 'click')
                             else:
-                                locator.click()
-                        random_delay(0.2, 0.4)
+                                yield call(locator, 'click')
+                        yield delay(0.2, 0.4)
                         print(f"  ✓ {title}")
                     except Exception as e:
                         print(f"  ✗ {title} 失敗: {e}")
 
-                random_delay(1, 1.5)
+                yield delay(1, 1.5)
 
-                page.get_by_text("確定").click()
-                random_delay(1.5, 2.5)
+                yield call(page.get_by_text("確定"), 'click')
+                yield delay(1.5, 2.5)
                 print(f"  ✓ 職務類別選擇完成: {job_cat_main} > {job_cat_sub}")
 
             # ========== 搜尋 ==========
-            page.get_by_role("button", name="搜尋").click()
-            page.wait_for_load_state('domcontentloaded')
-            random_delay(2, 3)
+            yield call(page.get_by_role("button", name="搜尋"), 'click')
+            yield call(page, 'wait_for_load_state', 'domcontentloaded')
+            yield delay(2, 3)
 
             # ========== 更多篩選條件 ==========
-            page.get_by_role("button", name=" 所有篩選條件").click()
-            random_delay(0.5, 1)
-
-            page.get_by_role("button", name="薪資待遇").nth(1).click()
-            random_delay(0.3, 0.5)
-            page.get_by_role("button", name="40,000 以上", exact=True).click()
-            random_delay(0.3, 0.5)
-            print(f"  ✓ 薪資: 40,000 以上")
-
-            # ========== 地點距離 ==========
-            remote_work = filters.get("remote_work", [])
-            if remote_work:
-                page.get_by_role("button", name="地點距離").click()
-                random_delay(0.3, 0.5)
-                for rw in remote_work:
-                    try:
-                        page.get_by_role("button", name=rw).click()
-                        random_delay(0.2, 0.4)
-                        print(f"  ✓ 地點距離: {rw}")
-                    except:
-                        print(f"  ⚠ 找不到地點距離按鈕: {rw}")
-
-            # ========== 福利制度 ==========
-            benefits = filters.get("benefits", [])
-            if benefits:
-                page.get_by_role("button", name="福利制度").click()
-                random_delay(0.3, 0.5)
-                for ben in benefits:
+            yield call(page.get_by_role("button", name=" 所有篩選條件"), 'click')
+            yield delay(0.5, 1)
+
+            salary_min = int(filters.get("salary_min") or 0)
+            if salary_min > 0:
+                yield call(page.get_by_role("button", name="薪資待遇").nth(1), 'click')
+                yield delay(0.3, 0.5)
+                yield call(page.get_by_role("button", name=f"{salary_min:,} 以上", exact=True), 'click')
+                yield delay(0.3, 0.5)
+                print(f"  ✓ 薪資: {salary_min:,} 以上")
+
+            # ========== 地點距離 / 福利制度 ==========
+            for panel, values, label in (
+                ("地點距離", filters.get("remote_work", []), "地點距離"),
+                ("福利制度", filters.get("benefits", []), "福利"),
+            ):
+                if not values:
+                    continue
+                yield call(page.get_by_role("button", name=panel), 'click')
+                yield delay(0.3, 0.5)
+                for value in values:
                     try:
-                        page.get_by_role("button", name=ben).click()
-                        random_delay(0.2, 0.4)
-                        print(f"  ✓ 福利: {ben}")
-                    except:
-                        print(f"  ⚠ 找不到福利按鈕: {ben}")
+                        yield call(page.get_by_role("button", name=value), 'click')
+                        yield delay(0.2, 0.4)
+                        print(f"  ✓ {label}: {value}")
+                    except Exception:
+                        print(f"  ⚠ 找不到{label}按鈕: {value}")
 
-            page.get_by_role("button", name="工作要求").click()
-            random_delay(0.3, 0.5)
+            yield call(page.get_by_role("button", name="工作要求"), 'click')
+            yield delay(0.3, 0.5)
 
             for exp in filters.get("experience", []):
                 try:
-                    page.get_by_role("button").filter(has_text=exp).first.click()
-                    random_delay(0.2, 0.4)
+                    yield call(page.get_by_role("button").filter(has_text=exp).first, 'click')
+                    yield delay(0.2, 0.4)
                     print(f"  ✓ 經歷: {exp}")
-                except:
+                except Exception:
                     print(f"  ⚠ 找不到經歷按鈕: {exp}")
-                    pass
 
             job_type = filters.get("job_type", "全職")
             if job_type != "all":
-                page.get_by_text(job_type).click()
-                random_delay(0.3, 0.5)
+                yield call(page.get_by_text(job_type), 'click')
+                yield delay(0.3, 0.5)
                 print(f"  ✓ 工作性質: {job_type}")
             else:
                 print(f"  ✓ 工作性質: 全部（不篩選）")
 
             update_time = filters.get("update_time", "一個月內")
-            page.get_by_role("button", name=update_time).click()
-            random_delay(0.3, 0.5)
+            yield call(page.get_by_role("button", name=update_time), 'click')
+            yield delay(0.3, 0.5)
             print(f"  ✓ 更新時間: {update_time}")
 
-            page.get_by_role("button", name=re.compile(r"搜出好工作")).click()
-            page.wait_for_load_state('domcontentloaded')
-            random_delay(2, 3)
+            yield call(page.get_by_role("button", name=re.compile(r"搜出好工作")), 'click')
+            yield call(page, 'wait_for_load_state', 'domcontentloaded')
+            yield delay(2, 3)
 
             print("篩選條件套用完成!")
 
         except Exception as e:
             print(f"套用篩選條件時發生錯誤: {e}")
 
-    def _goto_next_page(self, page: Page, next_page_num: int) -> bool:
-        """前往下一頁，回傳是否成功"""
+    def _prefetch_page(self, browser_ctx: BrowserContext, tab: Page | None, search_url: str, page_num: int, capture: SearchCapture | None) -> Page | None:
+        """
+        在背景 tab 開始載入指定頁 (只等到 commit，不阻塞目前頁的處理)
+
+        Returns:
+            預載用的 tab；失敗回傳 None (改用點擊翻頁)
+        """
+        try:
+            if tab is None:
+                tab = browser_ctx.new_page()
+                if capture is not None:
+                    capture.attach(tab)
+            next_url = search_url_builder.with_page(search_url, page_num)
+            host_limiter.acquire(next_url)
+            tab.goto(next_url, wait_until='commit')
+            print(f"[Page {page_num}] 背景預載中...")
+            return tab
+        except Exception as e:
+            print(f"[Page {page_num}] 預載失敗，改用點擊翻頁: {e}")
+            return None
+
+    def _switch_to_prefetched(self, tab: Page, next_page_num: int) -> bool:
+        """切換到已預載的下一頁"""
+        try:
+            tab.wait_for_load_state('domcontentloaded')
+            tab.bring_to_front()
+
+            if not handle_captcha_if_detected(tab, f"翻到第 {next_page_num} 頁"):
+                return False
+
+            print(f"[Page {next_page_num}] 切換到預載的第 {next_page_num} 頁")
+            return True
+        except Exception as e:
+            print(f"切換預載頁失敗: {e}")
+            return False
+
+    def _goto_next_page(self, page: Page, next_page_num: int) -> str:
+        """
+        前往下一頁
+
+        Returns:
+            'ok' = 成功 / 'end' = 沒有下一頁的按鈕 (最後一頁) / 'failed' = 驗證逾時或翻頁錯誤
+        """
         try:
             page_btn = page.get_by_role("link", name=str(next_page_num), exact=True).first
             if page_btn.is_visible():
                 page_btn.scroll_into_view_if_needed()
                 random_delay(0.5, 1)
-                page_btn.click()
-                page.wait_for_load_state('domcontentloaded')
+                host_limiter.acquire(page.url)
+                with rate_governor.track():
+                    page_btn.click()
+                    page.wait_for_load_state('domcontentloaded')
                 random_delay(2, 3)
 
                 if not handle_captcha_if_detected(page, f"翻到第 {next_page_num} 頁"):
-                    return False
+                    return 'failed'
 
                 print(f"[Page {next_page_num}] 成功前往第 {next_page_num} 頁")
-                return True
+                return 'ok'
             else:
-                return False
+                return 'end'
         except Exception as e:
             print(f"翻頁失敗: {e}")
-            return False
+            return 'failed'
 
 
 # 全域實例
@@ -0,0 +1,139 @@
+"""
+頁面流程腳本 — 同一份流程給 sync / async 兩種 engine 執行
+
+流程寫成 generator，yield 要做的瀏覽器操作 (下方的 call / delay / captcha ...)，
+執行端實際呼叫 Playwright 後把結果 send 回去；操作拋出的例外會 throw 回 generator，
+由流程本身的 try/except 處理。generator 的 return 值就是 run_script 的回傳值。
+"""
+
+import time
+import asyncio
+from contextlib import nullcontext
+from collections.abc import Generator
+from utils import (
+    random_delay, handle_captcha_if_detected, human_like_long_break,
+    async_random_delay, async_handle_captcha_if_detected, async_human_like_long_break,
+    rate_governor, host_limiter,
+)
+
+Action = tuple
+PageScript = Generator[Action, object, object]
+
+
+def call(target: object, method: str, *args: object, **kwargs: object) -> Action:
+    """呼叫 page / locator 的方法 (async engine 會 await)"""
+    return ('call', target, method, args, kwargs)
+
+
+def delay(min_sec: float, max_sec: float) -> Action:
+    """隨機延遲"""
+    return ('delay', min_sec, max_sec)
+
+
+def sleep(seconds: float) -> Action:
+    """固定延遲"""
+    return ('sleep', seconds)
+
+
+def captcha(page: object, action_name: str) -> Action:
+    """檢測並處理驗證，送回 True=沒有驗證或已完成"""
+    return ('captcha', page, action_name)
+
+
+def popup(page: object, button: object) -> Action:
+    """點擊會開新分頁的按鈕，送回新分頁 (經過主機限流與速率量測)"""
+    return ('popup', page, button)
+
+
+def rest(level: str = 'long') -> Action:
+    """長休息：自適應速率啟用時依目前速率，否則 human_like_long_break"""
+    return ('rest', level)
+
+
+def run_script(script: PageScript) -> object:
+    """用 sync Playwright 執行流程"""
+    result, error = None, None
+    while True:
+        try:
+            action = script.throw(error) if error is not None else script.send(result)
+        except StopIteration as stop:
+            return stop.value
+        result, error = None, None
+        try:
+            result = _perform(action)
+        except Exception as e:
+            error = e
+
+
+async def run_script_async(script: PageScript, popup_lock: asyncio.Lock | None = None) -> object:
+    """
+    用 async Playwright 執行流程
+
+    Args:
+        popup_lock: 同一頁同時點多個會開 popup 的按鈕時，用 lock 確保拿到的是自己的 popup
+    """
+    result, error = None, None
+    while True:
+        try:
+            action = script.throw(error) if error is not None else script.send(result)
+        except StopIteration as stop:
+            return stop.value
+        result, error = None, None
+        try:
+            result = await _perform_async(action, popup_lock)
+        except Exception as e:
+            error = e
+
+
+# ── Private ──
+
+def _perform(action: Action) -> object:
+    kind = action[0]
+    if kind == 'call':
+        _, target, method, args, kwargs = action
+        return getattr(target, method)(*args, **kwargs)
+    if kind == 'delay':
+        return random_delay(action[1], action[2])
+    if kind == 'sleep':
+        return time.sleep(action[1])
+    if kind == 'captcha':
+        return handle_captcha_if_detected(action[1], action[2])
+    if kind == 'popup':
+        _, page, button = action
+        host_limiter.acquire(page.url)
+        with rate_governor.track():
+            with page.expect_popup() as popup_info:
+                button.click()
+            return popup_info.value
+    if kind == 'rest':
+        if rate_governor.enabled:
+            return rate_governor.wait(action[1])
+        return human_like_long_break()
+    raise ValueError(f"未知的頁面操作: {kind}")
+
+
+async def _perform_async(action: Action, popup_lock: asyncio.Lock | None) -> object:
+    kind = action[0]
+    if kind == 'call':
+        _, target, method, args, kwargs = action
+        return await getattr(target, method)(*args, **kwargs)
+    if kind == 'delay':
+        return await async_random_delay(action[1], action[2])
+    if kind == 'sleep':
+        return await asyncio.sleep(action[1])
+    if kind == 'captcha':
+        return await async_handle_captcha_if_detected(action[1], action[2])
+    if kind == 'popup':
+        _, page, button = action
+        await host_limiter.async_acquire(page.url)
+        async with popup_lock or nullcontext():
+            with rate_governor.track():
+                async with page.expect_popup() as popup_info:
+                    await button.click()
+                return await popup_info.value
+    if kind == 'rest':
+        if rate_governor.enabled:
+            return await rate_governor.async_wait(action[1])
+        return await async_human_like_long_break()
+    raise ValueError(f"未知的頁面操作: {kind}")
+
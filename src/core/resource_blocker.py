@@ -0,0 +1,135 @@
+"""
+資源攔截 — 用 context.route 擋掉圖片 / 字型 / 影音 / 廣告追蹤等不需要的請求
+"""
+
+import logging
+from urllib.parse import urlsplit
+from playwright.sync_api import BrowserContext, Route, Request
+from playwright.async_api import BrowserContext as AsyncBrowserContext, Route as AsyncRoute
+from config import BLOCK_PRESETS, BLOCKED_SIZE_ESTIMATE
+
+logger = logging.getLogger(__name__)
+
+
+class ResourceBlocker:
+    """
+    context 層級的請求過濾規則 + 本次執行的攔截統計
+
+    判斷順序：allow_domains 放行 → deny_domains 攔截 → block_types 攔截 → 其他放行。
+    注意：Playwright 啟用 route 後 Chromium 會停用 HTTP cache。
+    """
+
+    def __init__(
+        self,
+        preset: str = 'stealth-safe',
+        block_types: list[str] | None = None,
+        deny_domains: list[str] | None = None,
+        allow_domains: list[str] | None = None,
+    ) -> None:
+        """
+        Args:
+            preset: BLOCK_PRESETS 的名稱
+            block_types / deny_domains / allow_domains: 追加在 preset 之上的規則
+        """
+        if preset not in BLOCK_PRESETS:
+            raise ValueError(f"未知的攔截預設: {preset} (可用: {', '.join(BLOCK_PRESETS)})")
+
+        rules = BLOCK_PRESETS[preset]
+        self.preset: str = preset
+        self.block_types: set[str] = set(rules['block_types']) | set(block_types or [])
+        self.deny_domains: tuple[str, ...] = tuple(rules['deny_domains']) + tuple(deny_domains or [])
+        self.allow_domains: tuple[str, ...] = tuple(rules['allow_domains']) + tuple(allow_domains or [])
+
+        self.allowed: int = 0
+        self.blocked: int = 0
+        self.blocked_by_type: dict[str, int] = {}
+        self.bytes_saved: int = 0
+
+    @classmethod
+    def from_config(cls, config: dict | None) -> 'ResourceBlocker | None':
+        """依 RUN_CONFIG['block_resources'] 建立，'off' 或未設定時回傳 None"""
+        preset = (config or {}).get('block_resources', 'off') or 'off'
+        if preset == 'off':
+            return None
+        return cls(
+            preset,
+            block_types=(config or {}).get('block_types'),
+            deny_domains=(config or {}).get('block_domains'),
+            allow_domains=(config or {}).get('allow_domains'),
+        )
+
+    def attach(self, context: BrowserContext) -> None:
+        """在 context 上註冊攔截 (所有 page 都套用)"""
+        context.route("**/*", self._handle)
+        print(f"資源攔截: {self.preset}")
+
+    async def attach_async(self, context: AsyncBrowserContext) -> None:
+        """attach() 的 async 版本"""
+        await context.route("**/*", self._handle_async)
+        print(f"資源攔截: {self.preset}")
+
+    def should_block(self, url: str, resource_type: str) -> bool:
+        """判斷單一請求是否攔截"""
+        host = (urlsplit(url).hostname or '').lower()
+        if self._match(host, self.allow_domains):
+            return False
+        if self._match(host, self.deny_domains):
+            return True
+        return resource_type in self.block_types
+
+    def stats(self) -> dict[str, object]:
+        """本次執行的攔截統計"""
+        return {
+            'preset': self.preset,
+            'allowed': self.allowed,
+            'blocked': self.blocked,
+            'blocked_by_type': dict(self.blocked_by_type),
+            'bytes_saved': self.bytes_saved,
+        }
+
+    def print_summary(self) -> None:
+        """輸出攔截統計"""
+        total = self.allowed + self.blocked
+        if total == 0:
+            return
+        by_type = ', '.join(f"{t} {n}" for t, n in sorted(self.blocked_by_type.items(), key=lambda x: -x[1]))
+        print(f"[資源攔截] 攔截 {self.blocked}/{total} 個請求，估計節省 {self.bytes_saved / 1_000_000:.1f} MB")
+        if by_type:
+            print(f"  {by_type}")
+
+    # ── Private ──
+
+    def _match(self, host: str, domains: tuple[str, ...]) -> bool:
+        return any(host == d or host.endswith('.' + d) for d in domains)
+
+    def _record(self, request: Request) -> bool:
+        """記錄統計並回傳是否攔截"""
+        resource_type = request.resource_type
+        if not self.should_block(request.url, resource_type):
+            self.allowed += 1
+            return False
+
+        self.blocked += 1
+        self.blocked_by_type[resource_type] = self.blocked_by_type.get(resource_type, 0) + 1
+        self.bytes_saved += BLOCKED_SIZE_ESTIMATE.get(resource_type, 2_000)
+        logger.debug(f"攔截 [{resource_type}] {request.url}")
+        return True
+
+    def _handle(self, route: Route) -> None:
+        try:
+            if self._record(route.request):
+                route.abort('blockedbyclient')
+            else:
+                route.fallback()
+        except Exception as e:
+            # page 已關閉等情況，route 已失效
+            logger.debug(f"route 處理失敗: {e}")
+
+    async def _handle_async(self, route: AsyncRoute) -> None:
+        try:
+            if self._record(route.request):
+                await route.abort('blockedbyclient')
+            else:
+                await route.fallback()
+        except Exception as e:
+            logger.debug(f"route 處理失敗: {e}")
@@ -0,0 +1,164 @@
+"""
+搜尋結果 XHR 攔截 (network capture listing mode)
+
+104 的搜尋列表是 Vue app，由搜尋 API 回傳的 JSON 填入 .vue-recycle-scroller。
+這裡直接監聽該 response，從 JSON 組出職缺資料，不需要讀 DOM 或用 regex 猜欄位。
+"""
+
+import re
+import time
+import logging
+from playwright.sync_api import Page, Response
+from config import CSV_FIELDNAMES
+
+logger = logging.getLogger(__name__)
+
+
+class SearchCapture:
+    """監聽搜尋 API response，轉成與 CSV_FIELDNAMES 對應的職缺資料"""
+
+    # 搜尋 API (新版 /jobs/search/api/jobs，舊版 /jobs/search/list)
+    API_PATTERN: re.Pattern[str] = re.compile(r'/jobs/search/(api/jobs|list)(\?|$)')
+
+    # 薪資類型 (s10 / salaryType)
+    SALARY_TYPES: dict[int, str] = {10: '面議', 30: '時薪', 40: '日薪', 50: '月薪', 60: '年薪'}
+
+    # 學歷代碼 (optionEdu)
+    EDU_CODES: dict[int, str] = {1: '高中以下', 2: '高中', 3: '專科', 4: '大學', 5: '碩士', 6: '博士'}
+
+    # 「以上」的薪資上限值
+    _SALARY_OPEN_END: int = 9999999
+
+    def __init__(self) -> None:
+        self._pending: list[Response] = []
+        self.page_info: tuple[int, int] = (0, 0)  # 最近一次 take() 的 (目前頁, 最後一頁)
+
+    def attach(self, page: Page) -> None:
+        """在 page 上註冊 response 監聽 (要在觸發搜尋之前呼叫)"""
+        page.on("response", self._on_response)
+
+    def clear(self) -> None:
+        """丟棄尚未取用的 response (換關鍵字或翻頁前呼叫，避免取到上一頁的結果)"""
+        self._pending.clear()
+        self.page_info = (0, 0)
+
+    def is_last_page(self) -> bool:
+        """最近一次取得的結果已是最後一頁 (API 沒有分頁資訊時回傳 False)"""
+        current, last = self.page_info
+        return last > 0 and current >= last
+
+    def take(self, page: Page, timeout: float = 10) -> list[dict[str, str]] | None:
+        """
+        取出最新一筆搜尋結果
+
+        Args:
+            page: 監聽中的 page (等待期間讓 Playwright 派送事件)
+            timeout: 最長等待秒數
+
+        Returns:
+            職缺資料 list；逾時或解析失敗回傳 None (呼叫端應退回 DOM 模式)
+        """
+        deadline = time.time() + timeout
+        while not self._pending and time.time() < deadline:
+            page.wait_for_timeout(200)
+
+        responses, self._pending = self._pending, []
+        self.page_info = (0, 0)
+        # 同一頁可能有多次請求 (例如套用篩選前後)，以最後一筆為準
+        for response in reversed(responses):
+            try:
+                payload = response.json()
+                records = self.parse_payload(payload)
+                self.page_info = self.pagination(payload)
+                return records
+            except Exception as e:
+                logger.debug(f"搜尋 API 解析失敗 ({response.url}): {e}")
+        return None
+
+    def parse_payload(self, payload: dict) -> list[dict[str, str]]:
+        """
+        解析搜尋 API 的 JSON (可用 fixtures/104/ 下的合成範例離線測試)
+
+        Raises:
+            ValueError: 不是預期的搜尋結果格式
+        """
+        data = payload.get('data')
+        # 舊版: {"data": {"list": [...]}}，新版: {"data": [...]}
+        items = data.get('list') if isinstance(data, dict) else data
+        if not isinstance(items, list):
+            raise ValueError("找不到職缺列表 (data / data.list)")
+
+        return [record for record in (self.to_record(item) for item in items) if record['title']]
+
+    def pagination(self, payload: dict) -> tuple[int, int]:
+        """回傳 (目前頁, 最後一頁)，格式不符時為 (0, 0)"""
+        page_info = (payload.get('metadata') or {}).get('pagination') or {}
+        if not page_info and isinstance(payload.get('data'), dict):
+            page_info = payload['data']
+        try:
+            current = page_info.get('currentPage') or page_info.get('pageNo') or 0
+            last = page_info.get('lastPage') or page_info.get('totalPage') or 0
+            return int(current), int(last)
+        except (TypeError, ValueError):
+            return 0, 0
+
+    def to_record(self, item: dict) -> dict[str, str]:
+        """單筆 API 職缺 → CSV_FIELDNAMES 欄位 (詳細欄位留空，由策略補上)"""
+        record = {field: '' for field in CSV_FIELDNAMES}
+
+        record['title'] = (item.get('jobName') or '').strip()
+        record['url'] = self._job_url(item)
+        record['company'] = (item.get('custName') or '').strip()
+        record['location'] = (item.get('jobAddrNoDesc') or '').strip()
+        record['experience'] = self._experience(item)
+        record['education'] = self._education(item)
+        record['salary'] = self._salary(item)
+
+        return record
+
+    # ── Private ──
+
+    def _on_response(self, response: Response) -> None:
+        """response 事件 callback：只記錄，JSON 由 take() 在主流程讀取"""
+        if response.request.resource_type in ('xhr', 'fetch') and self.API_PATTERN.search(response.url) and response.ok:
+            self._pending.append(response)
+
+    def _job_url(self, item: dict) -> str:
+        link = item.get('link') or {}
+        href = link.get('job', '') if isinstance(link, dict) else str(link)
+        if href.startswith('//'):
+            return f"https:{href}"
+        return href
+
+    def _experience(self, item: dict) -> str:
+        if item.get('periodDesc'):
+            return item['periodDesc']
+        period = item.get('period')
+        if isinstance(period, int):
+            return f"{period}年以上" if period > 0 else '經歷不拘'
+        return ''
+
+    def _education(self, item: dict) -> str:
+        edu = item.get('optionEdu', item.get('eduDesc', ''))
+        if isinstance(edu, list):
+            names = [self.EDU_CODES.get(e, '') if isinstance(e, int) else str(e) for e in edu]
+            names = [n for n in names if n]
+            # 與列表頁顯示一致：只取最低要求
+            return names[0] if names else '學歷不拘'
+        return str(edu or '')
+
+    def _salary(self, item: dict) -> str:
+        if item.get('salaryDesc'):
+            return item['salaryDesc']
+
+        salary_type = self.SALARY_TYPES.get(int(item.get('s10') or item.get('salaryType') or 0), '')
+        low = int(item.get('salaryLow') or 0)
+        high = int(item.get('salaryHigh') or 0)
+
+        if not salary_type or salary_type == '面議' or (low == 0 and high == 0):
+            return '待遇面議'
+        if high == 0 or high >= self._SALARY_OPEN_END:
+            return f"{salary_type}{low:,}元以上"
+        if low == high:
+            return f"{salary_type}{low:,}元"
+        return f"{salary_type}{low:,}~{high:,}元"
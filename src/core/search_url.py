@@ -0,0 +1,123 @@
+"""
+搜尋 URL 編譯 — 把篩選條件直接轉成 104 搜尋網址
+"""
+
+from urllib.parse import urlencode, urlsplit, urlunsplit, parse_qsl
+from config import SEARCH_URL, AREA_CODES, SEARCH_PARAM_CODES
+
+
+class SearchUrlBuilder:
+    """篩選條件 → 104 搜尋 URL (一次 page.goto 取代逐一點選篩選按鈕)"""
+
+    def unsupported(self, filters: dict) -> list[str]:
+        """
+        列出無法用 URL 表達的篩選條件
+
+        職務類別與福利制度在 GUI 中以名稱選取，沒有對應的 URL 代碼表；
+        職務類別若帶有 'codes' (104 jobcat 代碼) 則可直接編譯。
+        """
+        problems = []
+
+        for area in filters.get('area_indices', []):
+            if area not in AREA_CODES:
+                problems.append(f"地區 {area}")
+
+        for group in filters.get('job_categories', []):
+            if group.get('titles') and not group.get('codes'):
+                problems.append(f"職務類別 {group.get('sub') or group.get('main')}")
+
+        if filters.get('benefits'):
+            problems.append("福利制度")
+
+        for key in ('experience', 'remote_work'):
+            for value in filters.get(key, []):
+                if value not in SEARCH_PARAM_CODES[key]:
+                    problems.append(f"{key}={value}")
+
+        job_type = filters.get('job_type', '全職')
+        if job_type != 'all' and job_type not in SEARCH_PARAM_CODES['job_type']:
+            problems.append(f"job_type={job_type}")
+
+        update_time = filters.get('update_time', '一個月內')
+        if update_time and update_time not in SEARCH_PARAM_CODES['update_time']:
+            problems.append(f"update_time={update_time}")
+
+        return problems
+
+    def build(self, keyword: str, filters: dict, page: int = 1) -> str | None:
+        """
+        編譯搜尋 URL
+
+        Args:
+            keyword: 搜尋關鍵字
+            filters: JobSearcher.resolve_filters() 的結果
+            page: 頁碼
+
+        Returns:
+            搜尋 URL；有無法表達的條件時回傳 None (呼叫端應改走 UI 點選)
+        """
+        if self.unsupported(filters):
+            return None
+
+        params: list[tuple[str, str]] = [('keyword', keyword)]
+
+        areas = [AREA_CODES[a] for a in filters.get('area_indices', [])]
+        if areas:
+            params.append(('area', ','.join(areas)))
+
+        jobcats = [code for group in filters.get('job_categories', []) for code in group.get('codes', [])]
+        if jobcats:
+            params.append(('jobcat', ','.join(jobcats)))
+
+        experience = [SEARCH_PARAM_CODES['experience'][e] for e in filters.get('experience', [])]
+        if experience:
+            params.append(('jobexp', ','.join(experience)))
+
+        job_type = filters.get('job_type', '全職')
+        if job_type != 'all':
+            params.append(('ro', SEARCH_PARAM_CODES['job_type'][job_type]))
+
+        remote = [SEARCH_PARAM_CODES['remote_work'][r] for r in filters.get('remote_work', [])]
+        if remote:
+            params.append(('remoteWork', ','.join(remote)))
+
+        update_time = filters.get('update_time', '一個月內')
+        if update_time:
+            params.append(('isnew', SEARCH_PARAM_CODES['update_time'][update_time]))
+
+        salary_min = int(filters.get('salary_min') or 0)
+        if salary_min > 0:
+            params.append(('scmin', str(salary_min)))
+            params.append(('sctp', 'M'))
+
+        if page > 1:
+            params.append(('page', str(page)))
+
+        return f"{SEARCH_URL}?{urlencode(params, safe=',')}"
+
+    def with_page(self, url: str, page: int) -> str:
+        """把既有搜尋 URL 換成指定頁碼"""
+        return self._replace_param(url, 'page', str(page) if page > 1 else None)
+
+    def page_of(self, url: str) -> int:
+        """搜尋 URL 的頁碼 (沒有 page 參數 = 第 1 頁)"""
+        page = dict(parse_qsl(urlsplit(url).query)).get('page', '1')
+        return int(page) if page.isdigit() else 1
+
+    def with_keyword(self, url: str, keyword: str) -> str:
+        """把既有搜尋 URL 換成另一個關鍵字 (其他篩選條件不變)"""
+        return self._replace_param(self.with_page(url, 1), 'keyword', keyword)
+
+    # ── Private ──
+
+    def _replace_param(self, url: str, key: str, value: str | None) -> str:
+        """替換 (value=None 時移除) query string 中的單一參數"""
+        parts = urlsplit(url)
+        query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k != key]
+        if value is not None:
+            query.append((key, value))
+        return urlunsplit(parts._replace(query=urlencode(query, safe=',')))
+
+
+# 全域實例
+search_url_builder = SearchUrlBuilder()
@@ -0,0 +1,218 @@
+"""
+多行程分片爬取 — 把關鍵字 / 地區 / 頁數範圍分給多個 process，最後合併輸出
+"""
+
+import io
+import os
+import sys
+import time
+import queue
+import multiprocessing as mp
+from config import AREA_NAMES
+from utils import save_jobs, dedupe_jobs, job_id_from_url, load_seen_index, mark_seen, save_seen_index
+from .job_searcher import JobSearcher
+
+# 分片方式
+SHARD_MODES: tuple[str, ...] = ('keyword', 'area', 'pages')
+
+
+def default_workers() -> int:
+    """預設 worker 數：依 CPU 核心數，每個 worker 一個 Chromium，上限 4 個"""
+    return max(1, min(os.cpu_count() or 1, 4))
+
+
+class ShardRunner:
+    """
+    多行程分片爬取
+
+    每個 worker process 各自執行 JobSearcher + StealthBrowser (自己的 Chromium)，
+    只收集資料不存檔；coordinator 等所有分片完成後依職缺 ID 去重，輸出成一份 save_jobs，
+    存檔成功後才把處理成功的職缺寫入已看過索引 (增量爬取)。
+    一律使用 spawn 啟動 process (Windows 只支援 spawn，且 fork 會複製 Playwright 的 thread 狀態)。
+    """
+
+    def __init__(self, workers: int = 0) -> None:
+        """
+        Args:
+            workers: 同時執行的 process 數 (0 = 依 CPU 核心數自動決定)
+        """
+        self.workers: int = workers if workers > 0 else default_workers()
+
+    def plan(self, keywords: list[str], config: dict, mode: str = 'keyword') -> list[dict]:
+        """
+        切分工作
+
+        Args:
+            keywords: 搜尋關鍵字
+            config: 執行設定
+            mode: keyword = 每個關鍵字一個分片 / area = 每個地區一個分片 / pages = 切分頁數範圍
+
+        Returns:
+            [{'shard_id', 'label', 'queries', 'pages'}]，queries 交給 JobSearcher.search_batch
+        """
+        pages = int(config.get('pages', 1) or 0)
+
+        if mode == 'pages':
+            if pages <= 1:
+                print("頁數分片需要指定 2 頁以上，改用關鍵字分片")
+                mode = 'keyword'
+            else:
+                return self._plan_pages(keywords, pages)
+
+        if mode == 'area':
+            areas = JobSearcher.resolve_filters(config).get('area_indices') or list(AREA_NAMES)
+            return [
+                {
+                    'shard_id': n,
+                    'label': AREA_NAMES.get(area, str(area)),
+                    'queries': [{'keyword': k, 'area_indices': [area]} for k in keywords],
+                    'pages': pages,
+                }
+                for n, area in enumerate(areas, 1)
+            ]
+
+        return [
+            {'shard_id': n, 'label': keyword, 'queries': [keyword], 'pages': pages}
+            for n, keyword in enumerate(keywords, 1)
+        ]
+
+    def run(self, keywords: list[str], config: dict, mode: str = 'keyword') -> list[dict]:
+        """
+        執行所有分片並合併結果
+
+        Returns:
+            去重後的職缺列表 (已用 save_jobs 儲存)
+        """
+        shards = self.plan(keywords, config, mode)
+        if not shards:
+            print("沒有可執行的分片")
+            return []
+
+        total = len(shards)
+        workers = min(self.workers, total)
+        print(f"\n[Shard] {total} 個分片，{workers} 個 process 並行")
+        for shard in shards:
+            print(f"  [Shard {shard['shard_id']}/{total}] {shard['label']}")
+
+        started = time.time()
+        results: dict[int, list[dict]] = {}
+        seen_entries: dict[str, str] = {}
+
+        ctx = mp.get_context('spawn')
+        with ctx.Manager() as manager:
+            log_queue = manager.Queue()
+            with ctx.Pool(workers) as pool:
+                pending = {
+                    shard['shard_id']: pool.apply_async(_run_shard, (shard, config, log_queue))
+                    for shard in shards
+                }
+                while pending:
+                    self._drain_logs(log_queue, total)
+                    for shard_id, result in list(pending.items()):
+                        if not result.ready():
+                            continue
+                        del pending[shard_id]
+                        try:
+                            results[shard_id], entries = result.get()
+                            seen_entries.update(entries)
+                            print(f"[Shard {shard_id}/{total}] ✓ {len(results[shard_id])} 個職缺 (已完成 {len(results)}/{total})")
+                        except Exception as e:
+                            results[shard_id] = []
+                            print(f"[Shard {shard_id}/{total}] ✗ 失敗: {e} (已完成 {len(results)}/{total})")
+                    time.sleep(0.2)
+                self._drain_logs(log_queue, total)
+
+        collected = [job for shard_id in sorted(results) for job in results[shard_id]]
+        jobs = dedupe_jobs(collected)
+
+        print(f"\n[Shard] 全部完成，耗時 {time.time() - started:.0f}s")
+        print(f"[Shard] 收集 {len(collected)} 個職缺，去除重複 {len(collected) - len(jobs)} 個")
+
+        if jobs:
+            save_jobs(jobs)
+            self._record_seen(jobs, seen_entries)
+        return jobs
+
+    # ── Private ──
+
+    def _plan_pages(self, keywords: list[str], pages: int) -> list[dict]:
+        """把 1..pages 切成連續的頁數範圍"""
+        count = min(self.workers, pages)
+        size, extra = divmod(pages, count)
+        shards = []
+        start = 1
+        for n in range(1, count + 1):
+            length = size + (1 if n <= extra else 0)
+            shards.append({
+                'shard_id': n,
+                'label': f"第 {start}-{start + length - 1} 頁",
+                'queries': [{'keyword': k, 'start_page': start} for k in keywords],
+                'pages': length,
+            })
+            start += length
+        return shards
+
+    def _record_seen(self, jobs: list[dict], seen_entries: dict[str, str]) -> None:
+        """已儲存且在分片中處理成功的職缺寫入已看過索引"""
+        saved_ids = {job_id_from_url(job.get('url') or '') for job in jobs}
+        index = load_seen_index()
+        recorded = 0
+        for job_id, content_hash in seen_entries.items():
+            if job_id in saved_ids:
+                mark_seen(index, job_id, content_hash)
+                recorded += 1
+        if recorded:
+            save_seen_index(index)
+        print(f"[Shard] 職缺索引: 記錄 {recorded} 個處理成功的職缺")
+
+    def _drain_logs(self, log_queue, total: int) -> None:
+        """把 worker 的輸出加上分片編號轉印到目前的 stdout (GUI log)"""
+        while True:
+            try:
+                shard_id, line = log_queue.get_nowait()
+            except queue.Empty:
+                return
+            print(f"[S{shard_id}/{total}] {line}")
+
+
+class _ShardLog(io.TextIOBase):
+    """worker 的 stdout：逐行送回 coordinator"""
+
+    def __init__(self, shard_id: int, log_queue) -> None:
+        self._shard_id: int = shard_id
+        self._queue = log_queue
+
+    def write(self, text: str) -> int:
+        for line in text.splitlines():
+            if line.strip():
+                self._queue.put((self._shard_id, line))
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+
+def _run_shard(shard: dict, config: dict, log_queue) -> tuple[list[dict], dict[str, str]]:
+    """
+    worker process 進入點 (module 層級，spawn 才能 pickle)
+
+    Returns:
+        (職缺列表, 處理成功的職缺 {job_id: 內容 hash})；已看過索引由 coordinator 存檔後記錄
+    """
+    sys.stdout = _ShardLog(shard['shard_id'], log_queue)
+    # 同一個瀏覽器 profile 不能同時被多個 process 使用；檢查點檔也只有一份
+    config = {**config, 'profile_name': f"shard-{shard['shard_id']}", 'checkpoint': False, 'record_seen': False}
+
+    from strategy import SaveStrategy
+    from .job_searcher import job_searcher
+
+    started = time.time()
+    jobs = job_searcher.search_batch(
+        shard['queries'],
+        pages=shard['pages'],
+        headless=bool(config.get('headless', True)),
+        config=config,
+        strategy=SaveStrategy(save_output=False),
+    )
+    print(f"分片完成: {len(jobs)} 個職缺，耗時 {time.time() - started:.0f}s")
+    return jobs, job_searcher.seen_entries
@@ -2,9 +2,16 @@
 瀏覽器設置
 """
 
+import json
 import random
 from playwright.sync_api import Playwright, Browser, BrowserContext
+from playwright.async_api import (
+    Playwright as AsyncPlaywright,
+    Browser as AsyncBrowser,
+    BrowserContext as AsyncBrowserContext,
+)
 from .auth_manager import AuthManager, auth_manager
+from .resource_blocker import ResourceBlocker
 from config.browser import USER_AGENTS, STEALTH_SCRIPT
 
 
@@ -14,7 +21,7 @@ class StealthBrowser:
     def __init__(self, auth: AuthManager = auth_manager):
         self.auth: AuthManager = auth
 
-    def setup(self, playwright: Playwright, headless: bool = False, use_session: bool = True) -> tuple[Browser, BrowserContext]:
+    def setup(self, playwright: Playwright, headless: bool = False, use_session: bool = True, blocker: ResourceBlocker | None = None) -> tuple[Browser, BrowserContext]:
         """
         建立 stealth 瀏覽器 + context
 
@@ -22,19 +29,89 @@ class StealthBrowser:
             playwright: Playwright 實例
             headless: 是否隱藏瀏覽器視窗
             use_session: 是否載入已儲存的 session
+            blocker: 資源攔截規則 (None = 不攔截)
 
         Returns:
             (browser, context)
         """
-        browser = playwright.chromium.launch(
-            headless=headless,
-            args=[
+        browser = self.launch(playwright, headless)
+        context = self.new_context(browser, use_session, blocker)
+
+        return browser, context
+
+    def launch(self, playwright: Playwright, headless: bool = False) -> Browser:
+        """只啟動瀏覽器 (常駐瀏覽器用，context 另外用 new_context 建立)"""
+        return playwright.chromium.launch(**self._launch_options(headless))
+
+    def new_context(self, browser: Browser, use_session: bool = True, blocker: ResourceBlocker | None = None) -> BrowserContext:
+        """在既有瀏覽器上建立 stealth context"""
+        context = browser.new_context(**self._context_options(use_session))
+        context.add_init_script(STEALTH_SCRIPT)
+        if blocker is not None:
+            blocker.attach(context)
+        return context
+
+    def setup_persistent(self, playwright: Playwright, profile_dir: str, headless: bool = False, use_session: bool = True, blocker: ResourceBlocker | None = None, max_cache_mb: float = 0) -> BrowserContext:
+        """
+        用持久化 profile 啟動 (launch_persistent_context)
+
+        HTTP cache、service worker 與 cookie 留在 profile_dir，下次執行不必重新下載 JS / CSS / 字型。
+        同一個 profile 同時只能被一個瀏覽器使用。
+
+        Args:
+            profile_dir: profile 目錄
+            max_cache_mb: Chromium 磁碟快取上限 (MB，0 = 預設)
+
+        Returns:
+            context (關閉 context 即關閉瀏覽器)
+        """
+        options = self._launch_options(headless)
+        if max_cache_mb > 0:
+            options['args'] = options['args'] + [f'--disk-cache-size={int(max_cache_mb * 1_000_000)}']
+
+        context_options = self._context_options(use_session=False)
+        context = playwright.chromium.launch_persistent_context(profile_dir, **options, **context_options)
+        context.add_init_script(STEALTH_SCRIPT)
+
+        # persistent context 不支援 storage_state，改成把 session 的 cookie 加進 profile
+        session_path = self.auth.get_session_path() if use_session else None
+        if session_path:
+            with open(session_path, 'r', encoding='utf-8') as f:
+                context.add_cookies(json.load(f).get('cookies', []))
+            print(f"已載入登入 session")
+
+        if blocker is not None:
+            # Playwright 啟用 route 時 Chromium 不使用 HTTP cache
+            print("注意: 資源攔截會停用 HTTP cache，profile 只保留 cookie / service worker")
+            blocker.attach(context)
+
+        return context
+
+    async def setup_async(self, playwright: AsyncPlaywright, headless: bool = False, use_session: bool = True, blocker: ResourceBlocker | None = None) -> tuple[AsyncBrowser, AsyncBrowserContext]:
+        """setup() 的 async 版本 (playwright.async_api)"""
+        browser = await playwright.chromium.launch(**self._launch_options(headless))
+        context = await browser.new_context(**self._context_options(use_session))
+        await context.add_init_script(STEALTH_SCRIPT)
+        if blocker is not None:
+            await blocker.attach_async(context)
+
+        return browser, context
+
+    # ── Private ──
+
+    def _launch_options(self, headless: bool) -> dict:
+        """chromium.launch 參數"""
+        return {
+            'headless': headless,
+            'args': [
                 '--disable-blink-features=AutomationControlled',
                 '--disable-infobars',
                 '--no-sandbox',
-            ]
-        )
+            ],
+        }
 
+    def _context_options(self, use_session: bool) -> dict:
+        """browser.new_context 參數 (含 session)"""
         session_path = self.auth.get_session_path() if use_session else None
 
         context_options = {
@@ -48,10 +125,7 @@ class StealthBrowser:
             context_options['storage_state'] = session_path
             print(f"已載入登入 session")
 
-        context = browser.new_context(**context_options)
-        context.add_init_script(STEALTH_SCRIPT)
-
-        return browser, context
+        return context_options
 
 
 # 全域實例
@@ -0,0 +1,195 @@
+"""
+詳細頁 tab 重複使用 — 不必每個職缺都 new_page() / close()
+"""
+
+import logging
+from contextlib import contextmanager, asynccontextmanager
+from collections.abc import Iterator, AsyncIterator
+from playwright.sync_api import BrowserContext, Page
+from playwright.async_api import BrowserContext as AsyncBrowserContext, Page as AsyncPage
+
+logger = logging.getLogger(__name__)
+
+# Chromium 的 performance.memory (JS heap 使用量)
+_HEAP_JS: str = "() => (performance.memory && performance.memory.usedJSHeapSize) || 0"
+
+
+class DetailTabPool:
+    """
+    長駐的詳細頁 tab，依序導向下一個職缺
+
+    每個 tab 用滿 max_uses 次、JS heap 超過 max_heap_mb 或發生錯誤時關閉，下次借用時再開新的。
+    同一時間借出幾個就會有幾個 tab (sync 逐一處理時只有一個)。
+    """
+
+    def __init__(self, browser_context: BrowserContext, max_uses: int = 50, max_heap_mb: float = 200.0) -> None:
+        self.browser_context: BrowserContext = browser_context
+        self.max_uses: int = max(1, max_uses)
+        self.max_heap_mb: float = max_heap_mb
+        self.created: int = 0
+        self.reused: int = 0
+        self.recycled: int = 0
+        self._idle: list[Page] = []
+        self._uses: dict[Page, int] = {}
+
+    @contextmanager
+    def tab(self) -> Iterator[Page]:
+        """借用一個 tab (發生例外時關閉該 tab，不放回)"""
+        page = self.acquire()
+        try:
+            yield page
+        except BaseException:
+            self.release(page, healthy=False)
+            raise
+        self.release(page)
+
+    def acquire(self) -> Page:
+        """取得閒置的 tab，沒有時開新的"""
+        while self._idle:
+            page = self._idle.pop()
+            if not page.is_closed():
+                self.reused += 1
+                return page
+            self._uses.pop(page, None)
+
+        page = self.browser_context.new_page()
+        self._uses[page] = 0
+        self.created += 1
+        return page
+
+    def release(self, page: Page, healthy: bool = True) -> None:
+        """歸還 tab：用滿次數、記憶體過大或狀態異常時關閉"""
+        uses = self._uses.get(page, 0) + 1
+        self._uses[page] = uses
+
+        reason = None
+        if not healthy or page.is_closed():
+            reason = '錯誤'
+        elif uses >= self.max_uses:
+            reason = f'已使用 {uses} 次'
+        else:
+            heap_mb = self._heap_mb(page)
+            if self.max_heap_mb > 0 and heap_mb > self.max_heap_mb:
+                reason = f'JS heap {heap_mb:.0f} MB'
+
+        if reason is None:
+            self._idle.append(page)
+            return
+
+        logger.debug(f"回收詳細頁 tab ({reason})")
+        self.recycled += 1
+        self._close(page)
+
+    def close(self) -> None:
+        """關閉所有閒置的 tab (借出中的由呼叫端歸還)"""
+        while self._idle:
+            self._close(self._idle.pop())
+
+    def summary(self) -> str:
+        """統計文字"""
+        return f"開啟 {self.created} 個 tab，重複使用 {self.reused} 次，回收 {self.recycled} 次"
+
+    # ── Private ──
+
+    def _heap_mb(self, page: Page) -> float:
+        if self.max_heap_mb <= 0:
+            return 0.0
+        try:
+            return page.evaluate(_HEAP_JS) / 1_000_000
+        except Exception:
+            return 0.0
+
+    def _close(self, page: Page) -> None:
+        self._uses.pop(page, None)
+        try:
+            page.close()
+        except Exception as e:
+            logger.debug(f"關閉 tab 失敗: {e}")
+
+
+class AsyncDetailTabPool:
+    """DetailTabPool 的 async 版本 (同時借出的數量由呼叫端的 semaphore 控制)"""
+
+    def __init__(self, browser_context: AsyncBrowserContext, max_uses: int = 50, max_heap_mb: float = 200.0) -> None:
+        self.browser_context: AsyncBrowserContext = browser_context
+        self.max_uses: int = max(1, max_uses)
+        self.max_heap_mb: float = max_heap_mb
+        self.created: int = 0
+        self.reused: int = 0
+        self.recycled: int = 0
+        self._idle: list[AsyncPage] = []
+        self._uses: dict[AsyncPage, int] = {}
+
+    @asynccontextmanager
+    async def tab(self) -> AsyncIterator[AsyncPage]:
+        """借用一個 tab (發生例外時關閉該 tab，不放回)"""
+        page = await self.acquire()
+        try:
+            yield page
+        except BaseException:
+            await self.release(page, healthy=False)
+            raise
+        await self.release(page)
+
+    async def acquire(self) -> AsyncPage:
+        """取得閒置的 tab，沒有時開新的"""
+        while self._idle:
+            page = self._idle.pop()
+            if not page.is_closed():
+                self.reused += 1
+                return page
+            self._uses.pop(page, None)
+
+        page = await self.browser_context.new_page()
+        self._uses[page] = 0
+        self.created += 1
+        return page
+
+    async def release(self, page: AsyncPage, healthy: bool = True) -> None:
+        """歸還 tab：用滿次數、記憶體過大或狀態異常時關閉"""
+        uses = self._uses.get(page, 0) + 1
+        self._uses[page] = uses
+
+        reason = None
+        if not healthy or page.is_closed():
+            reason = '錯誤'
+        elif uses >= self.max_uses:
+            reason = f'已使用 {uses} 次'
+        else:
+            heap_mb = await self._heap_mb(page)
+            if self.max_heap_mb > 0 and heap_mb > self.max_heap_mb:
+                reason = f'JS heap {heap_mb:.0f} MB'
+
+        if reason is None:
+            self._idle.append(page)
+            return
+
+        logger.debug(f"回收詳細頁 tab ({reason})")
+        self.recycled += 1
+        await self._close(page)
+
+    async def close(self) -> None:
+        """關閉所有閒置的 tab"""
+        while self._idle:
+            await self._close(self._idle.pop())
+
+    def summary(self) -> str:
+        """統計文字"""
+        return f"開啟 {self.created} 個 tab，重複使用 {self.reused} 次，回收 {self.recycled} 次"
+
+    # ── Private ──
+
+    async def _heap_mb(self, page: AsyncPage) -> float:
+        if self.max_heap_mb <= 0:
+            return 0.0
+        try:
+            return await page.evaluate(_HEAP_JS) / 1_000_000
+        except Exception:
+            return 0.0
+
+    async def _close(self, page: AsyncPage) -> None:
+        self._uses.pop(page, None)
+        try:
+            await page.close()
+        except Exception as e:
+            logger.debug(f"關閉 tab 失敗: {e}")
@@ -22,13 +22,14 @@ from __future__ import annotations
 import re
 import os
 import json
-import time
 import random
+import asyncio
 from typing import TYPE_CHECKING
 
 from .job_strategy import JobStrategy
 from config import MANUAL_HANDLE_DIR
-from utils import random_delay, human_like_pause, handle_captcha_if_detected, human_like_long_break
+from utils import rate_governor
+from core.page_script import PageScript, call, delay, sleep, captcha, popup, rest, run_script, run_script_async
 
 if TYPE_CHECKING:
     from .strategy_context import StrategyContext
@@ -37,6 +38,9 @@ if TYPE_CHECKING:
 class ApplyStrategy(JobStrategy):
     """自動投遞履歷"""
 
+    requires_card: bool = True  # 直接點卡片上的「應徵」按鈕
+    supports_async: bool = True
+
     def __init__(self) -> None:
         self.applied_count: int = 0
         self.skipped_count: int = 0
@@ -44,6 +48,8 @@ class ApplyStrategy(JobStrategy):
         self.pending_tabs: list[dict[str, object]] = []  # 保留未成功的 tabs 供檢查
         self.current_page: int = 1  # 當前頁碼
         self.page_manual_jobs: dict[int, list[dict[str, str]]] = {}  # {page_num: [{company, title}, ...]}
+        self._semaphore: asyncio.Semaphore | None = None  # async engine: 同時投遞的數量
+        self._popup_lock: asyncio.Lock | None = None  # async engine: 點擊應徵到拿到 popup 依序進行
 
     @property
     def name(self) -> str:
@@ -89,6 +95,26 @@ class ApplyStrategy(JobStrategy):
 
         print(f"    📁 已匯出 {len(jobs)} 個待處理職缺: page_{page_num}.json")
 
+    def checkpoint_state(self) -> dict[str, object]:
+        """投遞計數與待手動處理清單"""
+        return {
+            'applied_count': self.applied_count,
+            'skipped_count': self.skipped_count,
+            'failed_count': self.failed_count,
+            'current_page': self.current_page,
+            'page_manual_jobs': self.page_manual_jobs,
+        }
+
+    def restore_checkpoint(self, state: dict[str, object], job_count: int) -> list[dict[str, object]]:
+        """還原計數 (保留的 tab 在中斷時已關閉，只還原待處理清單)"""
+        self.applied_count = int(state.get('applied_count', 0))
+        self.skipped_count = int(state.get('skipped_count', 0))
+        self.failed_count = int(state.get('failed_count', 0))
+        self.current_page = int(state.get('current_page', 1))
+        # JSON 的 key 是字串
+        self.page_manual_jobs = {int(k): v for k, v in dict(state.get('page_manual_jobs', {})).items()}
+        return []
+
     def before_process(self, jobs: list[dict[str, object]], context: StrategyContext) -> None:
         """處理前確認"""
         print(f"\n[ApplyStrategy] 準備投遞 {len(jobs)} 個職缺")
@@ -102,19 +128,37 @@ class ApplyStrategy(JobStrategy):
             job: 職缺資料 (包含 card, job_index, company, title)
             context: 策略上下文 (包含 browser_context, page, delay_multiplier)
         """
-        job_index = job.get('job_index', 0)
+        return run_script(self._apply_script(job, context))
+
+    async def before_process_async(self, jobs: list[dict[str, object]], context: StrategyContext) -> None:
+        """處理前確認 (async engine)"""
+        self._semaphore = asyncio.Semaphore(max(1, int(context.config.get('apply_concurrency', 1) or 1)))
+        self._popup_lock = asyncio.Lock()
+        self.before_process(jobs, context)
+
+    async def process_job_async(self, job: dict[str, object], context: StrategyContext) -> bool:
+        """
+        process_job 的 async 版本 (流程相同)
+
+        最多 apply_concurrency 個職缺同時投遞；點擊「應徵」到拿到 popup 這段用 lock 依序進行，
+        避免同時點多張卡片時拿錯 popup，之後的驗證、確認送出與等待結果可以重疊
+        """
+        async with self._semaphore:
+            return await run_script_async(self._apply_script(job, context), popup_lock=self._popup_lock)
+
+    def _apply_script(self, job: dict[str, object], context: StrategyContext) -> PageScript:
+        """投遞流程 (sync / async engine 共用，見 core.page_script)"""
         company = job.get('company', '')
         title = job.get('title', '')
         card = job.get('card')  # 職缺卡片 locator
         page = context.page
-        browser_context = context.browser_context
         delay_multiplier = context.delay_multiplier
 
         try:
             # 先檢查是否已經應徵過
             already_applied = card.locator("div").filter(has_text=re.compile(r"^(近日已應徵|今日已應徵|已應徵)$")).first
-            if already_applied.is_visible(timeout=1000):
-                already_text = already_applied.inner_text().strip()
+            if (yield call(already_applied, 'is_visible', timeout=1000)):
+                already_text = (yield call(already_applied, 'inner_text')).strip()
                 print(f"    ⏭ 跳過 ({already_text})")
                 self.skipped_count += 1
                 return False
@@ -122,55 +166,51 @@ class ApplyStrategy(JobStrategy):
             # 找到卡片上的「應徵」按鈕
             apply_btn = card.locator("div").filter(has_text=re.compile(r"^應徵$")).nth(1)
 
-            if not apply_btn.is_visible(timeout=2000):
+            if not (yield call(apply_btn, 'is_visible', timeout=2000)):
                 print(f"    ✗ 找不到應徵按鈕")
                 self.failed_count += 1
                 return False
 
-            # 點擊應徵按鈕，會開新分頁
-            with page.expect_popup() as popup_info:
-                apply_btn.click()
-
-            # 新分頁 (應徵確認頁面)
-            apply_page = popup_info.value
+            # 點擊應徵按鈕，會開新分頁 (應徵確認頁面)
+            apply_page = yield popup(page, apply_btn)
 
             # 等待頁面載入 (Cloudflare 驗證可能需要幾秒)
-            random_delay(3 * delay_multiplier, 5 * delay_multiplier)
+            yield delay(3 * delay_multiplier, 5 * delay_multiplier)
 
             # CAPTCHA 檢測 (應徵頁面可能有 Cloudflare 驗證)
-            if not handle_captcha_if_detected(apply_page, f"應徵 {company}"):
-                apply_page.close()
+            if not (yield captcha(apply_page, f"應徵 {company}")):
+                yield call(apply_page, 'close')
                 self.failed_count += 1
                 return False
 
             # 點擊「確認送出」按鈕
             confirm_btn = apply_page.get_by_role("button", name=re.compile(r"確認送出"))
 
-            if not confirm_btn.is_visible(timeout=5000):
+            if not (yield call(confirm_btn, 'is_visible', timeout=5000)):
                 print(f"    ✗ 找不到確認送出按鈕")
-                apply_page.close()
+                yield call(apply_page, 'close')
                 self.failed_count += 1
                 return False
 
-            confirm_btn.click()
-            random_delay(2 * delay_multiplier, 3 * delay_multiplier)
+            yield call(confirm_btn, 'click')
+            yield delay(2 * delay_multiplier, 3 * delay_multiplier)
 
             # 等待「應徵成功」文字出現
             success_text = apply_page.get_by_text("應徵成功")
 
-            if success_text.is_visible(timeout=10000):
+            if (yield call(success_text, 'is_visible', timeout=10000)):
                 print(f"    ✓ 應徵成功")
                 self.applied_count += 1
-                apply_page.close()
+                yield call(apply_page, 'close')
 
-                # 應徵成功後隨機休息（降低 Cloudflare 檢測率）
-                human_like_long_break()
+                # 應徵成功後隨機休息（降低 Cloudflare 檢測率；自適應速率啟用時依目前速率）
+                yield rest('long')
 
-                # 每投遞 5 個，長休息 30-60 秒
-                if self.applied_count % 5 == 0:
+                # 每投遞 5 個，長休息 30-60 秒 (自適應速率啟用時由速率控制取代)
+                if not rate_governor.enabled and self.applied_count % 5 == 0:
                     break_time = random.uniform(30, 60)
                     print(f"\n    🎯 已投遞 {self.applied_count} 個，休息 {break_time:.0f} 秒...\n")
-                    time.sleep(break_time)
+                    yield sleep(break_time)
             else:
                 # ==================================================
                 # 沒看到「應徵成功」，可能的原因：
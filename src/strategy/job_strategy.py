@@ -12,7 +12,21 @@ if TYPE_CHECKING:
 
 
 class JobStrategy(ABC):
-    """職缺處理策略的抽象基類"""
+    """
+    職缺處理策略的抽象基類
+
+    supports_async = True 的策略須實作 async def process_job_async(job, context) -> bool：
+    AsyncJobSearcher 會對同一頁的職缺同時呼叫，並行上限由策略自行控制。
+    """
+
+    # 是否需要列表頁的卡片 locator (network 列表模式沒有卡片)
+    requires_card: bool = False
+
+    # 是否實作了 process_job_async (AsyncJobSearcher 開始前會檢查，不支援的策略改用 sync)
+    supports_async: bool = False
+
+    # 處理成功的職缺是否寫入已看過索引 (增量爬取用，只有產生輸出的策略才記錄)
+    records_seen: bool = False
 
     @property
     @abstractmethod
@@ -47,3 +61,43 @@ class JobStrategy(ABC):
     def after_process(self, jobs: list[dict[str, object]], context: StrategyContext) -> None:
         """處理後的收尾工作 (可選覆寫)"""
         pass
+
+    # ── 檢查點 (中斷後繼續執行) ──
+
+    def checkpoint_state(self) -> dict[str, object]:
+        """寫入檢查點的策略狀態 (計數器等，須可 JSON 序列化)"""
+        return {}
+
+    def restore_checkpoint(self, state: dict[str, object], job_count: int) -> list[dict[str, object]]:
+        """
+        從檢查點還原策略狀態 (before_process 之前呼叫)
+
+        Args:
+            job_count: 中斷時已列出的職缺數
+
+        Returns:
+            已處理的職缺 (位置即 job_index)；策略沒有保存職缺資料時回傳空 list
+        """
+        return []
+
+    def suspend(self, jobs: list[dict[str, object]], context: StrategyContext) -> None:
+        """中斷且保留檢查點時取代 after_process 的收尾 (預設照常收尾)"""
+        self.after_process(jobs, context)
+
+    def pending_job_indices(self) -> list[int]:
+        """已交給策略但尚未處理完成的職缺 (繼續執行時會重新處理)"""
+        return []
+
+    def failed_job_indices(self) -> list[int]:
+        """process_job 回傳成功、但之後才確定失敗的職缺 (如 worker pool 抓取失敗)"""
+        return []
+
+    # ── Async hooks (AsyncJobSearcher 使用) ──
+
+    async def before_process_async(self, jobs: list[dict[str, object]], context: StrategyContext) -> None:
+        """處理前的準備工作 (async engine，預設沿用同步版本)"""
+        self.before_process(jobs, context)
+
+    async def after_process_async(self, jobs: list[dict[str, object]], context: StrategyContext) -> None:
+        """處理後的收尾工作 (async engine，預設沿用同步版本)"""
+        self.after_process(jobs, context)
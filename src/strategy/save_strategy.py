@@ -4,23 +4,61 @@
 
 from __future__ import annotations
 
+import os
+import asyncio
+from contextlib import contextmanager, asynccontextmanager
+from collections.abc import Iterator, AsyncIterator
 from typing import TYPE_CHECKING
 
 from .job_strategy import JobStrategy
-from utils import save_jobs, smart_delay, human_like_pause
+from utils import (
+    save_jobs, smart_delay, human_like_pause, async_smart_delay, async_human_like_pause,
+    job_id_from_url, get_cached_detail, save_cached_detail,
+    JobStreamSink, read_stream, recover_streams, rate_governor, host_limiter,
+)
 from core.detail_scraper import detail_scraper
+from core.detail_fetcher import detail_fetcher
+from core.detail_pool import DetailWorkerPool
+from core.tab_pool import DetailTabPool, AsyncDetailTabPool
 
 if TYPE_CHECKING:
+    from playwright.sync_api import BrowserContext, Page
+    from playwright.async_api import BrowserContext as AsyncBrowserContext, Page as AsyncPage
     from .strategy_context import StrategyContext
 
 
 class SaveStrategy(JobStrategy):
     """儲存職缺資料到 CSV/JSON 檔案"""
 
-    def __init__(self) -> None:
+    supports_async: bool = True
+    records_seen: bool = True
+
+    def __init__(self, save_output: bool = True) -> None:
+        """
+        Args:
+            save_output: False = 只收集資料不存檔 (分片 worker 由 coordinator 合併後統一儲存)
+        """
+        self.save_output: bool = save_output
         self.filename: str | None = None
         self.job_count: int = 0
         self._jobs_buffer: list[dict[str, object]] = []  # 暫存職缺資料
+        self._pool: DetailWorkerPool | None = None  # detail_concurrency > 1 時使用
+        self._semaphore: asyncio.Semaphore | None = None  # async engine 的並行上限
+        self._tabs: DetailTabPool | AsyncDetailTabPool | None = None  # 重複使用的詳細頁 tab (detail_tab_reuse > 0)
+        self.cache_hits: int = 0
+        self.cache_misses: int = 0
+        self.http_hits: int = 0  # detail_fetch='http' 成功
+        self.http_fallbacks: int = 0  # detail_fetch='http' 失敗，改開詳細頁
+        self._sink: JobStreamSink | None = None  # stream_output 時逐筆寫入
+        self._queued: dict[int, dict[str, object]] = {}  # 已交給 worker pool、還沒完成的職缺
+        self._submitted: set[int] = set()  # 交給 worker pool 的 job_index (由 _on_pool_result 寫入串流)
+        self._pool_failed: set[int] = set()  # worker pool 沒有取得詳細資料的 job_index
+        self._resume_stream: str | None = None  # 從檢查點繼續時要接續寫入的串流檔
+
+    @property
+    def concurrent(self) -> bool:
+        """詳細頁是否交給 worker pool 並行抓取 (列表頁迴圈不需等待)"""
+        return self._pool is not None
 
     @property
     def name(self) -> str:
@@ -33,6 +71,27 @@ class SaveStrategy(JobStrategy):
     def before_process(self, jobs: list[dict[str, object]], context: StrategyContext) -> None:
         """處理前準備"""
         print(f"\n[SaveStrategy] 準備開始收集職缺資料")
+        self._open_stream(context)
+
+        concurrency = int(context.config.get('detail_concurrency', 1) or 1)
+        if concurrency > 1:
+            self._pool = DetailWorkerPool(
+                concurrency,
+                headless=bool(context.config.get('headless', True)),
+                human_like=context.human_like,
+                delay_multiplier=context.delay_multiplier,
+                block_resources=str(context.config.get('block_resources', 'off') or 'off'),
+                on_result=self._on_pool_result,
+                tab_reuse=int(context.config.get('detail_tab_reuse', 0) or 0),
+                tab_max_heap_mb=float(context.config.get('detail_tab_max_heap_mb', 0) or 0),
+            )
+            self._pool.start()
+        elif int(context.config.get('detail_tab_reuse', 0) or 0) > 0:
+            self._tabs = DetailTabPool(
+                context.browser_context,
+                max_uses=int(context.config['detail_tab_reuse']),
+                max_heap_mb=float(context.config.get('detail_tab_max_heap_mb', 0) or 0),
+            )
 
     def process_job(self, job: dict[str, object], context: StrategyContext) -> bool:
         """
@@ -42,6 +101,13 @@ class SaveStrategy(JobStrategy):
             job: 職缺資料 (包含 url, job_index)
             context: 策略上下文 (包含 browser_context, human_like, delay_multiplier)
         """
+        success = self._fetch_detail(job, context)
+        if job.get('job_index') not in self._submitted:
+            self._stream(job)
+        return success
+
+    def _fetch_detail(self, job: dict[str, object], context: StrategyContext) -> bool:
+        """快取 / worker pool / 直接開詳細頁抓取"""
         job_index = job.get('job_index', 0)
         url = job.get('url')
         company = job.get('company', '')
@@ -50,27 +116,47 @@ class SaveStrategy(JobStrategy):
         delay_multiplier = context.delay_multiplier
 
         self.job_count += 1
+
+        if self._use_cache(job, context):
+            print(f"  [Detail {self.job_count}] 使用快取")
+            return True
+
+        if self._http_enabled(context) and self._use_http(job, context, detail_fetcher.fetch(browser_context, url)):
+            print(f"  [Detail {self.job_count}] ✓ HTTP 取得詳細資料")
+            return True
+
+        if self._pool is not None:
+            # 交給 worker pool，結果在 after_process 依 job_index 合併
+            self._queued[job_index] = {k: v for k, v in job.items() if k != 'card'}
+            self._submitted.add(job_index)
+            # 先寫入列表資料 (詳細資料完成後再寫一筆，讀取時以後者為準)：當掉時檢查點也能還原這筆
+            self._stream(self._queued[job_index])
+            self._pool.submit(job_index, url)
+            print(f"  [Detail {self.job_count}] 已排入 ({self._pool.pending()} 個等待中)")
+            return True
+
         print(f"\n[Detail {self.job_count}] {company}")
 
         try:
-            # 開啟詳細頁面
-            detail_page = browser_context.new_page()
-            detail_page.goto(url, wait_until='domcontentloaded')
+            # 開啟詳細頁面 (重複使用 tab 時直接導向)
+            with self._detail_tab(browser_context) as detail_page:
+                host_limiter.acquire(url)
+                with rate_governor.track():
+                    detail_page.goto(url, wait_until='domcontentloaded')
 
-            # 根據 human_like 設定延遲
-            smart_delay(human_like, delay_multiplier, 'normal')
+                # 根據 human_like 設定延遲
+                smart_delay(human_like, delay_multiplier, 'normal')
 
-            # 抓取詳細資訊
-            detail = detail_scraper.scrape(detail_page)
+                # 抓取詳細資訊
+                detail = detail_scraper.scrape(detail_page)
 
-            if human_like == 'full':
-                human_like_pause(detail_page)
-
-            detail_page.close()
+                if human_like == 'full':
+                    human_like_pause(detail_page)
 
             if detail:
                 # 直接更新 job dict（會在 after_process 時一起儲存）
                 job.update(detail)
+                self._store_cache(url, detail, context)
                 print(f"  ✓ 已抓取詳細資料")
                 return True
             else:
@@ -81,12 +167,285 @@ class SaveStrategy(JobStrategy):
             print(f"  ✗ 錯誤: {e}")
             return False
 
+    async def before_process_async(self, jobs: list[dict[str, object]], context: StrategyContext) -> None:
+        """處理前準備 (async engine：用 semaphore 控制同時開啟的詳細頁數)"""
+        print(f"\n[SaveStrategy] 準備開始收集職缺資料 (async)")
+        self._open_stream(context)
+        concurrency = max(1, int(context.config.get('detail_concurrency', 1) or 1))
+        self._semaphore = asyncio.Semaphore(concurrency)
+        if int(context.config.get('detail_tab_reuse', 0) or 0) > 0:
+            # 最多同時借出 concurrency 個 tab
+            self._tabs = AsyncDetailTabPool(
+                context.browser_context,
+                max_uses=int(context.config['detail_tab_reuse']),
+                max_heap_mb=float(context.config.get('detail_tab_max_heap_mb', 0) or 0),
+            )
+
+    async def process_job_async(self, job: dict[str, object], context: StrategyContext) -> bool:
+        """process_job 的 async 版本，同一頁的職缺會在同一個 event loop 上重疊執行"""
+        success = await self._fetch_detail_async(job, context)
+        self._stream(job)
+        return success
+
+    async def _fetch_detail_async(self, job: dict[str, object], context: StrategyContext) -> bool:
+        url = job.get('url')
+        company = job.get('company', '')
+        human_like = context.human_like
+        delay_multiplier = context.delay_multiplier
+
+        async with self._semaphore:
+            self.job_count += 1
+            job_no = self.job_count
+
+            if self._use_cache(job, context):
+                print(f"  [Detail {job_no}] 使用快取")
+                return True
+
+            if self._http_enabled(context) and self._use_http(job, context, await detail_fetcher.fetch_async(context.browser_context, url)):
+                print(f"  [Detail {job_no}] ✓ HTTP 取得詳細資料")
+                return True
+
+            print(f"\n[Detail {job_no}] {company}")
+
+            try:
+                async with self._detail_tab_async(context.browser_context) as detail_page:
+                    await host_limiter.async_acquire(url)
+                    with rate_governor.track():
+                        await detail_page.goto(url, wait_until='domcontentloaded')
+                    await async_smart_delay(human_like, delay_multiplier, 'normal')
+                    detail = await detail_scraper.scrape_async(detail_page)
+
+                    if human_like == 'full':
+                        await async_human_like_pause(detail_page)
+
+                if detail:
+                    job.update(detail)
+                    self._store_cache(url, detail, context)
+                    print(f"  [Detail {job_no}] ✓ 已抓取詳細資料")
+                    return True
+                else:
+                    print(f"  [Detail {job_no}] ✗ 抓取失敗")
+                    return False
+
+            except Exception as e:
+                print(f"  [Detail {job_no}] ✗ 錯誤: {e}")
+                return False
+
+    async def after_process_async(self, jobs: list[dict[str, object]], context: StrategyContext) -> None:
+        """處理完成 (async engine：先關閉重複使用的 tab)"""
+        if isinstance(self._tabs, AsyncDetailTabPool):
+            await self._tabs.close()
+            print(f"\n[SaveStrategy] 詳細頁 tab: {self._tabs.summary()}")
+            self._tabs = None
+        self.after_process(jobs, context)
+
     def after_process(self, jobs: list[dict[str, object]], context: StrategyContext) -> None:
         """處理完成，儲存所有資料"""
-        if jobs:
+        self._finish_workers(jobs, context)
+
+        if not self.save_output:
+            print(f"\n[SaveStrategy] 完成! 收集 {len(jobs)} 個職缺 (由呼叫端儲存)")
+        elif self._sink is not None:
+            # 串流檔已經有全部資料：整理成 jobs_N 並刪除串流檔
+            sink, self._sink = self._sink, None
+            print(f"\n[SaveStrategy] 串流輸出 {sink.count} 筆，整理中...")
+            save_result = sink.compact()
+            if save_result:
+                self.filename = save_result['filename']
+                print(f"\n[SaveStrategy] 完成! 已儲存 {len(jobs)} 個職缺")
+                print(f"  檔案: {self.filename}")
+            else:
+                print(f"\n[SaveStrategy] 完成! 沒有職缺資料需要儲存")
+        elif jobs:
             save_result = save_jobs(jobs)
             self.filename = save_result['filename']
             print(f"\n[SaveStrategy] 完成! 已儲存 {len(jobs)} 個職缺")
             print(f"  檔案: {self.filename}")
         else:
             print(f"\n[SaveStrategy] 完成! 沒有職缺資料需要儲存")
+
+    def suspend(self, jobs: list[dict[str, object]], context: StrategyContext) -> None:
+        """中斷且保留檢查點：串流檔不整理，繼續執行時接續寫入 (沒有串流輸出時照常儲存)"""
+        if self._sink is None:
+            self.after_process(jobs, context)
+            return
+
+        self._finish_workers(jobs, context)
+        self._sink.close()
+        print(f"\n[SaveStrategy] 已中斷，串流檔保留到繼續執行: {self._sink.jsonl_path}")
+
+    def checkpoint_state(self) -> dict[str, object]:
+        """計數器與串流檔 (已處理的職缺從串流檔還原)"""
+        return {
+            'job_count': self.job_count,
+            'cache_hits': self.cache_hits,
+            'cache_misses': self.cache_misses,
+            'stream_path': self._sink.jsonl_path if self._sink is not None else None,
+        }
+
+    def restore_checkpoint(self, state: dict[str, object], job_count: int) -> list[dict[str, object]]:
+        """還原計數，並從串流檔依 job_index 還原已處理的職缺 (沒有串流檔時從頭開始)"""
+        self.job_count = int(state.get('job_count', 0))
+        self.cache_hits = int(state.get('cache_hits', 0))
+        self.cache_misses = int(state.get('cache_misses', 0))
+        self._resume_stream = state.get('stream_path') or None
+        if not self._resume_stream or not os.path.exists(self._resume_stream):
+            self._resume_stream = None
+            return []
+
+        jobs: list[dict[str, object]] = [{} for _ in range(job_count)]
+        for record in read_stream(self._resume_stream, keep_index=True):
+            job_index = record.pop('job_index', None)
+            if not isinstance(job_index, int) or job_index < 0:
+                continue
+            # 最後一次寫入檢查點之後才處理的職缺也在串流檔中
+            jobs.extend({} for _ in range(job_index + 1 - len(jobs)))
+            jobs[job_index] = record
+        return jobs
+
+    def pending_job_indices(self) -> list[int]:
+        """worker pool 中還沒完成的詳細頁"""
+        return sorted(list(self._queued))
+
+    def failed_job_indices(self) -> list[int]:
+        """worker pool 沒有取得詳細資料的職缺 (after_process 合併結果後才確定)"""
+        return sorted(self._pool_failed)
+
+    def _open_stream(self, context: StrategyContext) -> None:
+        """開啟串流輸出 (先整理上次中斷留下的檔案；從檢查點繼續時接續寫入原本的串流檔)"""
+        if not self.save_output or not context.config.get('stream_output'):
+            return
+        fsync_every = int(context.config.get('stream_fsync_every', 20) or 20)
+        if self._resume_stream and os.path.exists(self._resume_stream):
+            # 先開啟 (登記為使用中)，recover_streams 才不會把它整理掉
+            self._sink = JobStreamSink(fsync_every=fsync_every, resume_path=self._resume_stream)
+            print(f"[SaveStrategy] 接續串流輸出: {self._sink.jsonl_path}")
+        for result in recover_streams():
+            print(f"[SaveStrategy] 已救回上次中斷的資料: {result['filename']}")
+        if self._sink is None:
+            self._sink = JobStreamSink(fsync_every=fsync_every)
+            print(f"[SaveStrategy] 串流輸出: {self._sink.jsonl_path}")
+
+    def _stream(self, job: dict[str, object]) -> None:
+        """處理完成的職缺寫入串流"""
+        if self._sink is None:
+            return
+        try:
+            self._sink.append(job)
+        except Exception as e:
+            print(f"  [SaveStrategy] 串流寫入失敗: {e}")
+
+    def _on_pool_result(self, job_index: int, detail: dict[str, str] | None) -> None:
+        """worker pool 完成一筆 (worker thread)：合併詳細資料後寫入串流"""
+        job = self._queued.pop(job_index, None)
+        if job is not None:
+            self._stream({**job, **(detail or {})})
+
+    def _finish_workers(self, jobs: list[dict[str, object]], context: StrategyContext) -> None:
+        """等待 worker pool、關閉重複使用的 tab，並印出快取 / HTTP 統計"""
+        if self._pool is not None:
+            self._merge_pool_results(jobs, context)
+            self._stream_unfinished(jobs)
+
+        if isinstance(self._tabs, DetailTabPool):
+            self._tabs.close()
+            print(f"\n[SaveStrategy] 詳細頁 tab: {self._tabs.summary()}")
+            self._tabs = None
+
+        if self.cache_hits or self.cache_misses:
+            total = self.cache_hits + self.cache_misses
+            print(f"\n[SaveStrategy] 詳細頁快取: 命中 {self.cache_hits} / {total} ({self.cache_hits / total:.0%})，重新抓取 {self.cache_misses}")
+
+        if self.http_hits or self.http_fallbacks:
+            print(f"[SaveStrategy] HTTP 詳細資料: 成功 {self.http_hits}，改開詳細頁 {self.http_fallbacks}")
+
+    def _stream_unfinished(self, jobs: list[dict[str, object]]) -> None:
+        """
+        worker pool 沒有回報結果的職缺 (worker 全部結束、on_result 失敗) 以目前的資料
+        (含 join 取得的詳細資料) 再寫一次串流，整理出的輸出才不會漏掉結果。
+        仍保留在 pending_job_indices，繼續執行時會重抓。
+        """
+        for job_index, job in sorted(dict(self._queued).items()):
+            current = jobs[job_index] if 0 <= job_index < len(jobs) else {}
+            self._stream({**job, **current, 'job_index': job_index})
+
+    @contextmanager
+    def _detail_tab(self, browser_context: BrowserContext) -> Iterator[Page]:
+        """詳細頁 tab：有 tab pool 時借用，否則開新的、用完關閉"""
+        if self._tabs is not None:
+            with self._tabs.tab() as page:
+                yield page
+            return
+
+        page = browser_context.new_page()
+        try:
+            yield page
+        finally:
+            page.close()
+
+    @asynccontextmanager
+    async def _detail_tab_async(self, browser_context: AsyncBrowserContext) -> AsyncIterator[AsyncPage]:
+        """_detail_tab 的 async 版本"""
+        if self._tabs is not None:
+            async with self._tabs.tab() as page:
+                yield page
+            return
+
+        page = await browser_context.new_page()
+        try:
+            yield page
+        finally:
+            await page.close()
+
+    def _use_cache(self, job: dict[str, object], context: StrategyContext) -> bool:
+        """詳細頁快取命中時直接填入 job，不開詳細頁"""
+        ttl = float(context.config.get('detail_cache_ttl', 0) or 0)
+        job_id = job_id_from_url(str(job.get('url') or ''))
+        if ttl <= 0 or not job_id:
+            return False
+
+        detail = get_cached_detail(job_id, ttl)
+        if detail is None:
+            self.cache_misses += 1
+            return False
+
+        job.update(detail)
+        self.cache_hits += 1
+        return True
+
+    def _http_enabled(self, context: StrategyContext) -> bool:
+        """detail_fetch='http'：先用 APIRequestContext 取內容，不開詳細頁"""
+        return context.config.get('detail_fetch', 'browser') == 'http'
+
+    def _use_http(self, job: dict[str, object], context: StrategyContext, detail: dict[str, str] | None) -> bool:
+        """HTTP 抓取的結果：成功就填入 job，失敗由呼叫端改開詳細頁"""
+        if not detail:
+            self.http_fallbacks += 1
+            return False
+
+        job.update(detail)
+        self._store_cache(job.get('url'), detail, context)
+        self.http_hits += 1
+        return True
+
+    def _store_cache(self, url: str | None, detail: dict[str, str], context: StrategyContext) -> None:
+        """把剛抓到的詳細資料寫入快取"""
+        job_id = job_id_from_url(url or '')
+        if job_id and float(context.config.get('detail_cache_ttl', 0) or 0) > 0:
+            save_cached_detail(job_id, detail)
+
+    def _merge_pool_results(self, jobs: list[dict[str, object]], context: StrategyContext) -> None:
+        """等待 worker pool 完成，依 job_index 把詳細資料合併回 jobs"""
+        print(f"\n[SaveStrategy] 等待詳細頁 worker 完成...")
+        results = self._pool.join()
+        self._pool = None
+
+        success = 0
+        for job_index, detail in results.items():
+            if detail and 0 <= job_index < len(jobs):
+                jobs[job_index].update(detail)
+                self._store_cache(jobs[job_index].get('url'), detail, context)
+                success += 1
+            else:
+                self._pool_failed.add(job_index)
+        print(f"[SaveStrategy] 詳細資料: 成功 {success} / {len(results)}")
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from playwright.sync_api import BrowserContext, Page
+    from playwright.async_api import BrowserContext as AsyncBrowserContext, Page as AsyncPage
     from .job_strategy import JobStrategy
 
 
@@ -17,13 +18,13 @@ class StrategyContext:
         self,
         strategy: JobStrategy,
         config: dict[str, object],
-        browser_context: BrowserContext | None = None,
-        page: Page | None = None,
+        browser_context: BrowserContext | AsyncBrowserContext | None = None,
+        page: Page | AsyncPage | None = None,
     ) -> None:
         self.strategy: JobStrategy = strategy
         self.config: dict[str, object] = config
-        self.browser_context: BrowserContext | None = browser_context
-        self.page: Page | None = page
+        self.browser_context: BrowserContext | AsyncBrowserContext | None = browser_context
+        self.page: Page | AsyncPage | None = page
 
     @property
     def human_like(self) -> str:
@@ -44,3 +45,21 @@ class StrategyContext:
     def after_process(self, jobs: list[dict[str, object]]) -> None:
         """委派處理後收尾給策略"""
         self.strategy.after_process(jobs, self)
+
+    def suspend(self, jobs: list[dict[str, object]]) -> None:
+        """委派中斷收尾給策略 (保留檢查點時)"""
+        self.strategy.suspend(jobs, self)
+
+    # ── Async (AsyncJobSearcher) ──
+
+    async def before_process_async(self, jobs: list[dict[str, object]]) -> None:
+        """委派處理前準備給策略 (async)"""
+        await self.strategy.before_process_async(jobs, self)
+
+    async def process_job_async(self, job: dict[str, object]) -> bool:
+        """委派單一職缺處理給策略 (async)"""
+        return await self.strategy.process_job_async(job, self)
+
+    async def after_process_async(self, jobs: list[dict[str, object]]) -> None:
+        """委派處理後收尾給策略 (async)"""
+        await self.strategy.after_process_async(jobs, self)
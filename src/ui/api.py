@@ -4,10 +4,13 @@ pywebview API Bridge — 前端 JS 透過 window.pywebview.api 呼叫這些方
 
 from __future__ import annotations
 
+import re
+import asyncio
 import subprocess
 import threading
-from core import job_searcher, auth_manager
-from config import RUN_CONFIG, SESSION_FILE, BASE_URL
+from utils import delete_profiles, has_checkpoint, load_checkpoint, clear_search_url_cache, clear_detail_cache, clear_seen_index, get_latest_run, export_jobs
+from core import job_searcher, async_job_searcher, auth_manager, ShardRunner, SHARD_MODES, BrowserService
+from config import RUN_CONFIG, SESSION_FILE, BASE_URL, BLOCK_PRESETS
 from strategy import JobStrategy, SaveStrategy, ApplyStrategy
 from ui.logger import get_logs
 
@@ -19,6 +22,13 @@ class Api:
         self._running: bool = False
         self._thread: threading.Thread | None = None
         self._codegen_proc: subprocess.Popen | None = None
+        # 常駐瀏覽器：多次執行共用，啟動 app 時先在背景預熱
+        self._browser_service: BrowserService = BrowserService()
+        self._browser_service.warm_up(bool(RUN_CONFIG.get('headless', False)))
+
+    def shutdown(self) -> None:
+        """關閉常駐瀏覽器 (視窗關閉後呼叫)"""
+        self._browser_service.shutdown()
 
     # ── 狀態 ──
 
@@ -27,11 +37,16 @@ class Api:
         return {
             'has_session': auth_manager.has_session_file(),
             'is_running': self._running,
+            'has_checkpoint': has_checkpoint(),
         }
 
     def check_login(self) -> dict[str, bool]:
-        """真正驗證 session 是否有效（會開隱藏瀏覽器）"""
-        valid = auth_manager.is_logged_in(verbose=True)
+        """真正驗證 session 是否有效（用常駐瀏覽器開一個暫時的 context）"""
+        if self._running:
+            # 常駐瀏覽器正在執行爬蟲，另開隱藏瀏覽器驗證
+            valid = auth_manager.is_logged_in(verbose=True)
+        else:
+            valid = self._browser_service.call(self._browser_service.check_login)
         return {'valid': valid}
 
     # ── 登入/登出 ──
@@ -49,6 +64,49 @@ class Api:
         auth_manager.clear_session()
         return {'success': True}
 
+    def clear_browser_profile(self) -> dict[str, bool | str]:
+        """刪除持久化瀏覽器 profile (快取與 cookie)"""
+        if self._running:
+            return {'success': False, 'error': '爬蟲正在執行中'}
+        freed = delete_profiles()
+        print(f"已清除瀏覽器 profile ({freed / 1_000_000:.0f} MB)")
+        return {'success': True}
+
+    def clear_search_cache(self) -> dict[str, bool | str]:
+        """刪除 UI 點選篩選後記下的搜尋網址快取"""
+        if self._running:
+            return {'success': False, 'error': '爬蟲正在執行中'}
+        count = clear_search_url_cache()
+        print(f"已清除搜尋網址快取 ({count} 筆)")
+        return {'success': True}
+
+    def clear_cached_details(self) -> dict[str, bool | str]:
+        """刪除詳細頁快取 (下次執行重新抓取所有詳細頁)"""
+        if self._running:
+            return {'success': False, 'error': '爬蟲正在執行中'}
+        count = clear_detail_cache()
+        print(f"已清除詳細頁快取 ({count} 筆)")
+        return {'success': True}
+
+    def clear_seen_jobs(self) -> dict[str, bool | str]:
+        """刪除已看過的職缺索引 (增量爬取下次視為全部都是新職缺)"""
+        if self._running:
+            return {'success': False, 'error': '爬蟲正在執行中'}
+        count = clear_seen_index()
+        print(f"已清除職缺索引 ({count} 筆)")
+        return {'success': True}
+
+    def export_latest_run(self) -> dict[str, bool | str]:
+        """把最近一次執行從資料庫匯出成 JSON / CSV (export_formats 有設定時另含其他格式)"""
+        if self._running:
+            return {'success': False, 'error': '爬蟲正在執行中'}
+        filename = get_latest_run()
+        if filename is None:
+            return {'success': False, 'error': '資料庫中沒有執行紀錄'}
+        formats = tuple(dict.fromkeys(['json', 'csv', *RUN_CONFIG.get('export_formats', [])]))
+        export_jobs(filename, formats)
+        return {'success': True, 'filename': filename}
+
     # ── 開發工具 ──
 
     def open_codegen(self) -> dict[str, bool | str]:
@@ -77,12 +135,12 @@ class Api:
 
     # ── 爬蟲 ──
 
-    def start_scraper(self, keyword: str, pages: int, headless: bool, human_like: str, delay_multiplier: float, strategy_name: str, job_type: str = '全職', experience: list[str] | None = None, area_indices: list[int] | None = None, remote_work: list[str] | None = None, benefits: list[str] | None = None, job_categories: list[dict] | None = None) -> dict[str, bool | str]:
+    def start_scraper(self, keyword: str, pages: int, headless: bool, human_like: str, delay_multiplier: float, strategy_name: str, job_type: str = '全職', experience: list[str] | None = None, area_indices: list[int] | None = None, remote_work: list[str] | None = None, benefits: list[str] | None = None, job_categories: list[dict] | None = None, engine: str = 'sync', split_areas: bool = False, shard_mode: str = 'off', shard_workers: int = 0, block_resources: str = 'off', browser_profile: bool = False, incremental: bool = False) -> dict[str, bool | str]:
         """
         啟動爬蟲（在 background thread 執行）
 
         Args:
-            keyword: 搜尋關鍵字
+            keyword: 搜尋關鍵字 (多個以逗號分隔，同一個瀏覽器 session 依序搜尋)
             pages: 要爬幾頁 (0 = 全部)
             headless: 是否隱藏瀏覽器
             human_like: 擬人化程度 (minimal / normal / full)
@@ -94,6 +152,13 @@ class Api:
             remote_work: 地點距離 (e.g. ["完全遠端", "部分遠端"])
             benefits: 福利制度 (e.g. ["年終獎金", "彈性上下班"])
             job_categories: 職務類別 (多組, e.g. [{"main": "...", "sub": "...", "titles": [...]}])
+            engine: 執行引擎 (sync = playwright.sync_api / async = playwright.async_api)
+            split_areas: 每個地區分開搜尋 (關鍵字 × 地區)
+            shard_mode: 多行程分片 (off / keyword / area / pages)
+            shard_workers: 分片 process 數 (0 = 依 CPU 核心數)
+            block_resources: 資源攔截 (off / text-only / stealth-safe)
+            browser_profile: 使用持久化瀏覽器 profile (保留 HTTP cache)
+            incremental: 增量爬取 (只處理新的或變動的職缺)
         """
         if self._running:
             return {'success': False, 'error': '爬蟲正在執行中'}
@@ -114,6 +179,17 @@ class Api:
             config['benefits'] = benefits
         if job_categories is not None:
             config['job_categories'] = job_categories
+        config['engine'] = engine if engine in ('sync', 'async') else 'sync'
+
+        config['shard_mode'] = shard_mode if shard_mode in SHARD_MODES else 'off'
+        config['shard_workers'] = max(0, int(shard_workers or 0))
+        config['block_resources'] = block_resources if block_resources in BLOCK_PRESETS else 'off'
+        config['browser_profile'] = bool(browser_profile)
+        config['incremental'] = bool(incremental)
+
+        queries = self._build_queries(keyword, config.get('area_indices', []) if split_areas else [])
+        if not queries:
+            return {'success': False, 'error': '請輸入搜尋關鍵字'}
 
         # 選策略
         strategy = ApplyStrategy() if strategy_name == 'apply' else SaveStrategy()
@@ -122,20 +198,81 @@ class Api:
         self._running = True
         self._thread = threading.Thread(
             target=self._run_scraper,
-            args=(keyword, config, strategy),
+            args=(queries, config, strategy),
             daemon=True,
         )
         self._thread.start()
 
         return {'success': True}
 
-    def _run_scraper(self, keyword: str, config: dict[str, object], strategy: JobStrategy) -> None:
-        """背景執行爬蟲"""
+    def resume_scraper(self) -> dict[str, bool | str]:
+        """從上次中斷的檢查點繼續執行（同樣的條件、頁碼與已處理的職缺）"""
+        if self._running:
+            return {'success': False, 'error': '爬蟲正在執行中'}
+
+        checkpoint = load_checkpoint()
+        if checkpoint is None:
+            return {'success': False, 'error': '沒有可繼續的執行'}
+
+        config = {**RUN_CONFIG, **checkpoint.get('config', {}), 'shard_mode': 'off'}
+        strategy = ApplyStrategy() if checkpoint.get('strategy') == 'ApplyStrategy' else SaveStrategy()
+
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._run_scraper,
+            args=(checkpoint['queries'], config, strategy, checkpoint),
+            daemon=True,
+        )
+        self._thread.start()
+
+        return {'success': True}
+
+    @staticmethod
+    def _build_queries(keyword: str, split_area_indices: list[int]) -> list[str | dict]:
+        """
+        關鍵字輸入 → 批次搜尋條件
+
+        "pm, product manager" → ['pm', 'product manager']；
+        有 split_area_indices 時展開成 關鍵字 × 地區
+        """
+        keywords = list(dict.fromkeys(k.strip() for k in re.split(r'[,，]', keyword) if k.strip()))
+        if not split_area_indices:
+            return keywords
+        return [{'keyword': k, 'area_indices': [a]} for k in keywords for a in split_area_indices]
+
+    @staticmethod
+    def _select_engine(queries: list[str | dict], config: dict[str, object], strategy: JobStrategy) -> tuple[str, str]:
+        """
+        依搜尋條件與策略決定 (engine, shard_mode)
+
+        分片只支援 SaveStrategy；async 引擎只處理單一關鍵字、不分片，
+        且策略要有 supports_async，其餘情況改用 sync
+        """
+        shard_mode = config.get('shard_mode', 'off')
+        engine = config.get('engine', 'sync')
+        if shard_mode != 'off' and not isinstance(strategy, SaveStrategy):
+            print("分片爬取只支援儲存職缺，改用單一 process")
+            shard_mode = 'off'
+        if engine == 'async' and (len(queries) > 1 or shard_mode != 'off'):
+            print("Async 引擎不支援批次 / 分片搜尋，改用 sync")
+            engine = 'sync'
+        elif engine == 'async' and not strategy.supports_async:
+            print(f"{strategy.name} 不支援 async 引擎，改用 sync")
+            engine = 'sync'
+        return engine, shard_mode
+
+    def _run_scraper(self, queries: list[str | dict], config: dict[str, object], strategy: JobStrategy, resume: dict | None = None) -> None:
+        """背景執行爬蟲 (resume = 從檢查點繼續)"""
         try:
-            print(f"\n=== 開始執行 ===")
-            print(f"關鍵字: {keyword}")
+            keywords = list(dict.fromkeys(q if isinstance(q, str) else q['keyword'] for q in queries))
+            print(f"\n=== {'繼續上次執行' if resume else '開始執行'} ===")
+            print(f"關鍵字: {', '.join(keywords)}")
+            if len(queries) > 1:
+                print(f"批次搜尋: {len(queries)} 組")
             print(f"策略: {strategy.name}")
             print(f"頁數: {config['pages'] if config['pages'] > 0 else '全部'}")
+            if config.get('incremental'):
+                print(f"增量爬取: 開啟")
             print(f"瀏覽器: {'隱藏' if config['headless'] else '顯示'}")
             print(f"人類行為: {config['human_like']}")
             print(f"延遲倍率: {config['delay_multiplier']}x")
@@ -149,14 +286,58 @@ class Api:
             print(f"地點距離: {', '.join(remote_list) if remote_list else '不限'}")
             ben_list = config.get('benefits', [])
             print(f"福利制度: {', '.join(ben_list) if ben_list else '不限'}")
+            print(f"引擎: {config.get('engine', 'sync')}")
+            print(f"資源攔截: {config.get('block_resources', 'off')}")
+            print(f"瀏覽器 profile: {'持久化' if config.get('browser_profile') else '暫時'}")
 
-            jobs = job_searcher.search(
-                keyword,
-                pages=config['pages'],
-                headless=config['headless'],
-                config=config,
-                strategy=strategy,
-            )
+            engine, shard_mode = self._select_engine(queries, config, strategy)
+
+            if resume is not None:
+                # 檢查點只由 sync 單一 process 寫入，一律用 search_batch 繼續
+                jobs = self._browser_service.call(
+                    job_searcher.search_batch,
+                    queries,
+                    pages=int(resume.get('pages', config['pages'])),
+                    headless=config['headless'],
+                    config=config,
+                    strategy=strategy,
+                    browser_service=self._browser_service,
+                    resume=resume,
+                )
+            elif shard_mode != 'off':
+                print(f"分片: {shard_mode} (process 數: {config.get('shard_workers') or '自動'})")
+                jobs = ShardRunner(int(config.get('shard_workers', 0) or 0)).run(keywords, config, shard_mode)
+            elif len(queries) > 1:
+                jobs = self._browser_service.call(
+                    job_searcher.search_batch,
+                    queries,
+                    pages=config['pages'],
+                    headless=config['headless'],
+                    config=config,
+                    strategy=strategy,
+                    browser_service=self._browser_service,
+                )
+            elif engine == 'async':
+                # 分地區搜尋時 query 是 {'keyword': ..., 'area_indices': [...]}，其餘欄位覆寫 config
+                query = queries[0] if isinstance(queries[0], dict) else {'keyword': queries[0]}
+                query_config = {**config, **{k: v for k, v in query.items() if k != 'keyword'}}
+                jobs = asyncio.run(async_job_searcher.search(
+                    query['keyword'],
+                    pages=config['pages'],
+                    headless=config['headless'],
+                    config=query_config,
+                    strategy=strategy,
+                ))
+            else:
+                jobs = self._browser_service.call(
+                    job_searcher.search,
+                    queries[0],
+                    pages=config['pages'],
+                    headless=config['headless'],
+                    config=config,
+                    strategy=strategy,
+                    browser_service=self._browser_service,
+                )
 
             if jobs:
                 print(f"\n=== 完成 ===")
@@ -13,6 +13,14 @@ from .human_behavior import (
     human_like_mouse_move,
     human_like_pause,
     human_like_long_break,
+    async_random_delay,
+    async_smart_delay,
+    async_human_like_scroll,
+    async_human_like_mouse_move,
+    async_human_like_pause,
+    async_human_like_long_break,
+    RateGovernor,
+    rate_governor,
 )
 
 # CAPTCHA 檢測與處理
@@ -21,16 +29,87 @@ from .captcha import (
     check_captcha,
     wait_for_human_verification,
     handle_captcha_if_detected,
+    async_check_captcha,
+    async_wait_for_human_verification,
+    async_handle_captcha_if_detected,
+    CaptchaWatcher,
+    install_captcha_watcher,
+    get_captcha_watcher,
 )
 
 # 檔案存取
 from .file_io import (
+    job_id_from_url,
+    dedupe_jobs,
     get_next_file_number,
     save_jobs,
+    get_latest_run,
+    export_jobs,
+    export_parquet,
     load_jobs,
+    load_jobs_df,
     update_job,
 )
 
+# 搜尋 URL 快取
+from .search_cache import (
+    search_cache_key,
+    get_cached_search_url,
+    save_search_url,
+    invalidate_search_url,
+    clear_search_url_cache,
+)
+
+# 詳細頁快取
+from .detail_cache import (
+    get_cached_detail,
+    save_cached_detail,
+    clear_detail_cache,
+)
+
+# 串流輸出
+from .stream_sink import (
+    JobStreamSink,
+    read_stream,
+    compact_stream,
+    recover_streams,
+)
+
+# 增量爬取索引
+from .seen_jobs import (
+    job_content_hash,
+    load_seen_index,
+    seen_status,
+    mark_seen,
+    save_seen_index,
+    clear_seen_index,
+)
+
+# 爬取檢查點
+from .checkpoint import (
+    has_checkpoint,
+    load_checkpoint,
+    start_checkpoint,
+    save_checkpoint,
+    clear_checkpoint,
+)
+
+# 主機請求限流
+from .host_limiter import (
+    HostRateLimiter,
+    host_limiter,
+)
+
+# 瀏覽器 profile
+from .profile import (
+    PROFILE_CACHE_DIRS,
+    get_profile_dir,
+    get_dir_size,
+    clear_profile_cache,
+    enforce_profile_limit,
+    delete_profiles,
+)
+
 # 環境設定
 from .setup import ensure_browser
 
@@ -42,16 +121,74 @@ __all__ = [
     'human_like_mouse_move',
     'human_like_pause',
     'human_like_long_break',
+    'async_random_delay',
+    'async_smart_delay',
+    'async_human_like_scroll',
+    'async_human_like_mouse_move',
+    'async_human_like_pause',
+    'async_human_like_long_break',
+    'RateGovernor',
+    'rate_governor',
     # captcha
     'CAPTCHA_INDICATORS',
     'check_captcha',
     'wait_for_human_verification',
     'handle_captcha_if_detected',
+    'async_check_captcha',
+    'async_wait_for_human_verification',
+    'async_handle_captcha_if_detected',
+    'CaptchaWatcher',
+    'install_captcha_watcher',
+    'get_captcha_watcher',
     # file_io
+    'job_id_from_url',
+    'dedupe_jobs',
     'get_next_file_number',
     'save_jobs',
+    'get_latest_run',
+    'export_jobs',
+    'export_parquet',
     'load_jobs',
+    'load_jobs_df',
     'update_job',
+    # search_cache
+    'search_cache_key',
+    'get_cached_search_url',
+    'save_search_url',
+    'invalidate_search_url',
+    'clear_search_url_cache',
+    # detail_cache
+    'get_cached_detail',
+    'save_cached_detail',
+    'clear_detail_cache',
+    # stream_sink
+    'JobStreamSink',
+    'read_stream',
+    'compact_stream',
+    'recover_streams',
+    # seen_jobs
+    'job_content_hash',
+    'load_seen_index',
+    'seen_status',
+    'mark_seen',
+    'save_seen_index',
+    'clear_seen_index',
+    # checkpoint
+    'has_checkpoint',
+    'load_checkpoint',
+    'start_checkpoint',
+    'save_checkpoint',
+    'clear_checkpoint',
+    # host_limiter
+    'HostRateLimiter',
+    'host_limiter',
+    # profile
+    'PROFILE_CACHE_DIRS',
+    'get_profile_dir',
+    'get_dir_size',
+    'clear_profile_cache',
+    'enforce_profile_limit',
+    'delete_profiles',
     # setup
     'ensure_browser',
 ]
@@ -2,10 +2,17 @@
 CAPTCHA 檢測與處理
 """
 
+import json
 import time
+import asyncio
+import logging
+import weakref
 
-from playwright.sync_api import Page
-from .human_behavior import random_delay
+from playwright.sync_api import Page, BrowserContext, Frame
+from playwright.async_api import Page as AsyncPage
+from .human_behavior import random_delay, async_random_delay, rate_governor
+
+logger = logging.getLogger(__name__)
 
 
 # 常見 CAPTCHA 特徵 (可擴充)
@@ -50,50 +57,86 @@ CAPTCHA_INDICATORS: dict[str, list[str]] = {
 }
 
 
+# 沒有驗證的結果在 DOM 沒變動時沿用多久 (毫秒)；每張卡片都會檢查一次，列表頁通常沒有變化
+CAPTCHA_NEGATIVE_TTL_MS: int = 1500
+
+# 頁面內檢查 selector / 文字 / iframe，回傳 [type, 特徵] 或 null (一次檢查與事件監聽共用)
+_SCAN_FUNCTION: str = """
+(ind) => {
+    for (const selector of ind.selectors) {
+        try {
+            if (document.querySelector(selector)) return ['selector', selector];
+        } catch (e) {}
+    }
+    const text = ((document.body && document.body.innerText) || '').toLowerCase();
+    const hit = ind.text_content.find((t) => text.includes(t.toLowerCase()));
+    if (hit) return ['text', hit];
+    for (const frame of document.querySelectorAll('iframe')) {
+        const src = (frame.getAttribute('src') || '').toLowerCase();
+        const keyword = ind.iframe_src.find((k) => src.includes(k));
+        if (keyword) return ['iframe', keyword];
+    }
+    return null;
+}
+"""
+
+# 一次 evaluate 檢查完 (取代逐一 locator.count() 的多次往返)
+# MutationObserver 只負責標記 DOM 有變動；沒變動且在 TTL 內時直接回傳上次的「沒有驗證」
+_DETECT_SCRIPT: str = """
+(ind) => {
+    const now = Date.now();
+    let state = window.__captchaScan;
+    if (!state) {
+        state = window.__captchaScan = { dirty: true, at: 0 };
+        try {
+            new MutationObserver(() => { state.dirty = true; }).observe(document.documentElement, {
+                childList: true, subtree: true, attributes: true, characterData: true,
+            });
+        } catch (e) {}
+    }
+    if (!state.dirty && now - state.at < ind.ttl) {
+        return null;
+    }
+
+    const found = (%s)(ind);
+    if (!found) {
+        state.dirty = false;
+        state.at = now;
+    }
+    return found;
+}
+""" % _SCAN_FUNCTION.strip()
+
+_DETECT_ARGS: dict[str, object] = {
+    'selectors': CAPTCHA_INDICATORS['selectors'],
+    'text_content': CAPTCHA_INDICATORS['text_content'],
+    'iframe_src': CAPTCHA_INDICATORS['iframe_src'],
+    'ttl': CAPTCHA_NEGATIVE_TTL_MS,
+}
+
+_DETAIL_FORMATS: dict[str, str] = {
+    'selector': '找到元素: {}',
+    'text': '頁面包含文字: {}',
+    'iframe': 'iframe 包含: {}',
+}
+
+
 def check_captcha(page: Page) -> dict[str, bool | str | None]:
     """
-    檢測頁面是否有 CAPTCHA 驗證
+    檢測頁面是否有 CAPTCHA 驗證 (整組特徵在頁面內一次 evaluate 檢查完)
 
     Returns:
         {'detected': bool, 'type': str | None, 'details': str | None}
     """
-    result: dict[str, bool | str | None] = {'detected': False, 'type': None, 'details': None}
+    url_result = _check_url(page.url)
+    if url_result is not None:
+        return url_result
 
     try:
-        current_url: str = page.url.lower()
-        for keyword in CAPTCHA_INDICATORS['url_keywords']:
-            if keyword in current_url:
-                return {'detected': True, 'type': 'url', 'details': f'URL 包含: {keyword}'}
-
-        for selector in CAPTCHA_INDICATORS['selectors']:
-            try:
-                if page.locator(selector).count() > 0:
-                    return {'detected': True, 'type': 'selector', 'details': f'找到元素: {selector}'}
-            except:
-                pass
-
-        try:
-            page_text: str = page.locator('body').inner_text(timeout=2000).lower()
-            for text in CAPTCHA_INDICATORS['text_content']:
-                if text.lower() in page_text:
-                    return {'detected': True, 'type': 'text', 'details': f'頁面包含文字: {text}'}
-        except:
-            pass
-
-        try:
-            iframes = page.locator('iframe').all()
-            for iframe in iframes:
-                src: str = iframe.get_attribute('src') or ''
-                for keyword in CAPTCHA_INDICATORS['iframe_src']:
-                    if keyword in src.lower():
-                        return {'detected': True, 'type': 'iframe', 'details': f'iframe 包含: {keyword}'}
-        except:
-            pass
-
+        return _to_result(page.evaluate(_DETECT_SCRIPT, _DETECT_ARGS))
     except Exception:
-        pass
-
-    return result
+        # 頁面正在跳轉 (execution context 被換掉) 等情況，視為沒有驗證
+        return _to_result(None)
 
 
 def wait_for_human_verification(page: Page, timeout: int = 300) -> bool:
@@ -122,15 +165,23 @@ def wait_for_human_verification(page: Page, timeout: int = 300) -> bool:
 
     start_time: float = time.time()
     check_interval: int = 2
+    watcher = get_captcha_watcher(page)
 
     while time.time() - start_time < timeout:
-        captcha_status = check_captcha(page)
+        captcha_status = _current_status(page, watcher)
         if not captcha_status['detected']:
             print("\n✅ 驗證完成! 繼續執行...\n")
             random_delay(1, 2)
             return True
 
-        time.sleep(check_interval)
+        if watcher is None:
+            time.sleep(check_interval)
+            continue
+        # 有事件監聽時只需讓 Playwright 處理事件，驗證一消失就會收到通知
+        try:
+            page.wait_for_timeout(CaptchaWatcher.WAIT_STEP_MS)
+        except Exception:
+            return True  # 頁面已關閉
 
     print("\n❌ 等待超時，請手動處理後重新執行")
     return False
@@ -147,10 +198,253 @@ def handle_captcha_if_detected(page: Page, action_name: str = "操作") -> bool:
     Returns:
         True=沒有驗證或已完成, False=驗證超時
     """
-    captcha_status = check_captcha(page)
+    captcha_status = _current_status(page, get_captcha_watcher(page))
 
     if captcha_status['detected']:
         print(f"\n[{action_name}] 檢測到驗證: {captcha_status['details']}")
+        rate_governor.record_captcha()
         return wait_for_human_verification(page)
 
     return True
+
+
+# ── 事件監聽 ──
+
+class CaptchaWatcher:
+    """
+    事件驅動的驗證偵測 (每個 browser context 安裝一次)
+
+    init script 在每個頁面掛上 MutationObserver，DOM 變動後重新檢查，驗證出現 / 消失時
+    透過 expose_binding 通知 Python；iframe 與網址則由 frameattached / framenavigated 事件判斷。
+    sync API 的事件在呼叫 Playwright 時處理，所以旗標會在下一次瀏覽器操作時更新。
+    """
+
+    BINDING_NAME: str = '__captchaReport'
+    SCAN_DEBOUNCE_MS: int = 250  # DOM 連續變動時最多每 250ms 檢查一次
+    WAIT_STEP_MS: int = 200  # 等待使用者完成驗證時，每次讓 Playwright 處理事件的時間
+
+    def __init__(self) -> None:
+        # page → {'ready': 已知目前文件的狀態, 'dom': DOM 檢查結果, 'url': 網址特徵, 'frames': {frame: 關鍵字}}
+        self._pages: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def install(self, context: BrowserContext) -> None:
+        """在 context 上註冊 binding 與 init script，並監聽已開啟和之後開啟的頁面"""
+        context.expose_binding(self.BINDING_NAME, self._on_report)
+        context.add_init_script(self._watch_script())
+        context.on('page', self._watch_page)
+        for page in context.pages:
+            self._watch_page(page)
+            try:
+                page.evaluate(self._watch_script())  # init script 只對之後載入的文件生效
+            except Exception as e:
+                logger.debug(f"CaptchaWatcher 注入既有頁面失敗: {e}")
+
+    def ready(self, page: Page) -> bool:
+        """是否已知目前頁面文件的狀態 (剛跳轉、init script 還沒回報時為 False)"""
+        state = self._pages.get(page)
+        return bool(state and state['ready'])
+
+    def status(self, page: Page) -> dict[str, bool | str | None]:
+        """目前的驗證狀態 (與 check_captcha 相同格式，不和瀏覽器往返)"""
+        state = self._pages.get(page)
+        if state is None:
+            return _to_result(None)
+        if state['url'] is not None:
+            return state['url']
+        if state['frames']:
+            return _to_result(['iframe', next(iter(state['frames'].values()))])
+        return state['dom']
+
+    def update(self, page: Page, result: dict[str, bool | str | None]) -> None:
+        """用一次 check_captcha 的結果補上狀態 (跳轉後 init script 尚未回報，或同一文件內的 history 跳轉)"""
+        state = self._pages.get(page)
+        if state is not None and result.get('type') != 'url':
+            state.update(ready=True, dom=result)
+
+    # ── Private ──
+
+    def _watch_script(self) -> str:
+        return _WATCH_SCRIPT % (json.dumps(_DETECT_ARGS, ensure_ascii=False), _SCAN_FUNCTION.strip(), self.BINDING_NAME, self.SCAN_DEBOUNCE_MS)
+
+    def _watch_page(self, page: Page) -> None:
+        if page in self._pages:
+            return
+        self._pages[page] = {'ready': False, 'dom': _to_result(None), 'url': _check_url(page.url), 'frames': {}}
+        page.on('framenavigated', lambda frame: self._on_frame(page, frame))
+        page.on('frameattached', lambda frame: self._on_frame(page, frame))
+        page.on('framedetached', lambda frame: self._pages.get(page, {}).get('frames', {}).pop(frame, None))
+
+    def _on_frame(self, page: Page, frame: Frame) -> None:
+        state = self._pages.get(page)
+        if state is None:
+            return
+        if frame != page.main_frame:
+            self._track_frame(state, frame)
+            return
+        # 主 frame 跳轉：等 init script 回報 DOM 狀態。同一文件內的 pushState / hash 跳轉也會觸發，
+        # 此時 iframe 都還在，所以依 page.frames 重建 (新文件時舊的 iframe 已 detach)
+        state.update(ready=False, dom=_to_result(None), url=_check_url(frame.url))
+        state['frames'].clear()
+        for child in page.frames:
+            if child != page.main_frame:
+                self._track_frame(state, child)
+
+    def _track_frame(self, state: dict, frame: Frame) -> None:
+        """記錄 / 移除驗證 iframe"""
+        src = frame.url.lower()
+        keyword = next((k for k in CAPTCHA_INDICATORS['iframe_src'] if k in src), None)
+        if keyword:
+            state['frames'][frame] = keyword
+        else:
+            state['frames'].pop(frame, None)
+
+    def _on_report(self, source: dict, found: list[str] | None) -> None:
+        """init script 回報 (binding callback)"""
+        page = source.get('page')
+        state = self._pages.get(page)
+        if state is None or source.get('frame') != page.main_frame:
+            return
+        result = _to_result(found)
+        if result != state['dom']:
+            logger.debug(f"CaptchaWatcher: {result['details'] or '驗證消失'}")
+        state.update(ready=True, dom=result)
+
+
+# 每個文件載入時執行 (只在主 frame)：DOM 變動後重新檢查，狀態改變才回報
+_WATCH_SCRIPT: str = """
+(() => {
+    if (window.top !== window || window.__captchaWatch) return;
+    const ind = %s;
+    const scan = %s;
+    const binding = '%s';
+    const watch = window.__captchaWatch = { key: undefined, timer: null };
+    const report = () => {
+        watch.timer = null;
+        let found = null;
+        try { found = scan(ind); } catch (e) {}
+        const key = JSON.stringify(found);
+        if (key === watch.key) return;
+        watch.key = key;
+        try { window[binding](found); } catch (e) {}
+    };
+    const schedule = () => { if (!watch.timer) watch.timer = setTimeout(report, %d); };
+    const start = () => {
+        new MutationObserver(schedule).observe(document.documentElement, {
+            childList: true, subtree: true, attributes: true, characterData: true,
+        });
+        report();
+    };
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', start, { once: true });
+    } else {
+        start();
+    }
+})();
+"""
+
+# context → CaptchaWatcher
+_WATCHERS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def install_captcha_watcher(context: BrowserContext) -> CaptchaWatcher:
+    """在 context 安裝事件驅動的驗證偵測 (重複呼叫回傳同一個)"""
+    watcher = _WATCHERS.get(context)
+    if watcher is None:
+        watcher = CaptchaWatcher()
+        watcher.install(context)
+        _WATCHERS[context] = watcher
+    return watcher
+
+
+def get_captcha_watcher(page: Page) -> CaptchaWatcher | None:
+    """頁面所屬 context 的 CaptchaWatcher (沒有安裝時回傳 None)"""
+    try:
+        return _WATCHERS.get(page.context)
+    except Exception:
+        return None
+
+
+# ── Async 版本 ──
+
+async def async_check_captcha(page: AsyncPage) -> dict[str, bool | str | None]:
+    """check_captcha 的 async 版本"""
+    url_result = _check_url(page.url)
+    if url_result is not None:
+        return url_result
+
+    try:
+        return _to_result(await page.evaluate(_DETECT_SCRIPT, _DETECT_ARGS))
+    except Exception:
+        return _to_result(None)
+
+
+async def async_wait_for_human_verification(page: AsyncPage, timeout: int = 300) -> bool:
+    """wait_for_human_verification 的 async 版本 (等待期間其他 tab 可繼續執行)"""
+    print("\n" + "=" * 60)
+    print("⚠️  檢測到人機驗證!")
+    print("=" * 60)
+    print("請在瀏覽器中手動完成驗證...")
+    print(f"等待中... (最多 {timeout} 秒)")
+    print("=" * 60 + "\n")
+
+    try:
+        import winsound
+        winsound.Beep(1000, 500)
+    except:
+        pass
+
+    start_time: float = time.time()
+    check_interval: int = 2
+
+    while time.time() - start_time < timeout:
+        captcha_status = await async_check_captcha(page)
+        if not captcha_status['detected']:
+            print("\n✅ 驗證完成! 繼續執行...\n")
+            await async_random_delay(1, 2)
+            return True
+
+        await asyncio.sleep(check_interval)
+
+    print("\n❌ 等待超時，請手動處理後重新執行")
+    return False
+
+
+async def async_handle_captcha_if_detected(page: AsyncPage, action_name: str = "操作") -> bool:
+    """handle_captcha_if_detected 的 async 版本"""
+    captcha_status = await async_check_captcha(page)
+
+    if captcha_status['detected']:
+        print(f"\n[{action_name}] 檢測到驗證: {captcha_status['details']}")
+        rate_governor.record_captcha()
+        return await async_wait_for_human_verification(page)
+
+    return True
+
+
+# ── Private ──
+
+def _current_status(page: Page, watcher: CaptchaWatcher | None) -> dict[str, bool | str | None]:
+    """有事件監聽且已知目前狀態時只讀 Python 端的旗標 (不和瀏覽器往返)，否則檢查一次"""
+    if watcher is not None and watcher.ready(page):
+        return watcher.status(page)
+    result = check_captcha(page)
+    if watcher is not None:
+        watcher.update(page, result)
+    return result
+
+
+def _check_url(url: str) -> dict[str, bool | str | None] | None:
+    """網址特徵 (page.url 不需要和瀏覽器往返)"""
+    current_url = url.lower()
+    for keyword in CAPTCHA_INDICATORS['url_keywords']:
+        if keyword in current_url:
+            return {'detected': True, 'type': 'url', 'details': f'URL 包含: {keyword}'}
+    return None
+
+
+def _to_result(found: list[str] | None) -> dict[str, bool | str | None]:
+    """_DETECT_SCRIPT 的回傳值 ([type, 特徵] 或 null) → check_captcha 的結果格式"""
+    if not found:
+        return {'detected': False, 'type': None, 'details': None}
+    kind, indicator = found
+    return {'detected': True, 'type': kind, 'details': _DETAIL_FORMATS[kind].format(indicator)}
@@ -0,0 +1,77 @@
+"""
+爬取進度檢查點 — 中斷 (驗證逾時、瀏覽器 crash、關閉視窗) 後可從上次的位置繼續
+
+分成兩個檔案：執行條件 (搜尋、設定) 在開始時寫一次；游標 (頁碼、職缺位置、已處理的 ID、
+串流檔) 在爬取中反覆覆寫。已處理的職缺資料在串流檔中，不寫入檢查點。
+"""
+
+import os
+import json
+import time
+import logging
+
+from config import CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_FILE: str = os.path.join(CACHE_DIR, "checkpoint.json")
+CHECKPOINT_RUN_FILE: str = os.path.join(CACHE_DIR, "checkpoint_run.json")
+CHECKPOINT_VERSION: int = 2
+
+
+def has_checkpoint() -> bool:
+    """是否有未完成的執行 (只檢查檔案，不解析內容)"""
+    return os.path.exists(CHECKPOINT_FILE)
+
+
+def load_checkpoint() -> dict | None:
+    """載入檢查點 (執行條件 + 游標)，沒有或格式不符時回傳 None"""
+    run = _read(CHECKPOINT_RUN_FILE)
+    cursor = _read(CHECKPOINT_FILE)
+    if run is None or cursor is None:
+        return None
+    return {**run, **cursor}
+
+
+def start_checkpoint(run: dict) -> None:
+    """寫入這次執行的條件 (queries、pages、config 等，執行開始時呼叫一次)"""
+    _write(CHECKPOINT_RUN_FILE, run)
+
+
+def save_checkpoint(cursor: dict) -> None:
+    """寫入游標 (先寫暫存檔再取代，寫到一半當掉也不會留下壞檔)"""
+    _write(CHECKPOINT_FILE, cursor)
+
+
+def clear_checkpoint() -> bool:
+    """刪除檢查點 (執行正常完成後呼叫)，回傳是否有刪除"""
+    existed = os.path.exists(CHECKPOINT_FILE)
+    for path in (CHECKPOINT_FILE, CHECKPOINT_RUN_FILE):
+        if os.path.exists(path):
+            os.remove(path)
+    return existed
+
+
+# ── Private ──
+
+def _read(path: str) -> dict | None:
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.debug(f"讀取檢查點失敗 ({path}): {e}")
+        return None
+    if data.get('version') != CHECKPOINT_VERSION:
+        return None
+    return data
+
+
+def _write(path: str, data: dict) -> None:
+    data = {**data, 'version': CHECKPOINT_VERSION, 'updated_at': time.time()}
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, default=str)
+    os.replace(tmp_path, path)
@@ -0,0 +1,66 @@
+"""
+詳細頁快取 — 以 104 職缺 ID 為 key，避免每次執行都重抓沒變動的詳細頁
+"""
+
+import os
+import json
+import time
+
+from config import CACHE_DIR
+
+# 一個職缺一個檔案：寫入互不干擾 (detail worker thread / 分片 process 可同時寫)
+DETAIL_CACHE_DIR: str = os.path.join(CACHE_DIR, "details")
+
+
+def _detail_path(job_id: str) -> str:
+    return os.path.join(DETAIL_CACHE_DIR, f"{job_id}.json")
+
+
+def get_cached_detail(job_id: str, ttl_hours: float = 24) -> dict[str, str] | None:
+    """
+    取得快取的詳細資料
+
+    Args:
+        job_id: job_id_from_url() 的結果
+        ttl_hours: 有效時間 (小時)，過期視為沒有快取
+
+    Returns:
+        DetailScraper.scrape() 的輸出，或 None
+    """
+    path = _detail_path(job_id)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict):
+        return None
+    if time.time() - entry.get('fetched_at', 0) > ttl_hours * 3600:
+        return None
+    return entry.get('detail')
+
+
+def save_cached_detail(job_id: str, detail: dict[str, str]) -> None:
+    """儲存詳細資料 (全部欄位都是空的不存，避免把抓取失敗的結果快取起來)"""
+    if not any(detail.values()):
+        return
+    os.makedirs(DETAIL_CACHE_DIR, exist_ok=True)
+    path = _detail_path(job_id)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'fetched_at': time.time(), 'detail': detail}, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def clear_detail_cache() -> int:
+    """清除全部詳細頁快取，回傳清除筆數"""
+    if not os.path.isdir(DETAIL_CACHE_DIR):
+        return 0
+    count = 0
+    for name in os.listdir(DETAIL_CACHE_DIR):
+        if name.endswith('.json'):
+            os.remove(os.path.join(DETAIL_CACHE_DIR, name))
+            count += 1
+    return count
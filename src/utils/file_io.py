@@ -3,10 +3,40 @@
 """
 
 import os
+import re
 import json
 import csv
+import time
+from contextlib import closing
+from typing import TYPE_CHECKING
 
-from config import OUTPUT_BASE_DIR, CSV_FIELDNAMES
+from config import OUTPUT_BASE_DIR, CSV_FIELDNAMES, RUN_CONFIG
+from . import job_store
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+_RE_JOB_ID: re.Pattern[str] = re.compile(r'/job/([0-9a-zA-Z]+)')
+
+
+def job_id_from_url(url: str) -> str | None:
+    """從職缺網址取出 104 職缺 ID (例如 //www.104.com.tw/job/8a2bc?jobsource=... -> 8a2bc)"""
+    m = _RE_JOB_ID.search(url or '')
+    return m.group(1) if m else None
+
+
+def dedupe_jobs(jobs: list[dict]) -> list[dict]:
+    """依職缺 ID 去除重複 (保留第一次出現的；沒有 ID 的全部保留)"""
+    seen: set[str] = set()
+    result: list[dict] = []
+    for job in jobs:
+        job_id = job_id_from_url(job.get('url') or '')
+        if job_id:
+            if job_id in seen:
+                continue
+            seen.add(job_id)
+        result.append(job)
+    return result
 
 
 def get_next_file_number(directory: str, prefix: str = "") -> int:
@@ -30,55 +60,192 @@ def get_next_file_number(directory: str, prefix: str = "") -> int:
     return max(numbers) + 1 if numbers else 1
 
 
-def save_jobs(jobs: list[dict], prefix: str = "jobs", base_dir: str | None = None) -> dict[str, str]:
+def save_jobs(jobs: list[dict], prefix: str = "jobs", base_dir: str | None = None, export: tuple[str, ...] | None = None) -> dict[str, str]:
     """
-    儲存職缺到 CSV 和 JSON 檔案
+    儲存職缺到 SQLite 資料庫 (一次執行 = 一個 run)，並匯出 export_formats 設定的格式
 
     Args:
         jobs: 職缺列表
         prefix: 檔名前綴
         base_dir: 輸出基礎目錄 (預設使用 config 設定)
+        export: 要匯出的格式 (None = RUN_CONFIG['export_formats']；空 = 只寫資料庫，之後可用 export_jobs 匯出)
 
     Returns:
-        包含 filename, json_path, csv_path
+        包含 filename, run_id, db_path, json_path, csv_path
     """
     base_dir = base_dir or OUTPUT_BASE_DIR
-    csv_dir: str = os.path.join(base_dir, "csv")
-    json_dir: str = os.path.join(base_dir, "json")
+    if export is None:
+        export = tuple(RUN_CONFIG.get('export_formats', ()))
 
-    os.makedirs(csv_dir, exist_ok=True)
-    os.makedirs(json_dir, exist_ok=True)
+    with closing(job_store.connect(base_dir)) as conn, conn:
+        # 編號同時避開舊版的 json 檔，檔名不會和以前的輸出重複
+        run_id, filename = job_store.create_run(
+            conn, prefix, min_number=get_next_file_number(os.path.join(base_dir, "json"), prefix=prefix),
+        )
+        job_store.upsert_jobs(conn, jobs, run_id)
 
-    file_number: int = get_next_file_number(json_dir, prefix=prefix)
-    filename: str = f"{prefix}_{file_number}"
-
-    json_path: str = os.path.join(json_dir, f"{filename}.json")
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(jobs, f, ensure_ascii=False, indent=2)
-    print(f"已儲存 JSON: {json_path}")
+    db_path = job_store.get_db_path(base_dir)
+    print(f"已寫入資料庫: {db_path} (run {run_id})")
 
-    csv_path: str = os.path.join(csv_dir, f"{filename}.csv")
-    if jobs:
-        with open(csv_path, 'w', encoding='utf-8-sig', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=CSV_FIELDNAMES, extrasaction='ignore')
-            writer.writeheader()
-            writer.writerows(jobs)
-    print(f"已儲存 CSV: {csv_path}")
+    paths = export_jobs(filename, export, base_dir, jobs=jobs)
 
     print(f"總共儲存 {len(jobs)} 個職缺 (檔案: {filename})")
 
     return {
         'filename': filename,
-        'json_path': json_path,
-        'csv_path': csv_path,
+        'run_id': str(run_id),
+        'db_path': db_path,
+        'json_path': paths.get('json', os.path.join(base_dir, "json", f"{filename}.json")),
+        'csv_path': paths.get('csv', os.path.join(base_dir, "csv", f"{filename}.csv")),
+        'parquet_path': paths.get('parquet', ''),
     }
 
 
+def get_latest_run(base_dir: str | None = None) -> str | None:
+    """資料庫中最近一次執行的名稱 (如 jobs_3)，沒有時回傳 None"""
+    base_dir = base_dir or OUTPUT_BASE_DIR
+    if not os.path.exists(job_store.get_db_path(base_dir)):
+        return None
+    with closing(job_store.connect(base_dir)) as conn:
+        return job_store.latest_run_name(conn)
+
+
+def export_jobs(filename: str, formats: tuple[str, ...] = ('json', 'csv'), base_dir: str | None = None, jobs: list[dict] | None = None) -> dict[str, str]:
+    """
+    把一次執行的職缺匯出成 JSON / CSV / Parquet
+
+    Args:
+        filename: 執行名稱 (如 jobs_3)
+        formats: 'json' / 'csv' / 'parquet'
+        base_dir: 輸出基礎目錄
+        jobs: 已在記憶體中的資料 (None = 從資料庫讀取)
+
+    Returns:
+        {格式: 檔案路徑}
+    """
+    base_dir = base_dir or OUTPUT_BASE_DIR
+    if not formats:
+        return {}
+    if jobs is None:
+        jobs = load_jobs(filename, base_dir)
+
+    paths: dict[str, str] = {}
+
+    if 'json' in formats:
+        json_dir: str = os.path.join(base_dir, "json")
+        os.makedirs(json_dir, exist_ok=True)
+        json_path: str = os.path.join(json_dir, f"{filename}.json")
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(_exportable(jobs), f, ensure_ascii=False, indent=2)
+        print(f"已儲存 JSON: {json_path}")
+        paths['json'] = json_path
+
+    if 'csv' in formats:
+        csv_dir: str = os.path.join(base_dir, "csv")
+        os.makedirs(csv_dir, exist_ok=True)
+        csv_path: str = os.path.join(csv_dir, f"{filename}.csv")
+        if jobs:
+            with open(csv_path, 'w', encoding='utf-8-sig', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=CSV_FIELDNAMES, extrasaction='ignore')
+                writer.writeheader()
+                writer.writerows(jobs)
+        print(f"已儲存 CSV: {csv_path}")
+        paths['csv'] = csv_path
+
+    if 'parquet' in formats:
+        try:
+            paths['parquet'] = export_parquet(filename, jobs, base_dir)
+        except ImportError as e:
+            print(f"略過 Parquet 匯出: {e}")
+
+    return paths
+
+
+def export_parquet(filename: str, jobs: list[dict], base_dir: str | None = None, run_date: str | None = None) -> str:
+    """
+    匯出成 Parquet (output/parquet/run_date=YYYY-MM-DD/<filename>.parquet，hive 分區)
+
+    Args:
+        filename: 執行名稱 (如 jobs_3)，同時寫入 run 欄位
+        jobs: 職缺資料
+        run_date: 分區日期 (None = 該次執行的建立日期，找不到時用今天)
+
+    Raises:
+        ImportError: 沒有安裝 pandas / pyarrow (pip install jobsniper[parquet])
+    """
+    pd = _require_parquet()
+    base_dir = base_dir or OUTPUT_BASE_DIR
+    run_date = run_date or _run_date(filename, base_dir)
+
+    df = pd.DataFrame(
+        [{field: str(job.get(field) or '') for field in CSV_FIELDNAMES} for job in jobs],
+        columns=CSV_FIELDNAMES,
+    )
+    df.insert(0, 'job_id', [job_id_from_url(str(job.get('url') or '')) or '' for job in jobs])
+    df.insert(1, 'run', filename)
+
+    partition_dir = os.path.join(base_dir, "parquet", f"run_date={run_date}")
+    os.makedirs(partition_dir, exist_ok=True)
+    parquet_path = os.path.join(partition_dir, f"{filename}.parquet")
+    df.to_parquet(parquet_path, engine='pyarrow', index=False, compression='zstd')
+    print(f"已儲存 Parquet: {parquet_path}")
+    return parquet_path
+
+
+def load_jobs_df(filename: str | None = None, columns: list[str] | None = None, base_dir: str | None = None, run_date: str | None = None) -> 'pd.DataFrame':
+    """
+    以 DataFrame 載入職缺 (給分析用，不必解析大型 JSON)
+
+    Args:
+        filename: 執行名稱；None = 所有已匯出 Parquet 的執行
+        columns: 只讀取的欄位 (Parquet 為欄式儲存，未選的欄位不會被讀取)
+        base_dir: 輸出基礎目錄
+        run_date: 只讀取某一天的分區 (YYYY-MM-DD，filename 為 None 時有效)
+
+    Returns:
+        DataFrame；有 Parquet 時讀 Parquet，否則從資料庫讀取該次執行
+    """
+    import pandas as pd
+
+    base_dir = base_dir or OUTPUT_BASE_DIR
+    parquet_dir = os.path.join(base_dir, "parquet")
+
+    if filename is None:
+        _require_parquet()
+        if not os.path.isdir(parquet_dir):
+            return pd.DataFrame(columns=columns or CSV_FIELDNAMES)
+        filters = [('run_date', '=', run_date)] if run_date else None
+        return pd.read_parquet(parquet_dir, engine='pyarrow', columns=columns, filters=filters)
+
+    if os.path.isdir(parquet_dir):
+        for partition in sorted(os.listdir(parquet_dir), reverse=True):
+            path = os.path.join(parquet_dir, partition, f"{filename}.parquet")
+            if os.path.exists(path):
+                _require_parquet()
+                return pd.read_parquet(path, engine='pyarrow', columns=columns)
+
+    if os.path.exists(job_store.get_db_path(base_dir)):
+        with closing(job_store.connect(base_dir)) as conn:
+            run_id = job_store.get_run_id(conn, filename)
+            if run_id is not None:
+                return pd.DataFrame(job_store.fetch_run_jobs(conn, run_id, columns=columns or CSV_FIELDNAMES), columns=columns or CSV_FIELDNAMES)
+
+    jobs = load_jobs(filename, base_dir)
+    df = pd.DataFrame(jobs)
+    return df[[c for c in columns if c in df.columns]] if columns else df
+
+
 def load_jobs(filename: str, base_dir: str | None = None) -> list[dict]:
-    """載入已存的職缺資料"""
+    """載入已存的職缺資料 (資料庫優先，舊版只有 JSON 檔的執行也能讀)"""
     base_dir = base_dir or OUTPUT_BASE_DIR
-    json_path: str = os.path.join(base_dir, "json", f"{filename}.json")
 
+    if os.path.exists(job_store.get_db_path(base_dir)):
+        with closing(job_store.connect(base_dir)) as conn:
+            run_id = job_store.get_run_id(conn, filename)
+            if run_id is not None:
+                return job_store.fetch_run_jobs(conn, run_id)
+
+    json_path: str = os.path.join(base_dir, "json", f"{filename}.json")
     if os.path.exists(json_path):
         with open(json_path, 'r', encoding='utf-8') as f:
             return json.load(f)
@@ -87,7 +254,7 @@ def load_jobs(filename: str, base_dir: str | None = None) -> list[dict]:
 
 def update_job(filename: str, job_index: int, detail: dict, base_dir: str | None = None) -> bool:
     """
-    更新單一職缺的詳細資訊
+    更新單一職缺的詳細資訊 (資料庫只更新該筆；CSV / JSON 需要時用 export_jobs 重新匯出)
 
     Args:
         filename: 檔案名稱 (如 test_1, complete_1)
@@ -96,6 +263,14 @@ def update_job(filename: str, job_index: int, detail: dict, base_dir: str | None
         base_dir: 輸出基礎目錄
     """
     base_dir = base_dir or OUTPUT_BASE_DIR
+
+    if os.path.exists(job_store.get_db_path(base_dir)):
+        with closing(job_store.connect(base_dir)) as conn, conn:
+            run_id = job_store.get_run_id(conn, filename)
+            if run_id is not None:
+                return job_store.update_run_job(conn, run_id, job_index, detail)
+
+    # 舊版輸出 (資料庫建立前的 JSON / CSV)：整份重寫
     json_path: str = os.path.join(base_dir, "json", f"{filename}.json")
     csv_path: str = os.path.join(base_dir, "csv", f"{filename}.csv")
 
@@ -114,3 +289,27 @@ def update_job(filename: str, job_index: int, detail: dict, base_dir: str | None
         writer.writerows(jobs)
 
     return True
+
+
+def _require_parquet():
+    """確認 Parquet 相依套件，回傳 pandas 模組"""
+    try:
+        import pandas as pd
+        import pyarrow  # noqa: F401
+    except ImportError as e:
+        raise ImportError(f"Parquet 需要 pandas + pyarrow (pip install jobsniper[parquet]): {e}") from e
+    return pd
+
+
+def _run_date(filename: str, base_dir: str) -> str:
+    """執行的建立日期 (YYYY-MM-DD)"""
+    created_at = None
+    if os.path.exists(job_store.get_db_path(base_dir)):
+        with closing(job_store.connect(base_dir)) as conn:
+            created_at = job_store.get_run_created_at(conn, filename)
+    return time.strftime('%Y-%m-%d', time.localtime(created_at or time.time()))
+
+
+def _exportable(jobs: list[dict]) -> list[dict]:
+    """去掉不能 / 不需要輸出的暫存欄位 (Locator、job_index)"""
+    return [{k: v for k, v in job.items() if k not in ('card', 'job_index')} for job in jobs]
@@ -0,0 +1,32 @@
+"""
+跨 process 的檔案鎖 — 多個分片 process / thread 讀寫同一個快取檔時使用
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import IO
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+@contextmanager
+def locked_file(path: str) -> Iterator[IO[str]]:
+    """開啟檔案 (不存在時建立) 並取得獨占鎖 (POSIX: flock / Windows: 鎖第一個 byte)"""
+    with open(path, 'a+', encoding='utf-8') as f:
+        f.seek(0)
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield f
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
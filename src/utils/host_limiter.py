@@ -0,0 +1,132 @@
+"""
+主機請求限流 — 每個主機一個 token bucket，狀態放在檔案裡並以檔案鎖保護，
+同一台機器上的所有 tab、worker thread 與分片 process 共用同一個額度
+"""
+
+import os
+import re
+import json
+import time
+import asyncio
+import logging
+import threading
+from typing import IO
+from urllib.parse import urlsplit
+
+from config import CACHE_DIR
+
+from .file_lock import locked_file
+
+logger = logging.getLogger(__name__)
+
+HOST_LIMIT_DIR: str = os.path.join(CACHE_DIR, "host_limits")
+
+
+class HostRateLimiter:
+    """
+    跨 process 的 token bucket
+
+    每個主機最多累積 burst 個 token，每分鐘補 rate 個，每次導向前取一個。
+    沒有 token 時先預約 (token 記為負數) 再於鎖外等待，多個 process 依預約順序錯開。
+    rate = 0 時不限流。
+    """
+
+    LOG_WAIT_SEC: float = 5.0
+
+    def __init__(self, state_dir: str = HOST_LIMIT_DIR) -> None:
+        self.state_dir: str = state_dir
+        self.rate: float = 0.0
+        self.burst: float = 1.0
+        self.requests: int = 0
+        self.waited: int = 0
+        self.total_wait: float = 0.0
+        self.max_wait: float = 0.0
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.rate > 0
+
+    def configure(self, config: dict) -> None:
+        """依 RUN_CONFIG 設定速率與 burst (每次執行開始時呼叫，重設統計)"""
+        self.rate = max(0.0, float(config.get('host_rate', 0) or 0))
+        self.burst = max(1.0, float(config.get('host_burst', 1) or 1))
+        with self._lock:
+            self.requests = self.waited = 0
+            self.total_wait = self.max_wait = 0.0
+        if self.enabled:
+            os.makedirs(self.state_dir, exist_ok=True)
+
+    def acquire(self, url: str) -> float:
+        """取得一個 token (必要時等待)，回傳等待秒數"""
+        delay = self._reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def async_acquire(self, url: str) -> float:
+        """acquire 的 async 版本 (取檔案鎖會阻塞，在 thread 中進行，不卡住 event loop)"""
+        if not self.enabled:
+            return 0.0
+        delay = await asyncio.to_thread(self._reserve, url)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def summary(self) -> str:
+        """等待時間統計"""
+        average = self.total_wait / self.waited if self.waited else 0.0
+        return (f"{self.requests} 個請求，等待 {self.waited} 次，共 {self.total_wait:.1f} 秒"
+                f" (平均 {average:.1f} 秒，最長 {self.max_wait:.1f} 秒)")
+
+    # ── Private ──
+
+    def _reserve(self, url: str) -> float:
+        if not self.enabled:
+            return 0.0
+        host = urlsplit(url).hostname or url
+        refill = self.rate / 60
+
+        try:
+            with locked_file(self._state_path(host)) as f:
+                state = self._read(f)
+                now = time.time()
+                tokens = min(self.burst, state.get('tokens', self.burst) + (now - state.get('updated', now)) * refill)
+                tokens -= 1
+                self._write(f, {'tokens': tokens, 'updated': now})
+        except OSError as e:
+            logger.debug(f"主機限流狀態讀寫失敗 ({host}): {e}")
+            return 0.0
+
+        delay = max(0.0, -tokens / refill)
+        with self._lock:
+            self.requests += 1
+            if delay > 0:
+                self.waited += 1
+                self.total_wait += delay
+                self.max_wait = max(self.max_wait, delay)
+        if delay >= self.LOG_WAIT_SEC:
+            print(f"[HostLimit] {host} 額度用完，等待 {delay:.1f} 秒")
+        else:
+            logger.debug(f"主機限流 {host}: 剩餘 {tokens:.2f} token，等待 {delay:.2f} 秒")
+        return delay
+
+    def _state_path(self, host: str) -> str:
+        return os.path.join(self.state_dir, re.sub(r'[^\w.-]', '_', host) + '.json')
+
+    def _read(self, f: IO[str]) -> dict[str, float]:
+        f.seek(0)
+        try:
+            return json.loads(f.read() or '{}')
+        except ValueError:
+            return {}
+
+    def _write(self, f: IO[str], state: dict[str, float]) -> None:
+        f.seek(0)
+        f.truncate()
+        f.write(json.dumps(state))
+        f.flush()
+
+
+# 全域實例
+host_limiter = HostRateLimiter()
@@ -4,8 +4,14 @@
 
 import time
 import random
+import asyncio
+import threading
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
 
 from playwright.sync_api import Page
+from playwright.async_api import Page as AsyncPage
 
 
 def random_delay(min_sec: float = 1, max_sec: float = 3) -> None:
@@ -14,15 +20,147 @@ def random_delay(min_sec: float = 1, max_sec: float = 3) -> None:
     time.sleep(delay)
 
 
-def smart_delay(human_like: str = 'normal', delay_multiplier: float = 1.0, level: str = 'normal') -> None:
+class RateGovernor:
     """
-    根據 human_like 設定和 level 自動計算延遲
+    自適應請求速率 (AIMD)
 
-    Args:
-        human_like: 人類行為模擬程度 ('minimal', 'normal', 'full')
-        delay_multiplier: 延遲倍率
-        level: 延遲等級 ('short', 'normal', 'long')
+    每次 smart_delay 依目前速率排出下一個時間點 (頁面載入的時間也算在間隔內)。
+    順利載入時速率慢慢加 (+INCREASE_PER_MIN)，遇到驗證、載入變慢或錯誤率過高時
+    乘上 backoff 降速，速率維持在 rate_min ~ rate_max (次/分)。
+    pacing="fixed" 時不啟用，smart_delay 照舊查延遲表。
     """
+
+    INCREASE_PER_MIN: float = 0.5
+    CAPTCHA_BACKOFF: float = 0.5
+    SLOW_BACKOFF: float = 0.8
+    LATENCY_TARGET_SEC: float = 5.0
+    ERROR_WINDOW: int = 20
+    ERROR_THRESHOLD: float = 0.2
+    CAPTCHA_COOLDOWN: int = 10
+    LOG_EVERY: int = 20
+    LEVEL_FACTORS: dict[str, float] = {'short': 0.5, 'normal': 1.0, 'long': 2.0}
+
+    def __init__(self) -> None:
+        self.enabled: bool = False
+        self.rate_min: float = 6.0
+        self.rate_max: float = 30.0
+        self.rate: float = 18.0
+        self.latency: float = 0.0
+        self.captcha_hits: int = 0
+        self.errors: int = 0
+        self.requests: int = 0
+        self._outcomes: deque[bool] = deque(maxlen=self.ERROR_WINDOW)
+        self._cooldown: int = 0
+        self._next_at: float = 0.0
+        self._lock: threading.Lock = threading.Lock()
+
+    def configure(self, config: dict) -> None:
+        """依 RUN_CONFIG 啟用或停用 (每次執行開始時呼叫，重設統計)"""
+        with self._lock:
+            self.enabled = config.get('pacing', 'fixed') == 'adaptive'
+            self.rate_min = max(0.1, float(config.get('rate_min', 6) or 6))
+            self.rate_max = max(self.rate_min, float(config.get('rate_max', 30) or 30))
+            self.rate = (self.rate_min + self.rate_max) / 2
+            self.latency = 0.0
+            self.captcha_hits = self.errors = self.requests = 0
+            self._outcomes.clear()
+            self._cooldown = 0
+            self._next_at = 0.0
+        if self.enabled:
+            print(f"[Rate] 自適應速率: {self.rate:.1f} 次/分 (範圍 {self.rate_min:g} ~ {self.rate_max:g})")
+
+    def reserve(self, level: str = 'normal') -> float:
+        """排入下一個請求，回傳需要等待的秒數 (多個 worker 共用時依序錯開)"""
+        interval = 60 / self.rate * self.LEVEL_FACTORS.get(level, 1.0) * random.uniform(0.8, 1.2)
+        with self._lock:
+            now = time.monotonic()
+            # 距離上一個請求已超過間隔時只留一小段停頓
+            delay = max(self._next_at - now, interval * 0.2)
+            self._next_at = now + delay + interval
+            return delay
+
+    def wait(self, level: str = 'normal') -> None:
+        """依目前速率等待"""
+        time.sleep(self.reserve(level))
+
+    async def async_wait(self, level: str = 'normal') -> None:
+        """wait 的 async 版本"""
+        await asyncio.sleep(self.reserve(level))
+
+    @contextmanager
+    def track(self) -> Iterator[None]:
+        """量測一次頁面載入：成功記錄延遲，例外記錄錯誤後往外拋"""
+        started = time.monotonic()
+        try:
+            yield
+        except BaseException:
+            self.record_error()
+            raise
+        self.record_success(time.monotonic() - started)
+
+    def record_success(self, latency: float) -> None:
+        """頁面順利載入"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.requests += 1
+            self._outcomes.append(True)
+            self.latency = latency if not self.latency else self.latency * 0.7 + latency * 0.3
+            if self.latency > self.LATENCY_TARGET_SEC:
+                self._decrease(self.SLOW_BACKOFF, f"載入 {self.latency:.1f}s")
+                self.latency = self.LATENCY_TARGET_SEC
+            elif self._cooldown > 0:
+                self._cooldown -= 1
+            else:
+                self._set_rate(self.rate + self.INCREASE_PER_MIN)
+            if self.requests % self.LOG_EVERY == 0:
+                print(f"[Rate] {self.summary()}")
+
+    def record_error(self) -> None:
+        """載入失敗 (逾時、連線錯誤)"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.requests += 1
+            self.errors += 1
+            self._outcomes.append(False)
+            failed = self._outcomes.count(False)
+            if len(self._outcomes) >= self.ERROR_WINDOW // 2 and failed / len(self._outcomes) > self.ERROR_THRESHOLD:
+                self._decrease(self.SLOW_BACKOFF, f"錯誤率 {failed / len(self._outcomes):.0%}")
+                self._outcomes.clear()
+
+    def record_captcha(self) -> None:
+        """出現驗證：速率減半，之後 CAPTCHA_COOLDOWN 次請求內不加速"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.captcha_hits += 1
+            self._cooldown = self.CAPTCHA_COOLDOWN
+            self._decrease(self.CAPTCHA_BACKOFF, "出現驗證")
+
+    def summary(self) -> str:
+        """目前速率與統計"""
+        return (f"{self.rate:.1f} 次/分 (請求 {self.requests}，平均載入 {self.latency:.1f}s，"
+                f"錯誤 {self.errors}，驗證 {self.captcha_hits})")
+
+    # ── Private ──
+
+    def _set_rate(self, rate: float) -> float:
+        self.rate = min(self.rate_max, max(self.rate_min, rate))
+        return self.rate
+
+    def _decrease(self, factor: float, reason: str) -> None:
+        before = self.rate
+        after = self._set_rate(self.rate * factor)
+        print(f"[Rate] ↓ {before:.1f} → {after:.1f} 次/分 ({reason})")
+
+
+# 全域實例 (同一個 process 的所有 tab / worker 共用)
+rate_governor = RateGovernor()
+
+
+def _smart_delay_range(human_like: str, delay_multiplier: float, level: str) -> tuple[float, float]:
+    """依 human_like 與 level 查表，回傳 (min_sec, max_sec)"""
     delay_table: dict[str, dict[str, tuple[float, float]]] = {
         'minimal': {'short': (0.5, 1), 'normal': (0.5, 1), 'long': (1, 2)},
         'normal': {'short': (0.5, 1), 'normal': (1, 2), 'long': (2, 4)},
@@ -32,8 +170,24 @@ def smart_delay(human_like: str = 'normal', delay_multiplier: float = 1.0, level
     human_like = human_like if human_like in delay_table else 'normal'
     level = level if level in delay_table[human_like] else 'normal'
     min_sec, max_sec = delay_table[human_like][level]
+    return min_sec * delay_multiplier, max_sec * delay_multiplier
+
+
+def smart_delay(human_like: str = 'normal', delay_multiplier: float = 1.0, level: str = 'normal') -> None:
+    """
+    根據 human_like 設定和 level 自動計算延遲
+
+    Args:
+        human_like: 人類行為模擬程度 ('minimal', 'normal', 'full')
+        delay_multiplier: 延遲倍率
+        level: 延遲等級 ('short', 'normal', 'long')
 
-    random_delay(min_sec * delay_multiplier, max_sec * delay_multiplier)
+    pacing="adaptive" 時改由 rate_governor 依目前速率決定 (不查延遲表)
+    """
+    if rate_governor.enabled:
+        rate_governor.wait(level)
+        return
+    random_delay(*_smart_delay_range(human_like, delay_multiplier, level))
 
 
 def human_like_scroll(page: Page) -> None:
@@ -85,3 +239,62 @@ def human_like_long_break() -> None:
         print(f"    ☕ 長休息 {delay:.1f} 秒...")
 
     time.sleep(delay)
+
+
+# ── Async 版本 (給 AsyncJobSearcher 使用，延遲不會阻塞 event loop) ──
+
+async def async_random_delay(min_sec: float = 1, max_sec: float = 3) -> None:
+    """隨機延遲 (async)"""
+    await asyncio.sleep(random.uniform(min_sec, max_sec))
+
+
+async def async_smart_delay(human_like: str = 'normal', delay_multiplier: float = 1.0, level: str = 'normal') -> None:
+    """smart_delay 的 async 版本"""
+    if rate_governor.enabled:
+        await rate_governor.async_wait(level)
+        return
+    await async_random_delay(*_smart_delay_range(human_like, delay_multiplier, level))
+
+
+async def async_human_like_scroll(page: AsyncPage) -> None:
+    """模擬人類滾動行為 (async)"""
+    scroll_times = random.randint(2, 4)
+    for _ in range(scroll_times):
+        scroll_distance = random.randint(200, 500)
+        await page.mouse.wheel(0, scroll_distance)
+        await async_random_delay(0.3, 0.8)
+
+
+async def async_human_like_mouse_move(page: AsyncPage) -> None:
+    """模擬人類滑鼠移動 (async)"""
+    try:
+        x = random.randint(100, 800)
+        y = random.randint(100, 600)
+        await page.mouse.move(x, y)
+        await async_random_delay(0.1, 0.3)
+    except:
+        pass
+
+
+async def async_human_like_pause(page: AsyncPage) -> None:
+    """模擬人類閱讀停頓 (async)"""
+    await async_random_delay(1, 3)
+    if random.random() > 0.5:
+        await page.mouse.wheel(0, random.randint(50, 150))
+        await async_random_delay(0.3, 0.5)
+
+
+async def async_human_like_long_break() -> None:
+    """human_like_long_break 的 async 版本"""
+    roll = random.random()
+
+    if roll < 0.7:
+        delay = random.uniform(2, 5)
+    elif roll < 0.9:
+        delay = random.uniform(5, 10)
+        print(f"    ☕ 休息 {delay:.1f} 秒...")
+    else:
+        delay = random.uniform(10, 20)
+        print(f"    ☕ 長休息 {delay:.1f} 秒...")
+
+    await asyncio.sleep(delay)
@@ -0,0 +1,238 @@
+"""
+SQLite 職缺資料庫 — 以職缺 ID 為 key 累積所有執行的結果
+
+資料表：
+    runs     每次執行 (run_id, name = 檔名如 jobs_3)
+    jobs     職缺最新的資料 (job_key = 104 職缺 ID，沒有 ID 時用網址 hash)，跨執行 upsert
+    run_jobs 每次執行當下的職缺資料 (保留該次執行的順序，對應 update_job 的 job_index)；
+             之後的執行只更新 jobs，舊的執行內容不會改變
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+
+from config import OUTPUT_BASE_DIR, CSV_FIELDNAMES
+
+DB_FILENAME: str = "jobs.db"
+
+# 詳細欄位：upsert 時空值不覆蓋舊資料 (例如這次沒抓詳細頁)
+_DETAIL_FIELDS: list[str] = [f for f in CSV_FIELDNAMES if f.startswith('detailed_')]
+# 不寫入資料庫的暫存欄位
+_TRANSIENT_FIELDS: set[str] = {'card', 'job_index'}
+# 執行名稱衝突時的重試次數
+_CREATE_RUN_ATTEMPTS: int = 20
+
+_SCHEMA: str = f"""
+CREATE TABLE IF NOT EXISTS runs (
+    run_id      INTEGER PRIMARY KEY AUTOINCREMENT,
+    name        TEXT NOT NULL UNIQUE,
+    prefix      TEXT NOT NULL,
+    created_at  REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS jobs (
+    job_key     TEXT PRIMARY KEY,
+    {', '.join(f'{field} TEXT' for field in CSV_FIELDNAMES)},
+    extra       TEXT,
+    first_seen  REAL NOT NULL,
+    updated_at  REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS run_jobs (
+    run_id      INTEGER NOT NULL REFERENCES runs(run_id),
+    position    INTEGER NOT NULL,
+    job_key     TEXT NOT NULL REFERENCES jobs(job_key),
+    {', '.join(f'{field} TEXT' for field in CSV_FIELDNAMES)},
+    extra       TEXT,
+    PRIMARY KEY (run_id, position)
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs(company);
+CREATE INDEX IF NOT EXISTS idx_jobs_location ON jobs(location);
+CREATE INDEX IF NOT EXISTS idx_jobs_salary ON jobs(salary);
+CREATE INDEX IF NOT EXISTS idx_run_jobs_job ON run_jobs(job_key);
+"""
+
+
+def get_db_path(base_dir: str | None = None) -> str:
+    """資料庫檔案路徑"""
+    return os.path.join(base_dir or OUTPUT_BASE_DIR, DB_FILENAME)
+
+
+def connect(base_dir: str | None = None) -> sqlite3.Connection:
+    """
+    開啟資料庫 (不存在時建立 schema)
+
+    WAL 模式 + busy timeout：分片 process 同時寫入時會排隊而不是失敗。
+    """
+    path = get_db_path(base_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    conn = sqlite3.connect(path, timeout=30)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(_SCHEMA)
+    _migrate(conn)
+    return conn
+
+
+def job_key(job: dict) -> str:
+    """職缺的主鍵：104 職缺 ID，沒有時用網址 (或標題 + 公司) 的 hash"""
+    from .file_io import job_id_from_url  # file_io 也 import 本模組
+
+    job_id = job_id_from_url(str(job.get('url') or ''))
+    if job_id:
+        return job_id
+    raw = str(job.get('url') or '') or f"{job.get('title', '')}|{job.get('company', '')}"
+    return 'h_' + hashlib.sha1(raw.encode('utf-8')).hexdigest()[:16]
+
+
+def next_run_number(conn: sqlite3.Connection, prefix: str) -> int:
+    """資料庫中該前綴的下一個編號"""
+    numbers = [
+        int(row['name'][len(prefix) + 1:])
+        for row in conn.execute("SELECT name FROM runs WHERE prefix = ?", (prefix,))
+        if row['name'][len(prefix) + 1:].isdigit()
+    ]
+    return max(numbers) + 1 if numbers else 1
+
+
+def create_run(conn: sqlite3.Connection, prefix: str, min_number: int = 1) -> tuple[int, str]:
+    """
+    建立一次執行 (名稱 = prefix_N，N 取下一個編號)，回傳 (run_id, name)
+
+    分片 process 可能同時算出同一個編號：名稱衝突 (UNIQUE) 時改用下一個編號重試。
+    """
+    number = max(min_number, next_run_number(conn, prefix))
+    for _ in range(_CREATE_RUN_ATTEMPTS):
+        name = f"{prefix}_{number}"
+        try:
+            cursor = conn.execute(
+                "INSERT INTO runs (name, prefix, created_at) VALUES (?, ?, ?)",
+                (name, prefix, time.time()),
+            )
+            return int(cursor.lastrowid), name
+        except sqlite3.IntegrityError:
+            number = max(number + 1, next_run_number(conn, prefix))
+    raise sqlite3.IntegrityError(f"無法建立執行 {prefix}_N (重試 {_CREATE_RUN_ATTEMPTS} 次)")
+
+
+def latest_run_name(conn: sqlite3.Connection) -> str | None:
+    """最近一次執行的名稱"""
+    row = conn.execute("SELECT name FROM runs ORDER BY run_id DESC LIMIT 1").fetchone()
+    return row['name'] if row else None
+
+
+def get_run_created_at(conn: sqlite3.Connection, name: str) -> float | None:
+    """依檔名取得執行建立時間 (epoch 秒)"""
+    row = conn.execute("SELECT created_at FROM runs WHERE name = ?", (name,)).fetchone()
+    return float(row['created_at']) if row else None
+
+
+def get_run_id(conn: sqlite3.Connection, name: str) -> int | None:
+    """依檔名 (如 jobs_3) 取得 run_id"""
+    row = conn.execute("SELECT run_id FROM runs WHERE name = ?", (name,)).fetchone()
+    return int(row['run_id']) if row else None
+
+
+def upsert_jobs(conn: sqlite3.Connection, jobs: list[dict], run_id: int | None = None, start_position: int = 0) -> int:
+    """
+    寫入 / 更新職缺，並 (有 run_id 時) 依序存一份到該次執行
+
+    Returns:
+        寫入筆數
+    """
+    now = time.time()
+    fields = ', '.join(CSV_FIELDNAMES)
+    placeholders = ', '.join('?' for _ in CSV_FIELDNAMES)
+    updates = ', '.join(
+        f"{f} = COALESCE(NULLIF(excluded.{f}, ''), jobs.{f})" if f in _DETAIL_FIELDS else f"{f} = excluded.{f}"
+        for f in CSV_FIELDNAMES
+    )
+    sql = (
+        f"INSERT INTO jobs (job_key, {fields}, extra, first_seen, updated_at) "
+        f"VALUES (?, {placeholders}, ?, ?, ?) "
+        f"ON CONFLICT(job_key) DO UPDATE SET {updates}, "
+        f"extra = COALESCE(excluded.extra, jobs.extra), updated_at = excluded.updated_at"
+    )
+
+    job_rows = []
+    run_rows = []
+    for position, job in enumerate(jobs, start_position):
+        key = job_key(job)
+        values = [_text(job.get(f)) for f in CSV_FIELDNAMES]
+        extra = {k: v for k, v in job.items() if k not in CSV_FIELDNAMES and k not in _TRANSIENT_FIELDS}
+        extra_json = json.dumps(extra, ensure_ascii=False, default=str) if extra else None
+        job_rows.append((key, *values, extra_json, now, now))
+        if run_id is not None:
+            run_rows.append((run_id, position, key, *values, extra_json))
+
+    conn.executemany(sql, job_rows)
+    if run_rows:
+        conn.executemany(
+            f"INSERT OR REPLACE INTO run_jobs (run_id, position, job_key, {fields}, extra) "
+            f"VALUES (?, ?, ?, {placeholders}, ?)",
+            run_rows,
+        )
+    return len(job_rows)
+
+
+def fetch_run_jobs(conn: sqlite3.Connection, run_id: int, columns: list[str] | None = None) -> list[dict]:
+    """
+    依執行順序取出該次執行當下的職缺資料
+
+    Args:
+        columns: 只取部分欄位 (None = CSV_FIELDNAMES + extra)
+    """
+    selected = [c for c in (columns or CSV_FIELDNAMES) if c in CSV_FIELDNAMES]
+    with_extra = columns is None
+    sql = (
+        f"SELECT {', '.join(selected)}{', extra' if with_extra else ''} "
+        "FROM run_jobs WHERE run_id = ? ORDER BY position"
+    )
+    jobs = []
+    for row in conn.execute(sql, (run_id,)):
+        job = {c: row[c] if row[c] is not None else '' for c in selected}
+        if with_extra and row['extra']:
+            job.update(json.loads(row['extra']))
+        jobs.append(job)
+    return jobs
+
+
+def update_run_job(conn: sqlite3.Connection, run_id: int, position: int, detail: dict) -> bool:
+    """更新某次執行中第 position 個職缺的欄位 (只更新該次執行的這一筆，其他執行不受影響)"""
+    values = {k: _text(v) for k, v in detail.items() if k in CSV_FIELDNAMES}
+    if not values:
+        row = conn.execute(
+            "SELECT 1 FROM run_jobs WHERE run_id = ? AND position = ?", (run_id, position)
+        ).fetchone()
+        return row is not None
+
+    assignments = ', '.join(f"{k} = ?" for k in values)
+    cursor = conn.execute(
+        f"UPDATE run_jobs SET {assignments} WHERE run_id = ? AND position = ?",
+        (*values.values(), run_id, position),
+    )
+    return cursor.rowcount > 0
+
+
+def _migrate(conn: sqlite3.Connection) -> None:
+    """舊版的 run_jobs 只存 job_key：補上欄位，並以目前 jobs 的資料填入"""
+    existing = {row['name'] for row in conn.execute("PRAGMA table_info(run_jobs)")}
+    missing = [c for c in [*CSV_FIELDNAMES, 'extra'] if c not in existing]
+    if not missing:
+        return
+    with conn:
+        for column in missing:
+            conn.execute(f"ALTER TABLE run_jobs ADD COLUMN {column} TEXT")
+        conn.execute(
+            f"UPDATE run_jobs SET ({', '.join(missing)}) = "
+            f"(SELECT {', '.join(missing)} FROM jobs WHERE jobs.job_key = run_jobs.job_key)"
+        )
+
+
+def _text(value: object) -> str:
+    if value is None:
+        return ''
+    return value if isinstance(value, str) else str(value)
+
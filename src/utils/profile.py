@@ -0,0 +1,85 @@
+"""
+瀏覽器 profile 管理 (持久化 profile 模式的大小限制與清理)
+"""
+
+import os
+import shutil
+import logging
+
+from config import PROFILE_DIR
+
+logger = logging.getLogger(__name__)
+
+# Chromium profile 中可以安全刪除的快取目錄 (cookie / localStorage 不受影響)
+PROFILE_CACHE_DIRS: list[str] = [
+    os.path.join('Default', 'Cache'),
+    os.path.join('Default', 'Code Cache'),
+    os.path.join('Default', 'GPUCache'),
+    os.path.join('Default', 'Service Worker', 'CacheStorage'),
+    os.path.join('Default', 'Service Worker', 'ScriptCache'),
+    'GrShaderCache',
+    'ShaderCache',
+    'GraphiteDawnCache',
+]
+
+
+def get_profile_dir(name: str = 'default') -> str:
+    """profile 目錄 (PROFILE_DIR/<name>，分片 worker 各自一個)"""
+    return os.path.join(PROFILE_DIR, name)
+
+
+def get_dir_size(path: str) -> int:
+    """目錄總大小 (bytes)"""
+    total = 0
+    for root, _dirs, files in os.walk(path):
+        for f in files:
+            try:
+                total += os.path.getsize(os.path.join(root, f))
+            except OSError:
+                pass
+    return total
+
+
+def clear_profile_cache(profile_dir: str) -> int:
+    """
+    清除 profile 的快取 (保留 cookie 與登入狀態)
+
+    Returns:
+        釋放的 bytes
+    """
+    freed = 0
+    for sub in PROFILE_CACHE_DIRS:
+        path = os.path.join(profile_dir, sub)
+        if os.path.isdir(path):
+            freed += get_dir_size(path)
+            shutil.rmtree(path, ignore_errors=True)
+    return freed
+
+
+def enforce_profile_limit(profile_dir: str, max_mb: float) -> None:
+    """profile 超過大小上限時清除快取 (瀏覽器啟動前呼叫)"""
+    if max_mb <= 0 or not os.path.isdir(profile_dir):
+        return
+
+    size = get_dir_size(profile_dir)
+    if size <= max_mb * 1_000_000:
+        return
+
+    freed = clear_profile_cache(profile_dir)
+    print(f"Profile 超過 {max_mb:.0f} MB ({size / 1_000_000:.0f} MB)，已清除快取 {freed / 1_000_000:.0f} MB")
+
+
+def delete_profiles() -> int:
+    """
+    刪除所有 profile (含 cookie，下次執行會從 session.json 重新載入登入狀態)
+
+    Returns:
+        釋放的 bytes
+    """
+    if not os.path.isdir(PROFILE_DIR):
+        return 0
+
+    size = get_dir_size(PROFILE_DIR)
+    shutil.rmtree(PROFILE_DIR, ignore_errors=True)
+    logger.debug(f"已刪除 profile 目錄: {PROFILE_DIR}")
+    return size
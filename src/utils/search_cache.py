@@ -0,0 +1,77 @@
+"""
+搜尋 URL 快取 — 記住 UI 點選篩選後得到的搜尋網址
+"""
+
+import os
+import json
+import time
+import hashlib
+
+from config import CACHE_DIR
+
+SEARCH_CACHE_FILE: str = os.path.join(CACHE_DIR, "search_urls.json")
+
+
+def search_cache_key(keyword: str, filters: dict) -> str:
+    """以關鍵字 + 篩選條件產生快取 key (同樣的 GUI 設定 → 同一個 key)"""
+    raw = json.dumps({'keyword': keyword, 'filters': filters}, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+def _load_cache() -> dict[str, dict]:
+    if not os.path.exists(SEARCH_CACHE_FILE):
+        return {}
+    try:
+        with open(SEARCH_CACHE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_cache(cache: dict[str, dict]) -> None:
+    os.makedirs(os.path.dirname(SEARCH_CACHE_FILE), exist_ok=True)
+    tmp_path = f"{SEARCH_CACHE_FILE}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, SEARCH_CACHE_FILE)
+
+
+def get_cached_search_url(key: str, ttl_hours: float = 24) -> str | None:
+    """
+    取得快取的搜尋 URL
+
+    Args:
+        key: search_cache_key() 的結果
+        ttl_hours: 有效時間 (小時)，過期視為沒有快取
+
+    Returns:
+        URL 或 None
+    """
+    entry = _load_cache().get(key)
+    if not entry:
+        return None
+    if time.time() - entry.get('saved_at', 0) > ttl_hours * 3600:
+        return None
+    return entry.get('url')
+
+
+def save_search_url(key: str, url: str, keyword: str = "") -> None:
+    """儲存搜尋 URL"""
+    cache = _load_cache()
+    cache[key] = {'url': url, 'keyword': keyword, 'saved_at': time.time()}
+    _write_cache(cache)
+
+
+def invalidate_search_url(key: str) -> None:
+    """移除單一快取 (例如快取的 URL 已經找不到職缺)"""
+    cache = _load_cache()
+    if cache.pop(key, None) is not None:
+        _write_cache(cache)
+
+
+def clear_search_url_cache() -> int:
+    """清除全部搜尋 URL 快取，回傳清除筆數"""
+    cache = _load_cache()
+    if os.path.exists(SEARCH_CACHE_FILE):
+        os.remove(SEARCH_CACHE_FILE)
+    return len(cache)
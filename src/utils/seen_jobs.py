@@ -0,0 +1,103 @@
+"""
+已看過的職缺索引 — 增量爬取用 (職缺 ID → 首次 / 最近出現時間、內容 hash)
+"""
+
+import os
+import json
+import time
+import hashlib
+
+from config import CACHE_DIR
+
+from .file_lock import locked_file
+
+SEEN_JOBS_FILE: str = os.path.join(CACHE_DIR, "seen_jobs.json")
+
+# 計算內容 hash 的列表欄位 (列表頁就拿得到，不需要開詳細頁)
+SEEN_HASH_FIELDS: tuple[str, ...] = ('title', 'company', 'location', 'salary')
+
+
+def job_content_hash(job: dict) -> str:
+    """列表欄位的 hash，用來判斷職缺內容是否變動"""
+    raw = json.dumps([str(job.get(k) or '') for k in SEEN_HASH_FIELDS], ensure_ascii=False)
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:16]
+
+
+def load_seen_index() -> dict[str, dict]:
+    """載入索引 {job_id: {'first_seen', 'last_seen', 'hash'}}"""
+    if not os.path.exists(SEEN_JOBS_FILE):
+        return {}
+    try:
+        with open(SEEN_JOBS_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def seen_status(index: dict[str, dict], job_id: str, content_hash: str) -> str:
+    """
+    查詢職缺在索引中的狀態 (不修改索引)
+
+    Returns:
+        'new' = 第一次看到 / 'changed' = 內容 hash 改變 / 'known' = 已看過且沒變
+    """
+    entry = index.get(job_id)
+    if entry is None:
+        return 'new'
+    return 'known' if entry.get('hash') == content_hash else 'changed'
+
+
+def mark_seen(index: dict[str, dict], job_id: str, content_hash: str) -> str:
+    """
+    記錄一個已處理完成的職缺
+
+    Returns:
+        'new' = 第一次看到 / 'changed' = 內容 hash 改變 / 'known' = 已看過且沒變
+    """
+    now = time.time()
+    entry = index.get(job_id)
+    if entry is None:
+        index[job_id] = {'first_seen': now, 'last_seen': now, 'hash': content_hash}
+        return 'new'
+
+    entry['last_seen'] = now
+    if entry.get('hash') != content_hash:
+        entry['hash'] = content_hash
+        return 'changed'
+    return 'known'
+
+
+def save_seen_index(index: dict[str, dict]) -> None:
+    """
+    儲存索引
+
+    分片 process 可能同時更新：在檔案鎖內重新載入並合併後再寫入，
+    first_seen 取最早，last_seen 與 hash 取最近一次看到的。
+    """
+    os.makedirs(os.path.dirname(SEEN_JOBS_FILE), exist_ok=True)
+    # 鎖另一個檔案：os.replace 會換掉索引檔本身
+    with locked_file(f"{SEEN_JOBS_FILE}.lock"):
+        merged = load_seen_index()
+        for job_id, entry in index.items():
+            old = merged.get(job_id)
+            if old is None or entry['last_seen'] >= old.get('last_seen', 0):
+                merged[job_id] = {
+                    **entry,
+                    'first_seen': min(entry['first_seen'], old.get('first_seen', entry['first_seen'])) if old else entry['first_seen'],
+                }
+
+        tmp_path = f"{SEEN_JOBS_FILE}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(merged, f, ensure_ascii=False)
+        os.replace(tmp_path, SEEN_JOBS_FILE)
+
+
+def clear_seen_index() -> int:
+    """清除索引 (下次執行視為全部都是新職缺)，回傳清除筆數"""
+    if not os.path.exists(SEEN_JOBS_FILE):
+        return 0
+    with locked_file(f"{SEEN_JOBS_FILE}.lock"):
+        index = load_seen_index()
+        if os.path.exists(SEEN_JOBS_FILE):
+            os.remove(SEEN_JOBS_FILE)
+    return len(index)
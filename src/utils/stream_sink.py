@@ -0,0 +1,167 @@
+"""
+串流輸出 — 每處理完一個職缺就寫入 JSONL / CSV，中途當掉也不會遺失已完成的資料
+"""
+
+import os
+import csv
+import json
+import time
+import threading
+
+from config import OUTPUT_BASE_DIR, CSV_FIELDNAMES
+from .file_io import save_jobs
+
+STREAM_DIRNAME: str = "stream"
+
+# 本 process 正在寫入的串流檔 (recover_streams 不可整理)
+_ACTIVE_STREAMS: set[str] = set()
+
+
+class JobStreamSink:
+    """
+    逐筆 append 的輸出檔 (output/stream/<prefix>_<時間>.jsonl + .csv)
+
+    每 fsync_every 筆或 fsync_interval 秒 fsync 一次；執行結束後用 compact()
+    整理成一般的 jobs_N 輸出並刪除串流檔。可從多個 thread 呼叫 append()。
+    """
+
+    def __init__(self, prefix: str = "jobs", base_dir: str | None = None, fsync_every: int = 20, fsync_interval: float = 10.0, resume_path: str | None = None) -> None:
+        """
+        Args:
+            resume_path: 接續寫入既有的串流檔 (從檢查點繼續執行時)；None = 建立新檔
+        """
+        self.prefix: str = prefix
+        self.base_dir: str = base_dir or OUTPUT_BASE_DIR
+        self.fsync_every: int = max(1, fsync_every)
+        self.fsync_interval: float = fsync_interval
+        self.count: int = 0
+
+        if resume_path and os.path.exists(resume_path):
+            stem = os.path.splitext(resume_path)[0]
+        else:
+            resume_path = None
+            stream_dir = os.path.join(self.base_dir, STREAM_DIRNAME)
+            os.makedirs(stream_dir, exist_ok=True)
+            stem = os.path.join(stream_dir, f"{prefix}_{time.strftime('%Y%m%d_%H%M%S')}_{os.getpid()}")
+        self.jsonl_path: str = f"{stem}.jsonl"
+        self.csv_path: str = f"{stem}.csv"
+
+        self._lock: threading.Lock = threading.Lock()
+        _ACTIVE_STREAMS.add(os.path.abspath(self.jsonl_path))
+        mode = 'a' if resume_path else 'w'
+        if resume_path:
+            _trim_partial_line(self.jsonl_path)
+        self._jsonl = open(self.jsonl_path, mode, encoding='utf-8')
+        csv_exists = bool(resume_path) and os.path.exists(self.csv_path)
+        # 接續寫入時不再加 BOM / 標題列
+        self._csv_file = open(self.csv_path, mode, encoding='utf-8' if csv_exists else 'utf-8-sig', newline='')
+        self._csv = csv.DictWriter(self._csv_file, fieldnames=CSV_FIELDNAMES, extrasaction='ignore')
+        if not csv_exists:
+            self._csv.writeheader()
+        self._unsynced: int = 0
+        self._last_sync: float = time.time()
+
+    def append(self, job: dict) -> None:
+        """寫入一個已處理完成的職缺 (job_index 一併寫入 JSONL，整理時用來排序)"""
+        record = {k: v for k, v in job.items() if k != 'card'}
+        with self._lock:
+            self._jsonl.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+            self._csv.writerow(record)
+            self.count += 1
+            self._unsynced += 1
+            if self._unsynced >= self.fsync_every or time.time() - self._last_sync >= self.fsync_interval:
+                self._sync()
+
+    def close(self) -> None:
+        """寫完剩下的資料並關閉檔案"""
+        with self._lock:
+            if self._jsonl.closed:
+                return
+            self._sync()
+            self._jsonl.close()
+            self._csv_file.close()
+            _ACTIVE_STREAMS.discard(os.path.abspath(self.jsonl_path))
+
+    def compact(self) -> dict[str, str] | None:
+        """關閉串流並整理成 jobs_N 輸出 (save_jobs)，成功後刪除串流檔"""
+        self.close()
+        return compact_stream(self.jsonl_path, self.prefix, self.base_dir)
+
+    # ── Private ──
+
+    def _sync(self) -> None:
+        for f in (self._jsonl, self._csv_file):
+            f.flush()
+            os.fsync(f.fileno())
+        self._unsynced = 0
+        self._last_sync = time.time()
+
+
+def _trim_partial_line(jsonl_path: str) -> None:
+    """截掉中斷時寫到一半的最後一行 (接續寫入前)"""
+    with open(jsonl_path, 'rb+') as f:
+        data = f.read()
+        if data and not data.endswith(b'\n'):
+            f.truncate(data.rfind(b'\n') + 1)
+
+
+def read_stream(jsonl_path: str, keep_index: bool = False) -> list[dict]:
+    """
+    讀取串流檔 (依 job_index 排序、同一職缺只保留最後一筆；最後一行寫到一半時略過)
+
+    Args:
+        keep_index: 保留 job_index 欄位 (從檢查點繼續時依此還原職缺位置)
+    """
+    records: dict[object, dict] = {}
+    with open(jsonl_path, 'r', encoding='utf-8') as f:
+        for n, line in enumerate(f):
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            records[record.get('job_index', f"_{n}")] = record
+
+    def order(item: tuple[object, dict]) -> tuple[int, str]:
+        key = item[0]
+        return (key, '') if isinstance(key, int) else (10**9, str(key))
+
+    ordered = [record for _, record in sorted(records.items(), key=order)]
+    if keep_index:
+        return ordered
+    return [{k: v for k, v in record.items() if k != 'job_index'} for record in ordered]
+
+
+def compact_stream(jsonl_path: str, prefix: str = "jobs", base_dir: str | None = None) -> dict[str, str] | None:
+    """把串流檔整理成 save_jobs 輸出並刪除串流檔，沒有資料時回傳 None"""
+    jobs = read_stream(jsonl_path) if os.path.exists(jsonl_path) else []
+    result = save_jobs(jobs, prefix=prefix, base_dir=base_dir) if jobs else None
+
+    for path in (jsonl_path, f"{os.path.splitext(jsonl_path)[0]}.csv"):
+        if os.path.exists(path):
+            os.remove(path)
+    return result
+
+
+def recover_streams(prefix: str = "jobs", base_dir: str | None = None) -> list[dict[str, str]]:
+    """
+    整理上次中斷留下的串流檔 (執行開始前呼叫)
+
+    Returns:
+        每個整理出的 save_jobs 結果
+    """
+    stream_dir = os.path.join(base_dir or OUTPUT_BASE_DIR, STREAM_DIRNAME)
+    if not os.path.isdir(stream_dir):
+        return []
+
+    results = []
+    for name in sorted(os.listdir(stream_dir)):
+        if not (name.startswith(f"{prefix}_") and name.endswith('.jsonl')):
+            continue
+        path = os.path.join(stream_dir, name)
+        if os.path.abspath(path) in _ACTIVE_STREAMS:
+            continue
+        print(f"發現上次中斷的輸出: {name}，整理中...")
+        result = compact_stream(path, prefix, base_dir)
+        if result:
+            results.append(result)
+    return results
@@ -0,0 +1,93 @@
+"""
+本機的 104 替身 server — 用 fixtures/104/ 的合成資料回應 DetailFetcher 的請求
+
+    python tests/stand_in_104.py [port]
+
+職缺 ID 決定回應 (其他 ID 一律 404)：
+    ok1     內容 API 回傳 job_content_api.json (需要 Referer，和 104 一樣沒有時回 403)
+    ld2     內容 API 500；職缺頁回傳含 JSON-LD 的 job_page_jsonld.html
+    bad3    內容 API 回傳不是 JSON 的內容；職缺頁 404
+    empty4  內容 API 回傳沒有工作內容的 JSON；職缺頁 404
+"""
+
+import os
+import sys
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+FIXTURE_DIR: str = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fixtures", "104")
+
+CONTENT_PREFIX: str = "/job/ajax/content/"
+JOB_PREFIX: str = "/job/"
+
+
+def _fixture(name: str) -> bytes:
+    with open(os.path.join(FIXTURE_DIR, name), 'rb') as f:
+        return f.read()
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """依路徑與職缺 ID 回應固定內容"""
+
+    def do_GET(self) -> None:
+        path = self.path.split('?', 1)[0]
+        if path.startswith(CONTENT_PREFIX):
+            self._content(path[len(CONTENT_PREFIX):])
+        elif path.startswith(JOB_PREFIX):
+            self._job_page(path[len(JOB_PREFIX):])
+        else:
+            self._send(404)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+    def _content(self, job_id: str) -> None:
+        if not self.headers.get('Referer', '').endswith(f"/job/{job_id}"):
+            self._send(403)
+        elif job_id == 'ok1':
+            self._send(200, _fixture('job_content_api.json'), 'application/json')
+        elif job_id == 'bad3':
+            self._send(200, b'<html>not json</html>', 'application/json')
+        elif job_id == 'empty4':
+            self._send(200, _fixture('job_content_api_empty.json'), 'application/json')
+        elif job_id == 'ld2':
+            self._send(500)
+        else:
+            self._send(404)
+
+    def _job_page(self, job_id: str) -> None:
+        if job_id == 'ld2':
+            self._send(200, _fixture('job_page_jsonld.html'), 'text/html; charset=utf-8')
+        else:
+            self._send(404)
+
+    def _send(self, status: int, body: bytes = b'', content_type: str = 'text/plain') -> None:
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@contextmanager
+def serve(port: int = 0) -> Iterator[str]:
+    """在背景 thread 啟動替身 server，回傳 base_url (port=0 時自動選擇)"""
+    server = ThreadingHTTPServer(('127.0.0.1', port), StandInHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == '__main__':
+    with serve(int(sys.argv[1]) if len(sys.argv) > 1 else 8104) as base_url:
+        print(f"104 替身 server: {base_url} (Ctrl+C 結束)")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,40 @@
+"""ui.api.Api: 關鍵字 → 批次搜尋條件、引擎選擇"""
+
+import pytest
+
+from strategy import ApplyStrategy, SaveStrategy
+from ui.api import Api
+
+
+def test_build_queries_splits_and_dedupes_keywords():
+    assert Api._build_queries('pm, product manager，pm , ', []) == ['pm', 'product manager']
+    assert Api._build_queries(' , ', []) == []
+
+
+def test_build_queries_split_areas():
+    assert Api._build_queries('pm, qa', [1, 5]) == [
+        {'keyword': 'pm', 'area_indices': [1]},
+        {'keyword': 'pm', 'area_indices': [5]},
+        {'keyword': 'qa', 'area_indices': [1]},
+        {'keyword': 'qa', 'area_indices': [5]},
+    ]
+
+
+@pytest.mark.parametrize('queries, config, strategy, expected', [
+    (['pm'], {'engine': 'async'}, SaveStrategy(), ('async', 'off')),
+    # 單一關鍵字 × 單一地區仍是 dict query，async 照常使用
+    ([{'keyword': 'pm', 'area_indices': [1]}], {'engine': 'async'}, SaveStrategy(), ('async', 'off')),
+    (['pm', 'qa'], {'engine': 'async'}, SaveStrategy(), ('sync', 'off')),
+    (['pm'], {'engine': 'async', 'shard_mode': 'pages'}, SaveStrategy(), ('sync', 'pages')),
+    (['pm'], {'engine': 'sync', 'shard_mode': 'pages'}, ApplyStrategy(), ('sync', 'off')),
+    (['pm'], {}, SaveStrategy(), ('sync', 'off')),
+])
+def test_select_engine(queries, config, strategy, expected):
+    assert Api._select_engine(queries, config, strategy) == expected
+
+
+def test_select_engine_requires_async_support():
+    class SyncOnly(SaveStrategy):
+        supports_async = False
+
+    assert Api._select_engine(['pm'], {'engine': 'async'}, SyncOnly()) == ('sync', 'off')
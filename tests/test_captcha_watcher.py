@@ -0,0 +1,74 @@
+"""utils.captcha.CaptchaWatcher: frame 事件 → 驗證 iframe 狀態"""
+
+from utils.captcha import CaptchaWatcher
+
+
+class FakeFrame:
+    def __init__(self, url: str) -> None:
+        self.url = url
+
+
+class FakePage:
+    """只提供 CaptchaWatcher 用到的屬性，事件由測試直接觸發"""
+
+    def __init__(self, url: str = 'https://www.104.com.tw/jobs/search/') -> None:
+        self.main_frame = FakeFrame(url)
+        self.frames = [self.main_frame]
+        self.handlers = {}
+
+    @property
+    def url(self) -> str:
+        return self.main_frame.url
+
+    def on(self, event: str, handler) -> None:
+        self.handlers[event] = handler
+
+    def attach(self, frame: FakeFrame) -> None:
+        self.frames.append(frame)
+        self.handlers['frameattached'](frame)
+
+    def detach(self, frame: FakeFrame) -> None:
+        self.frames.remove(frame)
+        self.handlers['framedetached'](frame)
+
+    def navigate(self, url: str) -> None:
+        self.main_frame.url = url
+        self.handlers['framenavigated'](self.main_frame)
+
+
+def watched_page() -> tuple[CaptchaWatcher, FakePage]:
+    watcher = CaptchaWatcher()
+    page = FakePage()
+    watcher._watch_page(page)
+    return watcher, page
+
+
+def test_captcha_iframe_detected_and_detached():
+    watcher, page = watched_page()
+    challenge = FakeFrame('https://challenges.cloudflare.com/turnstile/v0')
+    page.attach(challenge)
+    assert watcher.status(page)['detected']
+
+    page.detach(challenge)
+    assert not watcher.status(page)['detected']
+
+
+def test_same_document_navigation_keeps_iframe():
+    watcher, page = watched_page()
+    page.attach(FakeFrame('https://www.google.com/recaptcha/api2/anchor'))
+
+    # pushState / hash 跳轉：iframe 仍在頁面上
+    page.navigate('https://www.104.com.tw/jobs/search/?page=2')
+    assert watcher.status(page)['type'] == 'iframe'
+
+
+def test_new_document_clears_detached_iframes():
+    watcher, page = watched_page()
+    challenge = FakeFrame('https://www.google.com/recaptcha/api2/anchor')
+    page.attach(challenge)
+
+    # 新文件：舊的 iframe 先 detach，再觸發主 frame 的 framenavigated
+    page.frames.remove(challenge)
+    page.navigate('https://www.104.com.tw/job/abc')
+    assert not watcher.status(page)['detected']
+    assert not watcher.ready(page)
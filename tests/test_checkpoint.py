@@ -0,0 +1,59 @@
+"""utils.checkpoint 與 SaveStrategy 從串流檔還原職缺"""
+
+import pytest
+
+from strategy import SaveStrategy
+from utils import JobStreamSink, checkpoint
+from utils.checkpoint import clear_checkpoint, has_checkpoint, load_checkpoint, save_checkpoint, start_checkpoint
+
+
+@pytest.fixture(autouse=True)
+def checkpoint_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(checkpoint, 'CHECKPOINT_FILE', str(tmp_path / 'checkpoint.json'))
+    monkeypatch.setattr(checkpoint, 'CHECKPOINT_RUN_FILE', str(tmp_path / 'checkpoint_run.json'))
+
+
+def test_run_and_cursor_are_merged():
+    start_checkpoint({'queries': ['pm'], 'config': {'pages': 3}})
+    assert not has_checkpoint()
+    assert load_checkpoint() is None
+
+    save_checkpoint({'page_num': 2, 'job_count': 7})
+    save_checkpoint({'page_num': 3, 'job_count': 12})
+    resume = load_checkpoint()
+    assert resume['queries'] == ['pm']
+    assert resume['page_num'] == 3 and resume['job_count'] == 12
+
+    assert clear_checkpoint()
+    assert load_checkpoint() is None
+    assert not clear_checkpoint()
+
+
+def test_old_version_is_ignored(tmp_path):
+    start_checkpoint({'queries': ['pm']})
+    (tmp_path / 'checkpoint.json').write_text('{"version": 1, "jobs": []}')
+    assert load_checkpoint() is None
+
+
+def test_save_strategy_rebuilds_jobs_from_stream(tmp_path):
+    sink = JobStreamSink(base_dir=str(tmp_path))
+    sink.append({'title': '職缺 0', 'url': 'https://www.104.com.tw/job/a0', 'job_index': 0})
+    sink.append({'title': '職缺 2', 'url': 'https://www.104.com.tw/job/a2', 'job_index': 2})
+    sink.append({'title': '職缺 0', 'url': 'https://www.104.com.tw/job/a0', 'job_index': 0, 'detailed_address': '台北市'})
+    # 寫入檢查點 (job_count=3) 之後才處理的職缺
+    sink.append({'title': '職缺 3', 'url': 'https://www.104.com.tw/job/a3', 'job_index': 3})
+    sink.close()
+
+    strategy = SaveStrategy()
+    jobs = strategy.restore_checkpoint({'job_count': 4, 'stream_path': sink.jsonl_path}, job_count=3)
+
+    assert [job.get('title') for job in jobs] == ['職缺 0', None, '職缺 2', '職缺 3']
+    assert jobs[0]['detailed_address'] == '台北市'
+    assert 'job_index' not in jobs[0]
+    assert strategy.job_count == 4
+
+
+def test_save_strategy_without_stream_starts_over(tmp_path):
+    strategy = SaveStrategy()
+    assert strategy.restore_checkpoint({'stream_path': str(tmp_path / 'missing.jsonl')}, job_count=5) == []
+    assert strategy._resume_stream is None
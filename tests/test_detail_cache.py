@@ -0,0 +1,63 @@
+"""utils.detail_cache: 以職缺 ID 為 key 的詳細頁快取"""
+
+import types
+
+import pytest
+
+from utils import detail_cache
+from utils.detail_cache import clear_detail_cache, get_cached_detail, save_cached_detail
+
+DETAIL = {'detailed_job_description': '負責後端服務開發', 'detailed_address': ''}
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    path = tmp_path / 'details'
+    monkeypatch.setattr(detail_cache, 'DETAIL_CACHE_DIR', str(path))
+    return path
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = types.SimpleNamespace(now=1000.0)
+    fake.time = lambda: fake.now
+    monkeypatch.setattr(detail_cache, 'time', fake)
+    return fake
+
+
+def test_save_and_get():
+    assert get_cached_detail('a1') is None
+    save_cached_detail('a1', DETAIL)
+    assert get_cached_detail('a1') == DETAIL
+
+
+def test_expired_ttl_is_a_miss(clock):
+    save_cached_detail('a1', DETAIL)
+    clock.now += 2 * 3600
+    assert get_cached_detail('a1', ttl_hours=3) == DETAIL
+    assert get_cached_detail('a1', ttl_hours=1) is None
+
+
+def test_empty_detail_not_cached(cache_dir):
+    save_cached_detail('a1', {'detailed_job_description': '', 'detailed_address': ''})
+    assert get_cached_detail('a1') is None
+    assert not cache_dir.exists()
+
+
+@pytest.mark.parametrize('content', ['{"fetched_at": 10', '', '[]'])
+def test_corrupt_file_is_a_miss(cache_dir, content):
+    cache_dir.mkdir()
+    (cache_dir / 'a1.json').write_text(content, encoding='utf-8')
+    assert get_cached_detail('a1') is None
+
+    # 重新抓取後覆寫
+    save_cached_detail('a1', DETAIL)
+    assert get_cached_detail('a1') == DETAIL
+
+
+def test_clear_returns_count():
+    save_cached_detail('a1', DETAIL)
+    save_cached_detail('b2', DETAIL)
+    assert clear_detail_cache() == 2
+    assert get_cached_detail('a1') is None
+    assert clear_detail_cache() == 0
@@ -0,0 +1,99 @@
+"""core.detail_fetcher: 對本機替身 server (tests/stand_in_104.py) 抓取詳細資料"""
+
+import pytest
+from playwright.sync_api import sync_playwright
+
+import strategy.save_strategy as save_strategy
+from core.detail_fetcher import DetailFetcher
+from strategy import SaveStrategy, StrategyContext
+from stand_in_104 import serve
+
+CONTENT_DETAIL = {
+    'detailed_job_description': '負責後端服務開發\n維護 API & 資料庫\n撰寫測試',
+    'detailed_address': '台北市信義區範例路100號',
+    'detailed_work_hours': '日班，09:00~18:00',
+    'detailed_company_benefits': '年終獎金\n彈性上下班',
+    'detailed_company_photos': '公司環境照片(2)',
+}
+BROWSER_DETAIL = {'detailed_job_description': '瀏覽器抓取'}
+
+
+class RequestOnlyContext:
+    """只有 APIRequestContext 的 BrowserContext 替身 (不需要安裝瀏覽器)"""
+
+    def __init__(self, request) -> None:
+        self.request = request
+        self.opened: list[str] = []
+
+    def new_page(self) -> 'FakePage':
+        return FakePage(self.opened)
+
+
+class FakePage:
+    def __init__(self, opened: list[str]) -> None:
+        self.opened = opened
+
+    def goto(self, url: str, **kwargs: object) -> None:
+        self.opened.append(url)
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.fixture(scope='module')
+def base_url():
+    with serve() as url:
+        yield url
+
+
+@pytest.fixture(scope='module')
+def browser_context():
+    with sync_playwright() as p:
+        request = p.request.new_context()
+        yield RequestOnlyContext(request)
+        request.dispose()
+
+
+def job_url(base_url: str, job_id: str) -> str:
+    return f"{base_url}job/{job_id}?jobsource=jolist_a"
+
+
+def test_content_api(base_url, browser_context):
+    assert DetailFetcher(base_url).fetch(browser_context, job_url(base_url, 'ok1')) == CONTENT_DETAIL
+
+
+def test_json_ld_when_content_api_fails(base_url, browser_context):
+    detail = DetailFetcher(base_url).fetch(browser_context, job_url(base_url, 'ld2'))
+    assert detail == {
+        'detailed_job_description': '建置資料管線\n維護 ETL & 報表',
+        'detailed_address': '新北市板橋區範例路1號',
+        'detailed_work_hours': '',
+        'detailed_company_benefits': '',
+        'detailed_company_photos': '',
+    }
+
+
+@pytest.mark.parametrize('job_id', ['bad3', 'empty4', 'missing5'])
+def test_returns_none_on_bad_response(base_url, browser_context, job_id):
+    assert DetailFetcher(base_url).fetch(browser_context, job_url(base_url, job_id)) is None
+
+
+@pytest.mark.parametrize('job_id, expected, browser_opened', [
+    ('ok1', CONTENT_DETAIL, False),
+    ('bad3', BROWSER_DETAIL, True),  # 不是 JSON
+    ('missing5', BROWSER_DETAIL, True),  # 非 200
+])
+def test_save_strategy_falls_back_to_browser(base_url, browser_context, monkeypatch, job_id, expected, browser_opened):
+    monkeypatch.setattr(save_strategy, 'detail_fetcher', DetailFetcher(base_url))
+    monkeypatch.setattr(save_strategy.detail_scraper, 'scrape', lambda page: dict(BROWSER_DETAIL))
+    browser_context.opened.clear()
+
+    strategy = SaveStrategy(save_output=False)
+    config = {'detail_fetch': 'http', 'detail_cache_ttl': 0, 'human_like': 'minimal', 'delay_multiplier': 0}
+    context = StrategyContext(strategy, config, browser_context=browser_context)
+    job = {'url': job_url(base_url, job_id), 'job_index': 0}
+
+    assert strategy.process_job(job, context)
+    assert {k: job[k] for k in expected} == expected
+    assert bool(browser_context.opened) == browser_opened
+    assert (strategy.http_hits, strategy.http_fallbacks) == ((0, 1) if browser_opened else (1, 0))
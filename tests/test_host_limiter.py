@@ -0,0 +1,81 @@
+"""utils.host_limiter.HostRateLimiter: 檔案保存的 token bucket"""
+
+import asyncio
+import importlib
+import types
+
+import pytest
+
+from utils import HostRateLimiter
+
+# utils 套件匯出的 host_limiter 是全域實例，模組本身要另外取得
+host_limiter_module = importlib.import_module('utils.host_limiter')
+
+URL = 'https://www.104.com.tw/job/abc'
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """固定的時鐘：now 可手動推進，sleep 只記錄秒數"""
+    fake = types.SimpleNamespace(now=1000.0, slept=[])
+    fake.time = lambda: fake.now
+    fake.sleep = fake.slept.append
+    monkeypatch.setattr(host_limiter_module, 'time', fake)
+    return fake
+
+
+def make_limiter(tmp_path, rate: float = 60, burst: float = 3) -> HostRateLimiter:
+    limiter = HostRateLimiter(state_dir=str(tmp_path))
+    limiter.configure({'host_rate': rate, 'host_burst': burst})
+    return limiter
+
+
+def test_disabled_by_default(tmp_path, clock):
+    limiter = HostRateLimiter(state_dir=str(tmp_path))
+    limiter.configure({})
+    assert not limiter.enabled
+    assert limiter.acquire(URL) == 0.0
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_burst_then_wait_for_refill(tmp_path, clock):
+    limiter = make_limiter(tmp_path, rate=60, burst=3)  # 每秒補 1 個
+
+    assert [limiter.acquire(URL) for _ in range(3)] == [0.0, 0.0, 0.0]
+    # 沒有 token：預約 (token 變負數)，依序錯開
+    assert limiter.acquire(URL) == pytest.approx(1.0)
+    assert limiter.acquire(URL) == pytest.approx(2.0)
+    assert clock.slept == [pytest.approx(1.0), pytest.approx(2.0)]
+
+    # 經過 5 秒：補回 5 個，扣掉預約的 2 個後剩 3 個 (不超過 burst)
+    clock.now += 5
+    assert limiter.acquire(URL) == 0.0
+    assert (limiter.requests, limiter.waited) == (6, 2)
+    assert limiter.total_wait == pytest.approx(3.0)
+    assert limiter.max_wait == pytest.approx(2.0)
+
+
+def test_tokens_capped_at_burst(tmp_path, clock):
+    limiter = make_limiter(tmp_path, rate=60, burst=2)
+    limiter.acquire(URL)
+    clock.now += 3600
+    assert [limiter.acquire(URL) for _ in range(2)] == [0.0, 0.0]
+    assert limiter.acquire(URL) == pytest.approx(1.0)
+
+
+def test_state_shared_through_file(tmp_path, clock):
+    first = make_limiter(tmp_path, rate=30, burst=1)
+    second = make_limiter(tmp_path, rate=30, burst=1)  # 另一個 process 的實例
+
+    assert first.acquire(URL) == 0.0
+    assert second.acquire(URL) == pytest.approx(2.0)
+    # 不同主機各自計算
+    assert second.acquire('https://static.104.com.tw/x.js') == 0.0
+
+
+def test_async_acquire(tmp_path, clock):
+    limiter = make_limiter(tmp_path, rate=60, burst=1)
+    limiter.acquire(URL)
+    clock.now += 1  # 補回 1 個：async_acquire 不必等待
+    assert asyncio.run(limiter.async_acquire(URL)) == 0.0
+    assert limiter.requests == 2
@@ -0,0 +1,80 @@
+"""utils.job_store / file_io: 資料庫儲存、載入、更新"""
+
+import os
+import sqlite3
+from contextlib import closing
+
+from config import CSV_FIELDNAMES
+from utils import job_store
+from utils.file_io import get_latest_run, load_jobs, save_jobs, update_job
+
+
+def make_job(job_id: str, **fields: str) -> dict:
+    return {
+        'title': f'職缺 {job_id}',
+        'company': 'A 公司',
+        'url': f'https://www.104.com.tw/job/{job_id}?jobsource=jolist_a',
+        **fields,
+    }
+
+
+def test_save_load_update(tmp_path):
+    base = str(tmp_path)
+    result = save_jobs([make_job('a1', salary='月薪 40,000'), make_job('b2', source='api')], base_dir=base, export=())
+
+    assert result['filename'] == 'jobs_1'
+    assert get_latest_run(base) == 'jobs_1'
+    assert not os.path.exists(os.path.join(base, 'json'))  # 沒有指定格式時只寫資料庫
+
+    jobs = load_jobs('jobs_1', base)
+    assert [job['title'] for job in jobs] == ['職缺 a1', '職缺 b2']
+    assert jobs[0]['salary'] == '月薪 40,000'
+    assert jobs[1]['source'] == 'api'  # 非 CSV 欄位存在 extra
+
+    assert update_job('jobs_1', 1, {'detailed_job_description': '內容'}, base)
+    assert load_jobs('jobs_1', base)[1]['detailed_job_description'] == '內容'
+    assert not update_job('jobs_1', 5, {'detailed_job_description': '內容'}, base)
+
+
+def test_later_runs_do_not_change_history(tmp_path):
+    base = str(tmp_path)
+    save_jobs([make_job('a1', salary='月薪 40,000')], base_dir=base, export=())
+    save_jobs([make_job('a1', salary='月薪 50,000')], base_dir=base, export=())
+
+    assert load_jobs('jobs_1', base)[0]['salary'] == '月薪 40,000'
+    assert load_jobs('jobs_2', base)[0]['salary'] == '月薪 50,000'
+
+    # 更新其中一次執行，另一次不受影響
+    update_job('jobs_2', 0, {'detailed_job_description': '新內容'}, base)
+    assert load_jobs('jobs_1', base)[0]['detailed_job_description'] == ''
+    assert load_jobs('jobs_2', base)[0]['detailed_job_description'] == '新內容'
+
+    # jobs 表保留最新的資料
+    with closing(job_store.connect(base)) as conn:
+        row = conn.execute("SELECT salary FROM jobs WHERE job_key = 'a1'").fetchone()
+    assert row['salary'] == '月薪 50,000'
+
+
+def test_create_run_retries_on_name_conflict(tmp_path, monkeypatch):
+    with closing(job_store.connect(str(tmp_path))) as conn, conn:
+        job_store.create_run(conn, 'jobs')
+        # 模擬另一個 process 在讀取編號後搶先建立了同名的執行
+        monkeypatch.setattr(job_store, 'next_run_number', lambda conn, prefix: 1)
+        run_id, name = job_store.create_run(conn, 'jobs')
+    assert name == 'jobs_2'
+    assert run_id == 2
+
+
+def test_migrates_old_run_jobs_schema(tmp_path):
+    path = job_store.get_db_path(str(tmp_path))
+    with closing(sqlite3.connect(path)) as conn, conn:
+        conn.executescript(f"""
+            CREATE TABLE runs (run_id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL UNIQUE, prefix TEXT NOT NULL, created_at REAL NOT NULL);
+            CREATE TABLE jobs (job_key TEXT PRIMARY KEY, {', '.join(f'{f} TEXT' for f in CSV_FIELDNAMES)}, extra TEXT, first_seen REAL NOT NULL, updated_at REAL NOT NULL);
+            CREATE TABLE run_jobs (run_id INTEGER NOT NULL, position INTEGER NOT NULL, job_key TEXT NOT NULL, PRIMARY KEY (run_id, position));
+            INSERT INTO runs VALUES (1, 'jobs_1', 'jobs', 0);
+            INSERT INTO jobs (job_key, title, first_seen, updated_at) VALUES ('a1', '舊職缺', 0, 0);
+            INSERT INTO run_jobs VALUES (1, 0, 'a1');
+        """)
+
+    assert load_jobs('jobs_1', str(tmp_path))[0]['title'] == '舊職缺'
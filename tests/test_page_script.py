@@ -0,0 +1,58 @@
+"""core.page_script: 同一份流程在 sync / async 執行端的行為一致"""
+
+import asyncio
+
+from core import page_script
+from core.page_script import call, run_script, run_script_async
+
+
+class FakeLocator:
+    """記錄呼叫的 locator；async=True 時方法回傳 coroutine"""
+
+    def __init__(self, log: list, is_async: bool = False, fail: str = '') -> None:
+        self.log = log
+        self.is_async = is_async
+        self.fail = fail
+
+    def __getattr__(self, method: str):
+        def invoke(*args, **kwargs):
+            self.log.append(method)
+            if method == self.fail:
+                raise RuntimeError(method)
+            result = 3 if method == 'count' else None
+            if not self.is_async:
+                return result
+
+            async def awaitable():
+                return result
+            return awaitable()
+        return invoke
+
+
+def script(locator: FakeLocator):
+    count = yield call(locator, 'count')
+    try:
+        yield call(locator, 'check')
+        checked = True
+    except RuntimeError:
+        checked = False
+    yield page_script.delay(0, 0)
+    return count, checked
+
+
+def test_run_script_sends_results_and_returns_value():
+    log = []
+    assert run_script(script(FakeLocator(log))) == (3, True)
+    assert log == ['count', 'check']
+
+
+def test_errors_are_thrown_back_into_the_script():
+    assert run_script(script(FakeLocator([], fail='check'))) == (3, False)
+
+
+def test_async_runner_matches_sync_runner():
+    sync_log, async_log = [], []
+    sync_result = run_script(script(FakeLocator(sync_log, fail='check')))
+    async_result = asyncio.run(run_script_async(script(FakeLocator(async_log, is_async=True, fail='check'))))
+    assert async_result == sync_result
+    assert async_log == sync_log
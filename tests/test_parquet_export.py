@@ -0,0 +1,53 @@
+"""utils.file_io: Parquet 匯出 (run_date 分區) 與 load_jobs_df"""
+
+import os
+
+import pytest
+
+pytest.importorskip('pandas')
+pytest.importorskip('pyarrow')
+
+from utils.file_io import export_parquet, load_jobs_df, save_jobs
+
+
+def make_job(job_id: str) -> dict:
+    return {'title': f'職缺 {job_id}', 'company': 'A 公司', 'url': f'https://www.104.com.tw/job/{job_id}', 'salary': '月薪 40,000'}
+
+
+@pytest.fixture
+def two_runs(tmp_path):
+    base = str(tmp_path)
+    first = [make_job('a1'), make_job('b2')]
+    second = [make_job('c3')]
+    save_jobs(first, base_dir=base, export=())
+    save_jobs(second, base_dir=base, export=())
+    export_parquet('jobs_1', first, base, run_date='2025-01-01')
+    export_parquet('jobs_2', second, base, run_date='2025-01-02')
+    return base
+
+
+def test_hive_partition_layout(two_runs):
+    parquet_dir = os.path.join(two_runs, 'parquet')
+    assert sorted(os.listdir(parquet_dir)) == ['run_date=2025-01-01', 'run_date=2025-01-02']
+    assert os.listdir(os.path.join(parquet_dir, 'run_date=2025-01-02')) == ['jobs_2.parquet']
+
+
+def test_load_one_partition_with_column_subset(two_runs):
+    df = load_jobs_df(base_dir=two_runs, run_date='2025-01-01', columns=['job_id', 'title'])
+    assert list(df.columns) == ['job_id', 'title']
+    assert sorted(df['job_id']) == ['a1', 'b2']
+
+
+def test_load_all_partitions(two_runs):
+    df = load_jobs_df(base_dir=two_runs, columns=['run', 'job_id'])
+    assert sorted(zip(df['run'], df['job_id'])) == [('jobs_1', 'a1'), ('jobs_1', 'b2'), ('jobs_2', 'c3')]
+
+
+def test_load_single_run(two_runs):
+    df = load_jobs_df('jobs_2', columns=['title', 'salary'], base_dir=two_runs)
+    assert df.to_dict('records') == [{'title': '職缺 c3', 'salary': '月薪 40,000'}]
+
+
+def test_run_date_defaults_to_run_creation(two_runs):
+    path = export_parquet('jobs_1', [make_job('a1')], two_runs)
+    assert os.path.basename(os.path.dirname(path)).startswith('run_date=20')
@@ -0,0 +1,96 @@
+"""utils.human_behavior.RateGovernor: AIMD 速率調整"""
+
+import pytest
+
+from utils import RateGovernor
+
+
+@pytest.fixture
+def governor() -> RateGovernor:
+    governor = RateGovernor()
+    governor.configure({'pacing': 'adaptive', 'rate_min': 6, 'rate_max': 30})
+    return governor
+
+
+def test_configure(governor):
+    assert governor.enabled
+    assert governor.rate == 18.0
+    assert not RateGovernor().enabled
+
+    governor.configure({'pacing': 'fixed'})
+    assert not governor.enabled
+    governor.record_captcha()
+    assert governor.rate == 18.0  # 停用時不調整
+
+
+def test_additive_increase_up_to_max(governor):
+    governor.record_success(1.0)
+    assert governor.rate == 18.0 + RateGovernor.INCREASE_PER_MIN
+    for _ in range(100):
+        governor.record_success(1.0)
+    assert governor.rate == 30.0
+
+
+def test_captcha_halves_and_cools_down(governor):
+    governor.record_captcha()
+    assert governor.rate == 9.0
+    assert governor.captcha_hits == 1
+
+    # 冷卻期間成功也不加速
+    for _ in range(RateGovernor.CAPTCHA_COOLDOWN):
+        governor.record_success(1.0)
+    assert governor.rate == 9.0
+    governor.record_success(1.0)
+    assert governor.rate == 9.0 + RateGovernor.INCREASE_PER_MIN
+
+
+def test_backoff_never_below_min(governor):
+    for _ in range(10):
+        governor.record_captcha()
+    assert governor.rate == 6.0
+
+
+def test_slow_pages_back_off(governor):
+    governor.record_success(RateGovernor.LATENCY_TARGET_SEC * 3)
+    assert governor.rate == pytest.approx(18.0 * RateGovernor.SLOW_BACKOFF)
+    assert governor.latency == RateGovernor.LATENCY_TARGET_SEC
+
+
+def test_error_rate_backs_off(governor):
+    # 視窗未滿一半時不判斷
+    for _ in range(RateGovernor.ERROR_WINDOW // 2 - 1):
+        governor.record_error()
+    assert governor.rate == 18.0
+
+    governor.record_error()
+    assert governor.rate == pytest.approx(18.0 * RateGovernor.SLOW_BACKOFF)
+    assert governor.errors == RateGovernor.ERROR_WINDOW // 2
+
+    # 降速後重新計算錯誤率
+    governor.record_error()
+    assert governor.rate == pytest.approx(18.0 * RateGovernor.SLOW_BACKOFF)
+
+
+def test_track_records_success_and_error(governor):
+    with governor.track():
+        pass
+    assert governor.requests == 1 and governor.errors == 0
+
+    with pytest.raises(TimeoutError):
+        with governor.track():
+            raise TimeoutError()
+    assert governor.requests == 2 and governor.errors == 1
+
+
+def test_reserve_spaces_requests(governor, monkeypatch):
+    monkeypatch.setattr('random.uniform', lambda a, b: 1.0)
+    interval = 60 / governor.rate
+    assert governor.reserve() == pytest.approx(interval * 0.2)
+    # 下一個請求排在前一個之後一整個間隔
+    assert governor.reserve() == pytest.approx(interval * 1.2, abs=0.05)
+
+
+def test_reserve_level_scales_interval(governor, monkeypatch):
+    monkeypatch.setattr('random.uniform', lambda a, b: 1.0)
+    interval = 60 / governor.rate
+    assert governor.reserve('long') == pytest.approx(interval * RateGovernor.LEVEL_FACTORS['long'] * 0.2)
@@ -0,0 +1,60 @@
+"""core.resource_blocker.ResourceBlocker: 攔截規則判斷"""
+
+import types
+
+import pytest
+
+from core.resource_blocker import ResourceBlocker
+
+
+def test_rule_priority_allow_deny_type():
+    blocker = ResourceBlocker('off', block_types=['image'], deny_domains=['ads.example'], allow_domains=['cdn.ads.example'])
+
+    # allow 優先於 deny 與資源類型
+    assert not blocker.should_block('https://cdn.ads.example/a.png', 'image')
+    # deny 不看資源類型
+    assert blocker.should_block('https://ads.example/tag.js', 'script')
+    assert blocker.should_block('https://www.104.com.tw/logo.png', 'image')
+    assert not blocker.should_block('https://www.104.com.tw/jobs/search/', 'document')
+
+
+def test_domain_matches_subdomains_only():
+    blocker = ResourceBlocker('off', deny_domains=['doubleclick.net'])
+    assert blocker.should_block('https://doubleclick.net/x', 'script')
+    assert blocker.should_block('https://stats.g.DoubleClick.net/x', 'script')
+    assert not blocker.should_block('https://notdoubleclick.net/x', 'script')
+    assert not blocker.should_block('https://doubleclick.net.example.com/x', 'script')
+
+
+def test_stealth_safe_keeps_challenge_resources():
+    blocker = ResourceBlocker('stealth-safe')
+    assert not blocker.should_block('https://www.google.com/recaptcha/api2/logo.png', 'image')
+    assert blocker.should_block('https://www.googletagmanager.com/gtm.js', 'script')
+    assert not blocker.should_block('https://static.104.com.tw/main.css', 'stylesheet')
+    assert ResourceBlocker('text-only').should_block('https://static.104.com.tw/main.css', 'stylesheet')
+
+
+def test_unknown_preset():
+    with pytest.raises(ValueError, match='未知的攔截預設'):
+        ResourceBlocker('everything')
+
+
+@pytest.mark.parametrize('config', [None, {}, {'block_resources': 'off'}, {'block_resources': ''}])
+def test_from_config_off(config):
+    assert ResourceBlocker.from_config(config) is None
+
+
+def test_from_config_extra_rules():
+    blocker = ResourceBlocker.from_config({'block_resources': 'stealth-safe', 'block_types': ['stylesheet'], 'block_domains': ['ads.example']})
+    assert blocker.preset == 'stealth-safe'
+    assert blocker.should_block('https://static.104.com.tw/main.css', 'stylesheet')
+    assert blocker.should_block('https://ads.example/x', 'xhr')
+
+
+def test_record_stats():
+    blocker = ResourceBlocker('stealth-safe')
+    for url, resource_type in [('https://www.104.com.tw/a.png', 'image'), ('https://www.104.com.tw/', 'document')]:
+        blocker._record(types.SimpleNamespace(url=url, resource_type=resource_type))
+    stats = blocker.stats()
+    assert (stats['allowed'], stats['blocked'], stats['blocked_by_type']) == (1, 1, {'image': 1})
+    assert stats['bytes_saved'] > 0
@@ -0,0 +1,81 @@
+"""core.search_capture: 以 fixtures/104/ 的合成範例測試搜尋 API 解析"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from config import CSV_FIELDNAMES
+from core.search_capture import SearchCapture
+
+FIXTURES = Path(__file__).resolve().parent.parent / "fixtures" / "104"
+
+EXPECTED = {
+    'search_api_jobs_page1.json': {
+        'pagination': (1, 2),
+        'records': [
+            {'title': '專案經理 Project Manager', 'url': 'https://www.104.com.tw/job/8a2bc?jobsource=jolist_a_relevance',
+             'company': '範例科技股份有限公司', 'location': '台北市信義區', 'experience': '3年以上',
+             'education': '大學', 'salary': '月薪50,000~70,000元'},
+            {'title': '產品企劃師', 'url': 'https://www.104.com.tw/job/7zq1d?jobsource=jolist_a_relevance',
+             'company': '示範網路股份有限公司', 'location': '新北市板橋區', 'experience': '1年以上',
+             'education': '專科', 'salary': '月薪40,000元以上'},
+            {'title': '專案管理師 (PMP 佳)', 'url': 'https://www.104.com.tw/job/6yp0e?jobsource=jolist_a_relevance',
+             'company': '樣本資訊有限公司', 'location': '台北市中山區', 'experience': '經歷不拘',
+             'education': '學歷不拘', 'salary': '待遇面議'},
+        ],
+    },
+    'search_api_jobs_page2.json': {
+        'pagination': (2, 2),
+        'records': [
+            {'title': '資深產品經理', 'url': 'https://www.104.com.tw/job/5xo9f?jobsource=jolist_a_relevance',
+             'company': '範例數位股份有限公司', 'location': '台北市中正區', 'experience': '5年以上',
+             'education': '碩士', 'salary': '年薪1,200,000~1,600,000元'},
+        ],
+    },
+    'search_list_legacy.json': {
+        'pagination': (1, 1),
+        'records': [
+            {'title': '專案助理', 'url': 'https://www.104.com.tw/job/4wn8g?jobsource=jolist_b_relevance',
+             'company': '示範工業股份有限公司', 'location': '桃園市桃園區', 'experience': '經歷不拘',
+             'education': '大學', 'salary': '月薪32,000~36,000元'},
+        ],
+    },
+}
+
+
+def load(name: str) -> dict:
+    return json.loads((FIXTURES / name).read_text(encoding='utf-8'))
+
+
+def test_every_fixture_has_expectations():
+    assert sorted(p.name for p in FIXTURES.glob('search_*.json')) == sorted(EXPECTED)
+
+
+@pytest.mark.parametrize('name', sorted(EXPECTED))
+def test_parse_payload(name):
+    records = SearchCapture().parse_payload(load(name))
+    assert all(list(record) == CSV_FIELDNAMES for record in records)
+    # 詳細欄位由策略補上，列表解析時留空
+    expected = [{field: want.get(field, '') for field in CSV_FIELDNAMES} for want in EXPECTED[name]['records']]
+    assert records == expected
+
+
+@pytest.mark.parametrize('name', sorted(EXPECTED))
+def test_pagination(name):
+    assert SearchCapture().pagination(load(name)) == EXPECTED[name]['pagination']
+
+
+def test_parse_payload_rejects_unknown_shape():
+    with pytest.raises(ValueError):
+        SearchCapture().parse_payload({'data': {'items': []}})
+
+
+def test_is_last_page_and_clear():
+    capture = SearchCapture()
+    capture.page_info = capture.pagination(load('search_api_jobs_page1.json'))
+    assert not capture.is_last_page()
+    capture.page_info = capture.pagination(load('search_api_jobs_page2.json'))
+    assert capture.is_last_page()
+    capture.clear()
+    assert capture.page_info == (0, 0) and not capture.is_last_page()
@@ -0,0 +1,57 @@
+"""core.search_url: 篩選條件 → 104 搜尋網址"""
+
+from urllib.parse import parse_qsl, urlsplit
+
+from config import SEARCH_URL
+from core.job_searcher import JobSearcher
+from core.search_url import search_url_builder
+
+
+def query_of(url: str) -> dict[str, str]:
+    return dict(parse_qsl(urlsplit(url).query))
+
+
+def test_default_filters_compile_to_url():
+    url = JobSearcher.compile_search_url('pm')
+    assert url.startswith(SEARCH_URL + '?')
+    assert query_of(url) == {
+        'keyword': 'pm',
+        'area': '6001001000,6001002000',
+        'jobexp': '1,3',
+        'ro': '1',
+        'remoteWork': '1,2',
+        'isnew': '30',
+        'scmin': '40000',
+        'sctp': 'M',
+    }
+
+
+def test_config_overrides_and_page():
+    config = {
+        'area_indices': [5],
+        'experience': [],
+        'remote_work': [],
+        'salary_min': 0,
+        'job_type': 'all',
+        'job_categories': [{'main': '資訊軟體系統類', 'sub': '軟體／工程類人員', 'titles': ['軟體工程師'], 'codes': ['2007001004']}],
+    }
+    url = JobSearcher.compile_search_url('後端 工程師', config, page=3)
+    assert query_of(url) == {'keyword': '後端 工程師', 'area': '6001005000', 'jobcat': '2007001004', 'isnew': '30', 'page': '3'}
+
+
+def test_unsupported_filters_fall_back_to_ui():
+    assert JobSearcher.compile_search_url('pm', {'benefits': ['年終獎金']}) is None
+    assert JobSearcher.compile_search_url('pm', {'job_categories': [{'main': 'a', 'sub': 'b', 'titles': ['c']}]}) is None
+    assert JobSearcher.compile_search_url('pm', {'area_indices': [99]}) is None
+    assert JobSearcher.compile_search_url('pm', {'filter_mode': 'ui'}) is None
+
+
+def test_page_and_keyword_rewrites():
+    url = JobSearcher.compile_search_url('pm')
+    page2 = search_url_builder.with_page(url, 2)
+    assert search_url_builder.page_of(url) == 1
+    assert search_url_builder.page_of(page2) == 2
+    assert search_url_builder.page_of(search_url_builder.with_page(page2, 1)) == 1
+
+    renamed = search_url_builder.with_keyword(page2, 'qa')
+    assert query_of(renamed) == {**query_of(url), 'keyword': 'qa'}
@@ -0,0 +1,95 @@
+"""utils.seen_jobs: 增量爬取的已看過職缺索引"""
+
+import json
+import threading
+
+import pytest
+
+from utils import seen_jobs
+from utils.seen_jobs import (
+    clear_seen_index, job_content_hash, load_seen_index, mark_seen, save_seen_index, seen_status,
+)
+
+JOB = {'title': 'PM', 'company': 'A 公司', 'location': '台北市', 'salary': '月薪 50,000'}
+
+
+@pytest.fixture(autouse=True)
+def seen_file(tmp_path, monkeypatch):
+    path = tmp_path / 'seen_jobs.json'
+    monkeypatch.setattr(seen_jobs, 'SEEN_JOBS_FILE', str(path))
+    return path
+
+
+def test_content_hash_ignores_detail_fields():
+    assert job_content_hash(JOB) == job_content_hash({**JOB, 'description': '...'})
+    assert job_content_hash(JOB) != job_content_hash({**JOB, 'salary': '月薪 60,000'})
+
+
+def test_seen_status_does_not_modify_index():
+    index = {}
+    assert seen_status(index, '1', 'h') == 'new'
+    assert index == {}
+
+
+def test_mark_seen_transitions():
+    index = {}
+    assert mark_seen(index, '1', 'h1') == 'new'
+    first_seen = index['1']['first_seen']
+    assert seen_status(index, '1', 'h1') == 'known'
+    assert seen_status(index, '1', 'h2') == 'changed'
+
+    assert mark_seen(index, '1', 'h1') == 'known'
+    assert mark_seen(index, '1', 'h2') == 'changed'
+    assert index['1']['hash'] == 'h2'
+    assert index['1']['first_seen'] == first_seen
+    assert index['1']['last_seen'] >= first_seen
+
+
+def test_save_merges_with_file(seen_file):
+    # 另一個分片 process 已寫入的內容
+    seen_file.write_text(json.dumps({
+        '1': {'first_seen': 100.0, 'last_seen': 200.0, 'hash': 'old'},
+        '2': {'first_seen': 100.0, 'last_seen': 900.0, 'hash': 'other'},
+        '3': {'first_seen': 50.0, 'last_seen': 60.0, 'hash': 'kept'},
+    }))
+
+    save_seen_index({
+        '1': {'first_seen': 150.0, 'last_seen': 300.0, 'hash': 'new'},
+        '2': {'first_seen': 10.0, 'last_seen': 500.0, 'hash': 'stale'},
+        '4': {'first_seen': 400.0, 'last_seen': 400.0, 'hash': 'added'},
+    })
+
+    merged = load_seen_index()
+    # 較新的 last_seen 勝出，first_seen 取最早
+    assert merged['1'] == {'first_seen': 100.0, 'last_seen': 300.0, 'hash': 'new'}
+    # 檔案中的較新，保留檔案的
+    assert merged['2'] == {'first_seen': 100.0, 'last_seen': 900.0, 'hash': 'other'}
+    assert merged['3']['hash'] == 'kept'
+    assert merged['4']['hash'] == 'added'
+
+
+def test_clear_returns_count(seen_file):
+    save_seen_index({'1': {'first_seen': 1.0, 'last_seen': 1.0, 'hash': 'h'}})
+    assert clear_seen_index() == 1
+    assert not seen_file.exists()
+    assert load_seen_index() == {}
+    assert clear_seen_index() == 0
+
+
+def test_concurrent_saves_keep_all_entries(monkeypatch):
+    # 第一個 save 載入檔案後、寫入前，另一個 process 也要儲存
+    load = seen_jobs.load_seen_index
+    other = threading.Thread(target=save_seen_index, args=({'2': {'first_seen': 2.0, 'last_seen': 2.0, 'hash': 'b'}},))
+
+    def interleaved_load() -> dict[str, dict]:
+        index = load()
+        if other.ident is None:  # 只在第一個 save 時插入
+            other.start()
+            other.join(timeout=0.5)  # 有檔案鎖時會卡在這裡，直到第一個 save 寫完
+        return index
+
+    monkeypatch.setattr(seen_jobs, 'load_seen_index', interleaved_load)
+    save_seen_index({'1': {'first_seen': 1.0, 'last_seen': 1.0, 'hash': 'a'}})
+    other.join()
+
+    assert set(load()) == {'1', '2'}
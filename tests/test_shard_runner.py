@@ -0,0 +1,65 @@
+"""core.shard_runner.ShardRunner: 切分分片、合併後記錄已看過索引"""
+
+import pytest
+
+from core import ShardRunner
+from utils import seen_jobs
+from utils.seen_jobs import load_seen_index
+
+
+def test_plan_pages_splits_remainder_to_first_shards():
+    shards = ShardRunner(3).plan(['pm', 'qa'], {'pages': 7}, 'pages')
+    assert [shard['label'] for shard in shards] == ['第 1-3 頁', '第 4-5 頁', '第 6-7 頁']
+    assert [shard['pages'] for shard in shards] == [3, 2, 2]
+    assert shards[1]['queries'] == [{'keyword': 'pm', 'start_page': 4}, {'keyword': 'qa', 'start_page': 4}]
+
+
+def test_plan_pages_no_more_shards_than_pages():
+    shards = ShardRunner(4).plan(['pm'], {'pages': 2}, 'pages')
+    assert [(shard['label'], shard['pages']) for shard in shards] == [('第 1-1 頁', 1), ('第 2-2 頁', 1)]
+
+
+@pytest.mark.parametrize('pages', [0, 1])
+def test_plan_pages_falls_back_to_keyword(pages):
+    shards = ShardRunner(3).plan(['pm', 'qa'], {'pages': pages}, 'pages')
+    assert [shard['queries'] for shard in shards] == [['pm'], ['qa']]
+    assert all(shard['pages'] == pages for shard in shards)
+
+
+def test_plan_keyword():
+    shards = ShardRunner(2).plan(['pm', 'qa', 'rd'], {'pages': 3}, 'keyword')
+    assert [(shard['shard_id'], shard['label'], shard['queries']) for shard in shards] == [
+        (1, 'pm', ['pm']), (2, 'qa', ['qa']), (3, 'rd', ['rd']),
+    ]
+
+
+def test_plan_area_fans_out_keywords():
+    shards = ShardRunner(2).plan(['pm', 'qa'], {'pages': 2, 'area_indices': [1, 5]}, 'area')
+    assert [shard['label'] for shard in shards] == ['台北市', '桃園市']
+    assert shards[1]['queries'] == [{'keyword': 'pm', 'area_indices': [5]}, {'keyword': 'qa', 'area_indices': [5]}]
+    assert all(shard['pages'] == 2 for shard in shards)
+
+
+def test_plan_area_uses_default_filters():
+    shards = ShardRunner(2).plan(['pm'], {'pages': 1}, 'area')
+    assert [shard['label'] for shard in shards] == ['台北市', '新北市']
+
+
+@pytest.fixture
+def seen_file(tmp_path, monkeypatch):
+    path = tmp_path / 'seen_jobs.json'
+    monkeypatch.setattr(seen_jobs, 'SEEN_JOBS_FILE', str(path))
+    return path
+
+
+def test_record_seen_only_saved_jobs(seen_file):
+    jobs = [{'url': 'https://www.104.com.tw/job/a1'}, {'url': 'https://www.104.com.tw/job/b2'}]
+    ShardRunner(1)._record_seen(jobs, {'a1': 'h1', 'b2': 'h2', 'c3': 'h3'})
+
+    index = load_seen_index()
+    assert {job_id: entry['hash'] for job_id, entry in index.items()} == {'a1': 'h1', 'b2': 'h2'}
+
+
+def test_record_seen_skips_empty(seen_file):
+    ShardRunner(1)._record_seen([{'url': 'https://www.104.com.tw/job/a1'}], {})
+    assert not seen_file.exists()
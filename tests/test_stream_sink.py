@@ -0,0 +1,83 @@
+"""utils.stream_sink: 逐筆寫入、整理成 jobs_N、讀取時去重"""
+
+import os
+
+from strategy import SaveStrategy
+from utils import JobStreamSink, load_jobs, read_stream, recover_streams
+
+
+def make_job(n: int, **fields: object) -> dict:
+    return {'title': f'職缺 {n}', 'url': f'https://www.104.com.tw/job/id{n}', 'job_index': n, **fields}
+
+
+def test_append_and_read_dedupes_by_job_index(tmp_path):
+    sink = JobStreamSink(base_dir=str(tmp_path), fsync_every=1)
+    sink.append(make_job(1))
+    sink.append(make_job(0, card=object()))  # card (Locator) 不寫入
+    sink.append(make_job(1, detailed_address='台北市'))  # 同一職缺後寫入的為準
+    sink.close()
+
+    assert sink.count == 3
+    jobs = read_stream(sink.jsonl_path)
+    assert [job['title'] for job in jobs] == ['職缺 0', '職缺 1']
+    assert jobs[1]['detailed_address'] == '台北市'
+    assert 'job_index' not in jobs[0] and 'card' not in jobs[0]
+
+
+def test_read_skips_partial_last_line(tmp_path):
+    sink = JobStreamSink(base_dir=str(tmp_path))
+    sink.append(make_job(0))
+    sink.close()
+    with open(sink.jsonl_path, 'a', encoding='utf-8') as f:
+        f.write('{"title": "寫到一半')
+
+    assert [job['title'] for job in read_stream(sink.jsonl_path)] == ['職缺 0']
+
+    # 接續寫入時截掉寫到一半的行
+    resumed = JobStreamSink(base_dir=str(tmp_path), resume_path=sink.jsonl_path)
+    resumed.append(make_job(1))
+    resumed.close()
+    assert [job['title'] for job in read_stream(sink.jsonl_path)] == ['職缺 0', '職缺 1']
+
+
+def test_compact_saves_and_removes_stream(tmp_path):
+    base = str(tmp_path)
+    sink = JobStreamSink(base_dir=base)
+    sink.append(make_job(1))
+    sink.append(make_job(0))
+    result = sink.compact()
+
+    assert result['filename'] == 'jobs_1'
+    assert [job['title'] for job in load_jobs('jobs_1', base)] == ['職缺 0', '職缺 1']
+    assert not os.path.exists(sink.jsonl_path)
+    assert not os.path.exists(sink.csv_path)
+
+
+def test_recover_skips_active_streams(tmp_path):
+    base = str(tmp_path)
+    active = JobStreamSink(base_dir=base, prefix='old')
+    # 上次中斷留下的串流檔
+    with open(os.path.join(base, 'stream', 'old_20250101_000000_1.jsonl'), 'w', encoding='utf-8') as f:
+        f.write('{"title": "職缺 0", "job_index": 0}\n')
+    active.append(make_job(0))
+
+    results = recover_streams(prefix='old', base_dir=base)
+    assert [r['filename'] for r in results] == ['old_1']
+    assert os.path.exists(active.jsonl_path)
+    active.close()
+
+
+def test_unfinished_pool_jobs_are_streamed(tmp_path):
+    strategy = SaveStrategy()
+    strategy._sink = JobStreamSink(base_dir=str(tmp_path))
+    jobs = [{'title': '職缺 0'}, {'title': '職缺 1'}]
+    strategy._queued = {0: make_job(0), 1: make_job(1)}
+    strategy._on_pool_result(0, {'detailed_address': '台北市'})  # 職缺 1 的 worker 沒有回報結果
+
+    strategy._stream_unfinished(jobs)
+    strategy._sink.close()
+
+    streamed = read_stream(strategy._sink.jsonl_path)
+    assert [job['title'] for job in streamed] == ['職缺 0', '職缺 1']
+    assert streamed[0]['detailed_address'] == '台北市'
+    assert strategy.pending_job_indices() == [1]